@@ -179,9 +179,10 @@ class WatchModeDiagnostic:
         print(f"📁 Created test directory: {self.test_dir}")
         
         # Update config to use test directory
-        for mapping in self.orchestrator.config.directory_mappings:
+        mappings = self.orchestrator.config.directory_mappings
+        for i, mapping in enumerate(mappings):
             if mapping.enabled:
-                mapping.local_path = self.test_dir
+                mappings[i] = mapping.model_copy(update={"local_path": self.test_dir})
                 break
                 
         # Set up observer
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Doctor CLI for EC2 Dynamic Sync."""
 
+import json
 import os
 import platform
+import socket
 import subprocess
 import sys
 import time
@@ -160,8 +162,6 @@ def check_network_connectivity() -> Dict[str, Any]:
 
     for test_name, config in tests.items():
         try:
-            import socket
-
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(5)
             result = sock.connect_ex((config["host"], config["port"]))
@@ -443,6 +443,40 @@ def get_recommendations(diagnostics: Dict[str, Any]) -> List[str]:
     return recommendations
 
 
+def build_report(progress: Optional[Progress] = None) -> Dict[str, Any]:
+    """Run every diagnostic check and collect the results into one dict.
+
+    Args:
+        progress: Optional progress display to narrate each check on
+
+    Returns:
+        Diagnostics keyed by check name, as rendered by the doctor command
+    """
+    checks = [
+        ("system_info", "Gathering system information...", get_system_info),
+        ("python_deps", "Checking Python dependencies...", check_python_dependencies),
+        ("system_commands", "Checking system commands...", check_system_commands),
+        ("network", "Testing network connectivity...", check_network_connectivity),
+        ("configuration", "Analyzing configuration...", check_configuration),
+        ("performance", "Running performance benchmarks...", performance_benchmark),
+    ]
+
+    diagnostics: Dict[str, Any] = {}
+    task = None
+    for key, description, check in checks:
+        if progress is not None:
+            if task is None:
+                task = progress.add_task(description, total=None)
+            else:
+                progress.update(task, description=description)
+        diagnostics[key] = check()
+
+    if progress is not None and task is not None:
+        progress.remove_task(task)
+
+    return diagnostics
+
+
 @click.command()
 @click.option("--config", type=str, help="Configuration file path")
 @click.option(
@@ -467,28 +501,7 @@ def doctor(config: Optional[str], output: str, save_report: Optional[str]):
             console=progress_console,
         ) as progress:
 
-            # Collect diagnostics
-            diagnostics = {}
-
-            task = progress.add_task("Gathering system information...", total=None)
-            diagnostics["system_info"] = get_system_info()
-
-            progress.update(task, description="Checking Python dependencies...")
-            diagnostics["python_deps"] = check_python_dependencies()
-
-            progress.update(task, description="Checking system commands...")
-            diagnostics["system_commands"] = check_system_commands()
-
-            progress.update(task, description="Testing network connectivity...")
-            diagnostics["network"] = check_network_connectivity()
-
-            progress.update(task, description="Analyzing configuration...")
-            diagnostics["configuration"] = check_configuration()
-
-            progress.update(task, description="Running performance benchmarks...")
-            diagnostics["performance"] = performance_benchmark()
-
-            progress.remove_task(task)
+            diagnostics = build_report(progress)
 
         # Generate output
         if output == "console":
@@ -506,8 +519,6 @@ def doctor(config: Optional[str], output: str, save_report: Optional[str]):
                 )
 
         elif output == "json":
-            import json
-
             console.print(json.dumps(diagnostics, indent=2, default=str))
 
         elif output == "yaml":
@@ -519,8 +530,6 @@ def doctor(config: Optional[str], output: str, save_report: Optional[str]):
         if save_report:
             with open(save_report, "w") as f:
                 if save_report.endswith(".json"):
-                    import json
-
                     json.dump(diagnostics, f, indent=2, default=str)
                 else:
                     import yaml
@@ -11,6 +11,7 @@ from .enhanced_rsync import (
     EnhancedRsyncManager,
     ExcludePatternManager,
     ProgressReporter,
+    ProgressStats,
 )
 from .exceptions import (
     AWSConnectionError,
@@ -25,6 +26,7 @@ from .exceptions import (
 )
 from .models import (
     AWSConfig,
+    BulkMode,
     ConflictResolution,
     DirectoryInfo,
     DirectoryMapping,
@@ -56,6 +58,7 @@ __all__ = [
     "EnhancedRsyncManager",
     "ExcludePatternManager",
     "ProgressReporter",
+    "ProgressStats",
     "ChangeEvent",
     "SyncState",
     # Models and data structures
@@ -71,6 +74,7 @@ __all__ = [
     "ProfileConfig",
     "LoggingConfig",
     # Enums
+    "BulkMode",
     "ConflictResolution",
     "SyncMode",
     "LogLevel",
@@ -10,15 +10,24 @@ This module handles all AWS EC2 operations including:
 """
 
 import logging
+import math
 import time
 from typing import Any, Dict, List, Optional
 
 import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+from botocore.exceptions import ClientError, NoCredentialsError, WaiterError
 
 from .exceptions import AWSConnectionError, InstanceNotFoundError, PermissionError
 from .models import AWSConfig
 
+# boto3 waiters for the states we wait on, polled every WAITER_DELAY seconds
+STATE_WAITERS = {
+    "running": "instance_running",
+    "stopped": "instance_stopped",
+    "terminated": "instance_terminated",
+}
+WAITER_DELAY = 5
+
 
 class AWSManager:
     """Manages AWS EC2 operations for the sync system."""
@@ -34,12 +43,14 @@ class AWSManager:
         """
         self.config = aws_config
         self.logger = logging.getLogger(__name__)
+        self._ec2_resource = None
 
         # Initialize AWS client
         try:
-            session = boto3.Session(profile_name=self.config.profile)
-            self.ec2_client = session.client("ec2", region_name=self.config.region)
-            self.ec2_resource = session.resource("ec2", region_name=self.config.region)
+            self._session = boto3.Session(profile_name=self.config.profile)
+            self.ec2_client = self._session.client(
+                "ec2", region_name=self.config.region
+            )
 
             # Test connection
             self._test_connection()
@@ -66,6 +77,19 @@ class AWSManager:
                 profile=self.config.profile,
             ) from e
 
+    @property
+    def ec2_resource(self) -> Any:
+        """EC2 resource interface, created on first use.
+
+        Nothing on the sync path needs it, and building it loads the
+        resource model on top of the client's service model.
+        """
+        if self._ec2_resource is None:
+            self._ec2_resource = self._session.resource(
+                "ec2", region_name=self.config.region
+            )
+        return self._ec2_resource
+
     def _test_connection(self):
         """Test AWS connection and permissions."""
         try:
@@ -329,6 +353,27 @@ class AWSManager:
             f"Waiting for instance {instance_id} to reach state '{target_state}'..."
         )
 
+        waiter_name = STATE_WAITERS.get(target_state)
+        if waiter_name:
+            # Waiters stop early on states that can never reach the target
+            # (e.g. terminated while waiting for running)
+            try:
+                self.ec2_client.get_waiter(waiter_name).wait(
+                    InstanceIds=[instance_id],
+                    WaiterConfig={
+                        "Delay": WAITER_DELAY,
+                        "MaxAttempts": max(1, math.ceil(timeout / WAITER_DELAY)),
+                    },
+                )
+            except WaiterError as e:
+                self.logger.error(
+                    f"Instance {instance_id} did not reach state "
+                    f"'{target_state}': {e}"
+                )
+                return False
+            self.logger.info(f"Instance {instance_id} reached state '{target_state}'")
+            return True
+
         start_time = time.time()
         while time.time() - start_time < timeout:
             current_state = self.get_instance_state(instance_id)
@@ -105,7 +105,7 @@ class ConfigManager:
             active_profile = raw_config.get("active_profile", "default")
             if active_profile in self.profiles:
                 self.active_profile = active_profile
-                config_data = self.profiles[active_profile].sync_config.dict()
+                config_data = self.profiles[active_profile].sync_config.model_dump()
             else:
                 raise ConfigurationError(
                     f"Active profile '{active_profile}' not found in profiles",
@@ -139,7 +139,8 @@ class ConfigManager:
                     parent_name = profile_data["inherits_from"]
                     if parent_name in self.profiles:
                         # Merge with parent profile
-                        parent_config = self.profiles[parent_name].sync_config.dict()
+                        parent = self.profiles[parent_name]
+                        parent_config = parent.sync_config.model_dump()
                         merged_config = self._merge_configs(
                             parent_config, profile_data.get("sync_config", {})
                         )
@@ -11,26 +11,119 @@ This module extends the basic rsync functionality with features like:
 - Change queuing
 """
 
+import functools
 import logging
 import os
 import re
+import shlex
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
 from .exceptions import SyncError
-from .models import DirectoryMapping, SyncOptions, SyncResult
+from .models import DirectoryMapping, SyncOptions, SyncResult, expand_path
+from .rsync_manager import (
+    DIRECTORY_INFO_TTL,
+    _format_size,
+    _local_rsync_supports_info,
+    _local_tree_info,
+    _spawn_args,
+    _transfer_mode_options,
+)
 from .ssh_manager import SSHManager
 
+# Default exclusions shared by every mapping. A trailing "/" marks a
+# directory-only pattern; rsync receives the same list without the slash.
+_DEFAULT_EXCLUDE_PATTERNS = (
+    "*.tmp",
+    "*.temp",
+    "*~",
+    "*.swp",
+    "*.swo",
+    ".DS_Store",
+    "Thumbs.db",
+    "desktop.ini",
+    ".git/",
+    ".svn/",
+    ".hg/",
+    "__pycache__/",
+    "*.pyc",
+    "*.pyo",
+    "node_modules/",
+    ".vscode/",
+    ".idea/",
+    "*.egg-info/",
+    "dist/",
+    "build/",
+)
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a single path-component glob into a regex fragment."""
+    return "".join(
+        "[^/]*" if ch == "*" else "[^/]" if ch == "?" else re.escape(ch)
+        for ch in pattern
+    )
+
+
+def _compile_default_excludes(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile the default patterns into one regex matching any path component.
+
+    Name patterns match a component anywhere in the path; directory-only
+    patterns only match components that are followed by a separator.
+    """
+    names = [_glob_to_regex(p) for p in patterns if not p.endswith("/")]
+    dirs = [_glob_to_regex(p.rstrip("/")) for p in patterns if p.endswith("/")]
+    return re.compile(
+        r"(?:^|/)(?:(?:%s)(?:/|$)|(?:%s)/)" % ("|".join(names), "|".join(dirs))
+    )
+
+
+_DEFAULT_EXCLUDE_RE = _compile_default_excludes(_DEFAULT_EXCLUDE_PATTERNS)
+_DEFAULT_RSYNC_EXCLUDES = tuple(
+    arg
+    for pattern in _DEFAULT_EXCLUDE_PATTERNS
+    for arg in ("--exclude", pattern.rstrip("/"))
+)
+
+# rsync --stats summary lines: "Number of regular files transferred: 3"
+# ("Number of files transferred" before rsync 3.1), "Total transferred file
+# size: 1,234 bytes" and "total size is 1,234  speedup is 1.00"
+_RSYNC_STATS_RE = re.compile(
+    r"^(?:Number of (?:regular )?files transferred: (?P<files>[\d,]+)"
+    r"|Total transferred file size: (?P<size>[\d,]+)"
+    r"|total size is [\d,]+\s+speedup is (?P<speedup>[\d.,]+))"
+)
+
+
+def _parse_rsync_stats(lines: List[str]) -> Dict[str, Any]:
+    """Pull SyncStats fields out of rsync's --stats summary."""
+    stats: Dict[str, Any] = {}
+    for line in lines:
+        match = _RSYNC_STATS_RE.match(line)
+        if not match:
+            continue
+        if match["files"]:
+            stats["files_transferred"] = int(match["files"].replace(",", ""))
+        elif match["size"]:
+            stats["total_size"] = int(match["size"].replace(",", ""))
+        elif match["speedup"]:
+            stats["speedup"] = float(match["speedup"].replace(",", ""))
+    return stats
+
 
 class ExcludePatternManager:
     """Manages exclude/include patterns similar to .gitignore."""
 
+    __slots__ = ("base_path", "patterns", "_compiled")
+
     def __init__(self, base_path: str):
         self.base_path = Path(base_path)
         self.patterns: List[Tuple[str, bool]] = []  # (pattern, is_include)
+        self._compiled: List["re.Pattern[str]"] = []  # parallel to patterns
         self.load_patterns()
 
     def load_patterns(self):
@@ -56,89 +149,44 @@ class ExcludePatternManager:
                         if is_include:
                             line = line[1:]
                         self.patterns.append((line, is_include))
+                        self._compiled.append(self._compile_pattern(line))
         except IOError:
             pass
 
     def should_exclude(self, path: str) -> bool:
         """Check if a path should be excluded."""
-        path_obj = Path(path)
-
-        # Default exclusions
-        default_excludes = [
-            "*.tmp",
-            "*.temp",
-            "*~",
-            "*.swp",
-            "*.swo",
-            ".DS_Store",
-            "Thumbs.db",
-            "desktop.ini",
-            ".git/",
-            ".svn/",
-            ".hg/",
-            "__pycache__/",
-            "*.pyc",
-            "*.pyo",
-            "node_modules/",
-            ".vscode/",
-            ".idea/",
-            "*.egg-info/",
-            "dist/",
-            "build/",
-        ]
+        if os.sep != "/":
+            path = path.replace(os.sep, "/")
 
         # Check default exclusions first
-        for pattern in default_excludes:
-            if self._match_pattern(str(path_obj), pattern):
-                return True
+        if _DEFAULT_EXCLUDE_RE.search(path):
+            return True
 
         # Check custom patterns
         excluded = False
-        for pattern, is_include in self.patterns:
-            if self._match_pattern(str(path_obj), pattern):
+        for (pattern, is_include), regex in zip(self.patterns, self._compiled):
+            if regex.match(path):
                 excluded = not is_include
 
         return excluded
 
     def _match_pattern(self, path: str, pattern: str) -> bool:
         """Check if a path matches a pattern."""
-        # Convert glob pattern to regex
+        return bool(self._compile_pattern(pattern).match(path))
+
+    @staticmethod
+    def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+        """Convert a glob pattern to a compiled regex."""
         regex_pattern = pattern.replace("*", ".*").replace("?", ".")
         if pattern.endswith("/"):
             regex_pattern += ".*"
 
-        return bool(re.match(regex_pattern, path))
+        return re.compile(regex_pattern)
 
     def get_rsync_excludes(self) -> List[str]:
         """Get exclude patterns formatted for rsync."""
-        excludes = []
-
         # Add default excludes
-        default_excludes = [
-            "*.tmp",
-            "*.temp",
-            "*~",
-            "*.swp",
-            "*.swo",
-            ".DS_Store",
-            "Thumbs.db",
-            "desktop.ini",
-            ".git",
-            ".svn",
-            ".hg",
-            "__pycache__",
-            "*.pyc",
-            "*.pyo",
-            "node_modules",
-            ".vscode",
-            ".idea",
-            "*.egg-info",
-            "dist",
-            "build",
-        ]
-
-        for pattern in default_excludes:
-            excludes.extend(["--exclude", pattern])
+        excludes = list(_DEFAULT_RSYNC_EXCLUDES)
 
         # Add custom excludes
         for pattern, is_include in self.patterns:
@@ -150,12 +198,55 @@ class ExcludePatternManager:
         return excludes
 
 
+class ProgressStats(NamedTuple):
+    """Immutable snapshot of sync progress returned by ProgressReporter."""
+
+    bytes_transferred: int
+    total_bytes: int
+    percentage: float
+    rate_bps: float
+    rate_mbps: float
+    eta_seconds: float
+    current_file: str
+    files_transferred: int
+    total_files: int
+    elapsed_seconds: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the snapshot as a plain dict for callbacks and JSON."""
+        return self._asdict()
+
+
+def _report_progress(
+    progress_callback: Callable[[Dict[str, Any]], None],
+    stats: ProgressStats,
+    **extra: str,
+) -> None:
+    """Hand a progress snapshot to a public callback as a plain dict."""
+    payload = stats.to_dict()
+    payload.update(extra)
+    progress_callback(payload)
+
+
 class ProgressReporter:
     """Reports sync progress with bandwidth and ETA calculations."""
 
+    __slots__ = (
+        "start_time",
+        "bytes_transferred",
+        "total_bytes",
+        "current_file",
+        "files_transferred",
+        "total_files",
+        "completed_bytes",
+        "lock",
+    )
+
     def __init__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.bytes_transferred = 0
+        # Bytes of finished files, for rsync's per-file --progress counts
+        self.completed_bytes = 0
         self.total_bytes = 0
         self.current_file = ""
         self.files_transferred = 0
@@ -179,10 +270,10 @@ class ProgressReporter:
             if files_transferred is not None:
                 self.files_transferred = files_transferred
 
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self) -> ProgressStats:
         """Get current progress statistics."""
         with self.lock:
-            elapsed = time.time() - self.start_time
+            elapsed = time.perf_counter() - self.start_time
 
             # Calculate transfer rate
             if elapsed > 0:
@@ -204,23 +295,25 @@ class ProgressReporter:
             else:
                 percentage = 0
 
-            return {
-                "bytes_transferred": self.bytes_transferred,
-                "total_bytes": self.total_bytes,
-                "percentage": percentage,
-                "rate_bps": rate_bps,  # CLI expects rate_bps
-                "rate_mbps": rate_mbps,  # Keep for compatibility
-                "eta_seconds": eta_seconds,
-                "current_file": self.current_file,
-                "files_transferred": self.files_transferred,
-                "total_files": self.total_files,
-                "elapsed_seconds": elapsed,
-            }
+            return ProgressStats(
+                bytes_transferred=self.bytes_transferred,
+                total_bytes=self.total_bytes,
+                percentage=percentage,
+                rate_bps=rate_bps,  # CLI expects rate_bps
+                rate_mbps=rate_mbps,  # Keep for compatibility
+                eta_seconds=eta_seconds,
+                current_file=self.current_file,
+                files_transferred=self.files_transferred,
+                total_files=self.total_files,
+                elapsed_seconds=elapsed,
+            )
 
 
 class FileLockManager:
     """Manages file locks to prevent sync during active operations."""
 
+    __slots__ = ("locked_files", "lock")
+
     def __init__(self):
         self.locked_files: Set[str] = set()
         self.lock = threading.Lock()
@@ -252,6 +345,17 @@ class FileLockManager:
 class EnhancedRsyncManager:
     """Enhanced rsync manager with advanced features."""
 
+    __slots__ = (
+        "config",
+        "ssh_manager",
+        "logger",
+        "file_lock_manager",
+        "exclude_managers",
+        "base_rsync_options",
+        "_cumulative_progress",
+        "_info_cache",
+    )
+
     def __init__(self, config, ssh_manager: SSHManager):
         self.config = config
         self.ssh_manager = ssh_manager
@@ -262,9 +366,19 @@ class EnhancedRsyncManager:
         # Initialize exclude managers for each mapping
         for mapping in config.directory_mappings:
             if mapping.enabled:
-                local_path = os.path.expanduser(mapping.local_path)
+                local_path = expand_path(mapping.local_path)
                 self.exclude_managers[mapping.name] = ExcludePatternManager(local_path)
 
+        # rsync 3.1+ reports progress for the whole transfer; older
+        # versions (macOS's 2.6.9) only per file, via --progress
+        self._cumulative_progress = _local_rsync_supports_info()
+
+        # Options that depend only on the (frozen) config are built once
+        self.base_rsync_options: Tuple[str, ...] = tuple(self._build_base_options())
+
+        # Recent get_directory_info results, keyed by (host, mapping name)
+        self._info_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
     def sync_with_progress(
         self,
         host: str,
@@ -276,7 +390,7 @@ class EnhancedRsyncManager:
         """Perform sync with progress reporting."""
 
         # Check for locked files
-        local_path = os.path.expanduser(mapping.local_path)
+        local_path = expand_path(mapping.local_path)
         locked_files = [
             f
             for f in self.file_lock_manager.get_locked_files()
@@ -294,18 +408,26 @@ class EnhancedRsyncManager:
         # Create progress reporter
         progress = ProgressReporter()
 
+        # Progress snapshots travel as ProgressStats internally; the public
+        # callback contract is a plain dict, built only when someone listens.
+        callback = (
+            functools.partial(_report_progress, progress_callback)
+            if progress_callback is not None
+            else None
+        )
+
         try:
             if mode == "bidirectional":
                 return self._sync_bidirectional_enhanced(
-                    host, mapping, dry_run, progress, progress_callback
+                    host, mapping, dry_run, progress, callback
                 )
             elif mode == "local_to_remote":
                 return self._sync_local_to_remote_enhanced(
-                    host, mapping, dry_run, progress, progress_callback
+                    host, mapping, dry_run, progress, callback
                 )
             elif mode == "remote_to_local":
                 return self._sync_remote_to_local_enhanced(
-                    host, mapping, dry_run, progress, progress_callback
+                    host, mapping, dry_run, progress, callback
                 )
             else:
                 return SyncResult(
@@ -320,10 +442,8 @@ class EnhancedRsyncManager:
                 success=False, operation=f"sync_{mode}", error_message=str(e)
             )
 
-    def _build_rsync_command(
-        self, mapping: DirectoryMapping, dry_run: bool = False, use_delete: bool = None
-    ) -> List[str]:
-        """Build enhanced rsync command with all options."""
+    def _build_base_options(self) -> List[str]:
+        """Build the rsync options shared by every command."""
         cmd = ["rsync"]
 
         # Basic options
@@ -333,19 +453,17 @@ class EnhancedRsyncManager:
             cmd.append("-v")
         if self.config.sync_options.compress:
             cmd.append("-z")
-        if self.config.sync_options.progress:
-            cmd.append("--progress")
-
-        # Handle delete flag - allow override for bidirectional sync
-        if use_delete is not None:
-            if use_delete:
-                cmd.append("--delete")
-        elif self.config.sync_options.delete:
-            cmd.append("--delete")
+        if self.config.sync_options.progress and self._cumulative_progress:
+            # Machine-readable progress: cumulative byte counts on progress
+            # lines and "<length>\t<name>" for every transferred file
+            cmd.extend(
+                ["--info=progress2", "--no-human-readable", "--out-format=%l\t%n"]
+            )
+        elif self.config.sync_options.progress:
+            cmd.extend(["--progress", "--out-format=%l\t%n"])
 
-        # Dry run
-        if dry_run:
-            cmd.append("--dry-run")
+        # Transfer summary, parsed into the result's SyncStats
+        cmd.append("--stats")
 
         # Bandwidth limiting
         if (
@@ -354,15 +472,13 @@ class EnhancedRsyncManager:
         ):
             cmd.extend(["--bwlimit", str(self.config.sync_options.bandwidth_limit)])
 
+        # Transfer algorithm (whole-file vs. delta, in-place updates)
+        cmd.extend(_transfer_mode_options(self.config.sync_options))
+
         # SSH options - use the SSH manager's proper SSH command
         ssh_cmd = self.ssh_manager.build_rsync_ssh_command()
         cmd.extend(["-e", ssh_cmd])
 
-        # Exclude patterns
-        if mapping.name in self.exclude_managers:
-            excludes = self.exclude_managers[mapping.name].get_rsync_excludes()
-            cmd.extend(excludes)
-
         # Additional safety options
         cmd.extend(
             [
@@ -375,97 +491,95 @@ class EnhancedRsyncManager:
 
         return cmd
 
+    def _build_rsync_command(
+        self, mapping: DirectoryMapping, dry_run: bool = False, use_delete: bool = None
+    ) -> List[str]:
+        """Build enhanced rsync command with all options."""
+        # Handle delete flag - allow override for bidirectional sync
+        if use_delete is None:
+            use_delete = self.config.sync_options.delete
+
+        # Exclude patterns
+        exclude_manager = self.exclude_managers.get(mapping.name)
+        excludes = exclude_manager.get_rsync_excludes() if exclude_manager else ()
+
+        return [
+            *self.base_rsync_options,
+            *(("--delete",) if use_delete else ()),
+            *(("--dry-run",) if dry_run else ()),
+            *excludes,
+        ]
+
     def _parse_rsync_progress(self, line: str, progress: ProgressReporter):
         """Parse rsync output line for progress information."""
 
-        # Parse file transfer progress lines like:
-        # "1081344   2%    1.03MB/s   00:00:39"
-        # "43888890 100% 1019.25KB/s   00:00:42 (xfer#1, to-check=1/2)"
-        if "%" in line and ("kB/s" in line or "MB/s" in line or "B/s" in line):
-            parts = line.split()
-            if len(parts) >= 4:
-                try:
-                    # Extract bytes transferred (first part)
-                    bytes_transferred = int(parts[0])
-
-                    # Extract percentage (second part)
-                    percentage = float(parts[1].replace("%", ""))
-
-                    # Extract transfer rate (third part)
-                    rate_str = parts[2]
-                    rate_bps = 0
-                    if "kB/s" in rate_str:
-                        rate_bps = float(rate_str.replace("kB/s", "")) * 1024
-                    elif "MB/s" in rate_str:
-                        rate_bps = float(rate_str.replace("MB/s", "")) * 1024 * 1024
-                    elif "B/s" in rate_str:
-                        rate_bps = float(rate_str.replace("B/s", ""))
-
-                    # Extract ETA (fourth part) - format: HH:MM:SS
-                    eta_str = parts[3]
-                    eta_seconds = 0
-                    if ":" in eta_str:
-                        time_parts = eta_str.split(":")
-                        if len(time_parts) == 3:  # HH:MM:SS
-                            eta_seconds = int(time_parts[0]) * 3600 + int(time_parts[1]) * 60 + int(time_parts[2])
-                        elif len(time_parts) == 2:  # MM:SS
-                            eta_seconds = int(time_parts[0]) * 60 + int(time_parts[1])
-
-                    # Update progress with actual values from rsync
-                    progress.update(
-                        bytes_transferred=bytes_transferred,
-                        current_file=f"File {progress.files_transferred + 1}"  # Generic file indicator
-                    )
+        # Per-file lines from --out-format: "43888890\tpath/to/file"
+        length, tab, name = line.partition("\t")
+        if tab:
+            if not name.endswith("/"):  # Directories are not counted as files
+                with progress.lock:
+                    progress.current_file = name
+                    progress.files_transferred += 1
+            return
+
+        # Overall progress lines from --info=progress2 like:
+        # "1081344   2%    1.03MB/s    0:00:39"
+        # "43888890  45%    1.02MB/s    0:00:42 (xfr#1, to-chk=1/2)"
+        # --progress prints the same columns, counted per file instead
+        parts = line.split()
+        if len(parts) >= 2 and parts[1].endswith("%") and parts[0][:1].isdigit():
+            try:
+                bytes_transferred = int(parts[0].replace(",", ""))
+                percentage = int(parts[1][:-1])
+            except ValueError as e:
+                self.logger.debug(f"Failed to parse progress line: {line}, error: {e}")
+                return
 
-                    # Update the progress reporter's internal state for rate calculation
-                    with progress.lock:
-                        progress.bytes_transferred = bytes_transferred
-
-                        # Calculate total bytes from percentage, but be smarter about it
-                        if percentage > 0 and percentage <= 100:
-                            # Calculate estimated total from current progress
-                            estimated_total = int(bytes_transferred / (percentage / 100))
-
-                            # Only update total_bytes if:
-                            # 1. We don't have a total yet, OR
-                            # 2. The new estimate is more reliable (higher percentage = more accurate)
-                            # 3. The percentage is reasonable (not > 100%)
-                            if (progress.total_bytes == 0 or
-                                (percentage >= 10 and estimated_total > progress.total_bytes * 0.8)):
-                                progress.total_bytes = estimated_total
-                                self.logger.debug(f"Updated total size estimate: {estimated_total:,} bytes from {percentage}% progress")
-
-                        # Cap percentage at 100% for display purposes
-                        if progress.total_bytes > 0:
-                            actual_percentage = min(100.0, (bytes_transferred / progress.total_bytes) * 100)
-                        else:
-                            actual_percentage = percentage
-
-                except (ValueError, IndexError) as e:
-                    self.logger.debug(f"Failed to parse progress line: {line}, error: {e}")
+            if not self._cumulative_progress:
+                with progress.lock:
+                    progress.bytes_transferred = (
+                        progress.completed_bytes + bytes_transferred
+                    )
+                    # A file's last line carries its transfer number
+                    if "(xfer#" in line or "(xfr#" in line:
+                        progress.completed_bytes += bytes_transferred
+                    if parts[-1].startswith(("to-chk=", "to-check=")):
+                        try:
+                            progress.total_files = int(
+                                parts[-1].rstrip(")").split("/")[1]
+                            )
+                        except (ValueError, IndexError):
+                            pass
+                return
+
+            with progress.lock:
+                progress.bytes_transferred = bytes_transferred
+                # Estimate the total until rsync reports the authoritative size
+                if percentage > 0:
+                    progress.total_bytes = max(
+                        progress.total_bytes, bytes_transferred * 100 // percentage
+                    )
+                if parts[-1].startswith(("to-chk=", "to-check=")):
+                    try:
+                        progress.total_files = int(parts[-1].rstrip(")").split("/")[1])
+                    except (ValueError, IndexError):
+                        pass
 
         # Parse summary lines for total size - this is the most authoritative source
-        elif "total size is" in line:
+        elif line.startswith("total size is"):
             try:
-                # Extract total size from line like "total size is 1,234,567  speedup is 1.23"
-                parts = line.split("total size is")
-                if len(parts) > 1:
-                    size_part = parts[1].split()[0].replace(",", "")
-                    total_size = int(size_part)
-                    with progress.lock:
-                        # Always use the authoritative total size from rsync
-                        progress.total_bytes = total_size
-                        self.logger.debug(f"Set authoritative total size: {total_size:,} bytes from rsync summary")
-            except (ValueError, IndexError) as e:
-                self.logger.debug(f"Failed to parse total size line: {line}, error: {e}")
-
-        # Parse file name lines (lines that don't have % but are file names)
-        elif line and not line.startswith("Transfer starting") and not "sent" in line and not "received" in line:
-            # This might be a filename being transferred
-            if "/" in line or "." in line:  # Likely a file path
+                # Line like "total size is 1234567  speedup is 1.23"
+                total_size = int(parts[3].replace(",", ""))
                 with progress.lock:
-                    progress.current_file = line.strip()
-                    progress.files_transferred += 1
+                    progress.total_bytes = total_size
+                self.logger.debug(
+                    f"Set authoritative total size: {total_size:,} bytes "
+                    "from rsync summary"
+                )
+            except (ValueError, IndexError) as e:
+                self.logger.debug(
+                    f"Failed to parse total size line: {line}, error: {e}"
+                )
 
     def _sync_bidirectional_enhanced(
         self,
@@ -488,15 +602,15 @@ class EnhancedRsyncManager:
         # Create a wrapper callback to indicate sync direction
         def local_to_remote_callback(stats):
             if progress_callback:
-                stats["sync_direction"] = "local_to_remote"
-                stats["sync_phase"] = "Local → Remote"
-                progress_callback(stats)
+                progress_callback(
+                    stats, sync_direction="local_to_remote", sync_phase="Local → Remote"
+                )
 
         def remote_to_local_callback(stats):
             if progress_callback:
-                stats["sync_direction"] = "remote_to_local"
-                stats["sync_phase"] = "Remote → Local"
-                progress_callback(stats)
+                progress_callback(
+                    stats, sync_direction="remote_to_local", sync_phase="Remote → Local"
+                )
 
         local_to_remote = self._sync_local_to_remote_enhanced(
             host, mapping, dry_run, progress, local_to_remote_callback,
@@ -513,16 +627,23 @@ class EnhancedRsyncManager:
         # Combine results - consider success if at least one direction succeeded
         overall_success = local_to_remote.success or remote_to_local.success
 
+        # Both passes' rsync summaries add up to the mapping's stats
+        passes = [r.stats for r in (local_to_remote, remote_to_local) if r.stats]
+        duration = local_to_remote.duration + remote_to_local.duration
+        total_size = sum(s.total_size for s in passes)
         return SyncResult(
             success=overall_success,
             operation="sync_bidirectional",
             stats={
-                "local_to_remote": local_to_remote.stats,
-                "remote_to_local": remote_to_local.stats,
-                "overall_success": overall_success,
-                "local_to_remote_success": local_to_remote.success,
-                "remote_to_local_success": remote_to_local.success,
+                "files_transferred": sum(s.files_transferred for s in passes),
+                "total_size": total_size,
+                "transfer_rate": total_size / duration if duration > 0 else None,
+                "duration": duration,
             },
+            duration=duration,
+            error_message=None
+            if overall_success
+            else local_to_remote.error_message or remote_to_local.error_message,
         )
 
     def _sync_local_to_remote_enhanced(
@@ -537,7 +658,7 @@ class EnhancedRsyncManager:
     ) -> SyncResult:
         """Enhanced local to remote sync."""
 
-        local_path = os.path.expanduser(mapping.local_path)
+        local_path = expand_path(mapping.local_path)
         remote_path = mapping.remote_path
 
         if not local_path.endswith("/"):
@@ -567,7 +688,7 @@ class EnhancedRsyncManager:
     ) -> SyncResult:
         """Enhanced remote to local sync."""
 
-        local_path = os.path.expanduser(mapping.local_path)
+        local_path = expand_path(mapping.local_path)
         remote_path = mapping.remote_path
 
         if not local_path.endswith("/"):
@@ -593,18 +714,20 @@ class EnhancedRsyncManager:
     ) -> SyncResult:
         """Execute rsync command with progress monitoring."""
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        cmd_str = shlex.join(cmd)  # Quoted once; safe to paste into a shell
 
         try:
-            self.logger.info(f"Executing: {' '.join(cmd)}")
+            self.logger.info(f"Executing: {cmd_str}")
 
+            # Absolute executable, so the spawn skips the PATH search
+            args, spawn_kwargs = _spawn_args(cmd)
             process = subprocess.Popen(
-                cmd,
+                args,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                bufsize=1,
-                universal_newlines=True,
+                **spawn_kwargs,
             )
 
             # Monitor progress
@@ -624,8 +747,7 @@ class EnhancedRsyncManager:
 
                     # Call progress callback if provided
                     if progress_callback:
-                        stats = progress.get_stats()
-                        progress_callback(stats)
+                        progress_callback(progress.get_stats())
 
             # Get any remaining output
             stdout, stderr = process.communicate()
@@ -634,29 +756,33 @@ class EnhancedRsyncManager:
             if stderr:
                 error_lines.extend(stderr.strip().split("\n"))
 
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
+            stats = _parse_rsync_stats(output_lines)
+            stats["duration"] = duration
+            if stats.get("total_size") and duration > 0:
+                stats["transfer_rate"] = stats["total_size"] / duration
 
             if process.returncode == 0:
+                if "--dry-run" not in cmd:
+                    # Directory contents changed; cached sizes are stale
+                    self._info_cache.clear()
                 return SyncResult(
                     success=True,
                     operation="rsync_execute",
-                    stats={
-                        "duration": duration,
-                        "output": output_lines,
-                        "command": " ".join(cmd),
-                    },
+                    stats=stats,
+                    duration=duration,
+                    stdout="\n".join(output_lines),
                 )
             else:
                 return SyncResult(
                     success=False,
                     operation="rsync_execute",
                     error_message=f"rsync failed with code {process.returncode}",
-                    stats={
-                        "duration": duration,
-                        "output": output_lines,
-                        "error_output": error_lines,
-                        "command": " ".join(cmd),
-                    },
+                    stats=stats,
+                    duration=duration,
+                    stdout="\n".join(output_lines),
+                    stderr="\n".join(error_lines),
+                    returncode=process.returncode,
                 )
 
         except Exception as e:
@@ -664,7 +790,7 @@ class EnhancedRsyncManager:
                 success=False,
                 operation="rsync_execute",
                 error_message=f"Failed to execute rsync: {e}",
-                stats={"duration": time.time() - start_time},
+                stats={"duration": time.perf_counter() - start_time},
             )
 
     # Compatibility methods for SyncOrchestrator
@@ -713,34 +839,56 @@ class EnhancedRsyncManager:
     def get_directory_info(
         self, host: str, mapping: DirectoryMapping
     ) -> Dict[str, Any]:
-        """Get directory information compatibility method."""
-        local_path = os.path.expanduser(mapping.local_path)
+        """Get directory information compatibility method.
+
+        Results are reused for DIRECTORY_INFO_TTL seconds so dashboards
+        polling get_sync_status do not walk both trees on every refresh;
+        any completed rsync clears them.
+        """
+        cache_key = (host, mapping.name)
+        cached = self._info_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < DIRECTORY_INFO_TTL:
+            return cached[1]
+
+        local_path = expand_path(mapping.local_path)
         remote_path = mapping.remote_path
 
-        # Get local directory info
-        local_info = {}
-        if os.path.exists(local_path):
-            local_info = {
-                "exists": True,
-                "path": local_path,
-                "size": sum(
-                    os.path.getsize(os.path.join(dirpath, filename))
-                    for dirpath, dirnames, filenames in os.walk(local_path)
-                    for filename in filenames
-                ),
-                "file_count": sum(
-                    len(filenames) for _, _, filenames in os.walk(local_path)
-                ),
-            }
-        else:
-            local_info = {"exists": False, "path": local_path}
-
-        # Get remote directory info (simplified)
-        remote_info = {"exists": True, "path": remote_path}  # Assume exists for now
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Remote info (existence, count and size from one SSH call) is
+            # network-bound; fetch it while the local tree is walked
+            remote_future = executor.submit(
+                self.ssh_manager.get_remote_tree_info, host, remote_path
+            )
 
-        return {
+            # Get local directory info
+            local_info = {}
+            if os.path.exists(local_path):
+                # Count and size come from a single scandir walk of the tree
+                file_count, total_bytes = _local_tree_info(local_path)
+                local_info = {
+                    "exists": True,
+                    "path": local_path,
+                    "size": _format_size(total_bytes),
+                    "file_count": file_count,
+                }
+            else:
+                local_info = {"exists": False, "path": local_path}
+
+            tree_info = remote_future.result()
+
+        remote_info = {"exists": False, "path": remote_path}
+        if tree_info is not None:
+            remote_info.update(
+                exists=True,
+                file_count=tree_info["file_count"],
+                size=_format_size(tree_info["total_bytes"]),
+            )
+
+        info = {
             "mapping_name": mapping.name,
             "local": local_info,
             "remote": remote_info,
             "enabled": mapping.enabled,
         }
+        self._info_cache[cache_key] = (time.monotonic(), info)
+        return info
@@ -6,11 +6,39 @@ providing validation, serialization, and type safety.
 """
 
 import os
+import sys
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Configuration is loaded once and only read afterwards
+_CONFIG_MODEL_CONFIG = ConfigDict(
+    frozen=True, extra="ignore", validate_assignment=False
+)
+
+# Result models are read-only once built; validators are built eagerly at import
+_RESULT_MODEL_CONFIG = ConfigDict(frozen=True, defer_build=False)
+
+
+def expand_path(path: str) -> str:
+    """Expand the user home directory in a path."""
+    # Absolute and relative paths without "~" need no expansion at all
+    if not path.startswith("~"):
+        return path
+    return _expand_user(path)
+
+
+@lru_cache(maxsize=256)
+def _expand_user(path: str) -> str:
+    """Memoized os.path.expanduser for "~"-prefixed paths."""
+    return os.path.expanduser(path)
 
 
 class ConflictResolution(str, Enum):
@@ -30,6 +58,14 @@ class SyncMode(str, Enum):
     REMOTE_TO_LOCAL = "remote_to_local"
 
 
+class BulkMode(str, Enum):
+    """How an initial local-to-remote upload of a mapping is transferred."""
+
+    AUTO = "auto"  # tar stream for large trees going to an empty remote
+    TAR = "tar"  # always stream local-to-remote uploads through tar
+    RSYNC = "rsync"  # always use rsync
+
+
 class LogLevel(str, Enum):
     """Logging levels."""
 
@@ -43,6 +79,8 @@ class LogLevel(str, Enum):
 class AWSConfig(BaseModel):
     """AWS configuration settings."""
 
+    model_config = _CONFIG_MODEL_CONFIG
+
     instance_id: Optional[str] = Field(None, description="EC2 instance ID")
     instance_name: Optional[str] = Field(None, description="EC2 instance name tag")
     region: str = Field("us-east-1", description="AWS region")
@@ -53,7 +91,7 @@ class AWSConfig(BaseModel):
     )
 
     @model_validator(mode="after")
-    def validate_instance_identification(self):
+    def validate_instance_identification(self) -> "AWSConfig":
         """Ensure either instance_id or instance_name is provided."""
         if not self.instance_id and not self.instance_name:
             raise ValueError("Either instance_id or instance_name must be provided")
@@ -72,6 +110,8 @@ class AWSConfig(BaseModel):
 class SSHConfig(BaseModel):
     """SSH configuration settings."""
 
+    model_config = _CONFIG_MODEL_CONFIG
+
     user: str = Field("ubuntu", description="SSH username")
     key_file: str = Field(description="Path to SSH private key file")
     port: int = Field(22, description="SSH port")
@@ -81,17 +121,21 @@ class SSHConfig(BaseModel):
     )
     max_retries: int = Field(3, description="Maximum SSH retry attempts")
     retry_delay: int = Field(10, description="Delay between SSH retries")
+    connection_multiplexing: bool = Field(
+        True, description="Reuse one SSH connection per host (ControlMaster)"
+    )
 
     @field_validator("key_file")
     @classmethod
     def validate_key_file(cls, v):
         """Validate SSH key file exists and has correct permissions."""
-        expanded_path = os.path.expanduser(v)
-        if not os.path.exists(expanded_path):
+        expanded_path = expand_path(v)
+        try:
+            stat_info = os.stat(expanded_path)
+        except OSError:
             raise ValueError(f"SSH key file not found: {expanded_path}")
 
         # Check permissions (should be 600)
-        stat_info = os.stat(expanded_path)
         permissions = oct(stat_info.st_mode)[-3:]
         if permissions != "600":
             raise ValueError(
@@ -113,6 +157,8 @@ class SSHConfig(BaseModel):
 class DirectoryMapping(BaseModel):
     """Configuration for a single directory sync mapping."""
 
+    model_config = _CONFIG_MODEL_CONFIG
+
     name: str = Field(description="Descriptive name for this mapping")
     local_path: str = Field(description="Local directory path")
     remote_path: str = Field(description="Remote directory path")
@@ -120,23 +166,33 @@ class DirectoryMapping(BaseModel):
     exclude_patterns: List[str] = Field(
         default_factory=list, description="Patterns to exclude"
     )
+    bulk_mode: BulkMode = Field(
+        BulkMode.RSYNC,
+        description="Initial upload method: rsync (never tar), auto or tar (always)",
+    )
 
     @field_validator("local_path")
     @classmethod
     def validate_local_path(cls, v):
-        """Validate local path exists or can be created."""
-        expanded_path = os.path.expanduser(v)
-        parent_dir = os.path.dirname(expanded_path)
+        """Expand the user home directory in the local path."""
+        return expand_path(v)
 
-        if not os.path.exists(parent_dir):
-            raise ValueError(f"Parent directory does not exist: {parent_dir}")
+    @model_validator(mode="after")
+    def validate_local_parent(self):
+        """Validate local path can be created, only for enabled mappings."""
+        if self.enabled:
+            parent_dir = os.path.dirname(self.local_path)
+            if not os.path.exists(parent_dir):
+                raise ValueError(f"Parent directory does not exist: {parent_dir}")
 
-        return expanded_path
+        return self
 
 
 class SyncOptions(BaseModel):
     """Rsync operation options."""
 
+    model_config = _CONFIG_MODEL_CONFIG
+
     archive: bool = Field(True, description="Use archive mode (-a)")
     verbose: bool = Field(True, description="Verbose output (-v)")
     compress: bool = Field(True, description="Compress during transfer (-z)")
@@ -148,6 +204,23 @@ class SyncOptions(BaseModel):
     bandwidth_limit: Optional[str] = Field(
         None, description="Bandwidth limit (--bwlimit)"
     )
+    whole_file: Optional[bool] = Field(
+        None,
+        description="Send whole files (--whole-file) or deltas (--no-whole-file); "
+        "unset uses deltas when bandwidth_limit is set, rsync's default otherwise",
+    )
+    inplace: bool = Field(False, description="Update files in place (--inplace)")
+    append_verify: bool = Field(
+        False, description="Append to growing files and verify (--append-verify)"
+    )
+    checksum: bool = Field(
+        False, description="Compare files by checksum, not size/mtime (--checksum)"
+    )
+    checksum_choice: Optional[str] = Field(
+        None,
+        description="Checksum algorithm, e.g. xxh3 (--checksum-choice); "
+        "unset lets rsync negotiate the fastest one both sides support",
+    )
     exclude_patterns: List[str] = Field(
         default_factory=lambda: [
             "*.log",
@@ -180,6 +253,8 @@ class SyncOptions(BaseModel):
 class SyncConfig(BaseModel):
     """Main synchronization configuration."""
 
+    model_config = _CONFIG_MODEL_CONFIG
+
     project_name: str = Field(description="Project name for identification")
     project_description: Optional[str] = Field(None, description="Project description")
 
@@ -197,6 +272,16 @@ class SyncConfig(BaseModel):
     conflict_resolution: ConflictResolution = Field(
         ConflictResolution.NEWER, description="Conflict resolution strategy"
     )
+    parallel_bidirectional: bool = Field(
+        False, description="Run both --update passes of a bidirectional sync at once"
+    )
+    max_parallel_syncs: int = Field(
+        1,
+        ge=1,
+        description="Maximum directory mappings synced at once. The default "
+        "syncs them one after another; values above sshd's default "
+        "MaxSessions (10) are capped at 10.",
+    )
 
     # Automation settings
     max_retries: int = Field(3, description="Maximum retry attempts")
@@ -215,6 +300,8 @@ class SyncConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Logging configuration."""
 
+    model_config = _CONFIG_MODEL_CONFIG
+
     log_file: Optional[str] = Field(None, description="Log file path")
     console_level: LogLevel = Field(LogLevel.INFO, description="Console log level")
     file_level: LogLevel = Field(LogLevel.DEBUG, description="File log level")
@@ -230,6 +317,8 @@ class LoggingConfig(BaseModel):
 class SyncStats(BaseModel):
     """Statistics from a sync operation."""
 
+    model_config = _RESULT_MODEL_CONFIG
+
     files_transferred: int = Field(0, description="Number of files transferred")
     files_skipped: int = Field(0, description="Number of files skipped")
     total_size: int = Field(0, description="Total bytes transferred")
@@ -240,9 +329,34 @@ class SyncStats(BaseModel):
     duration: float = Field(0.0, description="Operation duration in seconds")
 
 
+@dataclass(**_DATACLASS_SLOTS)
+class SyncStatsDC:
+    """Lightweight SyncStats used on internal rsync paths."""
+
+    files_transferred: int = 0
+    files_skipped: int = 0
+    total_size: int = 0
+    transfer_rate: Optional[float] = None
+    speedup: float = 0.0
+    duration: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict without a recursive asdict() walk."""
+        return {
+            "files_transferred": self.files_transferred,
+            "files_skipped": self.files_skipped,
+            "total_size": self.total_size,
+            "transfer_rate": self.transfer_rate,
+            "speedup": self.speedup,
+            "duration": self.duration,
+        }
+
+
 class SyncResult(BaseModel):
     """Result of a sync operation."""
 
+    model_config = _RESULT_MODEL_CONFIG
+
     success: bool = Field(description="Whether the operation succeeded")
     operation: str = Field(description="Type of operation performed")
     sync_direction: Optional[SyncMode] = Field(None, description="Direction of sync")
@@ -260,9 +374,49 @@ class SyncResult(BaseModel):
     returncode: Optional[int] = Field(None, description="Command return code")
 
 
+@dataclass(**_DATACLASS_SLOTS)
+class SyncResultDC:
+    """Lightweight SyncResult used on internal rsync paths."""
+
+    success: bool
+    operation: str
+    sync_direction: Optional[SyncMode] = None
+    local_path: Optional[str] = None
+    remote_path: Optional[str] = None
+
+    stats: Optional[SyncStatsDC] = None
+    duration: float = 0.0
+
+    error_message: Optional[str] = None
+    error_code: Optional[str] = None
+
+    stdout: Optional[str] = None
+    stderr: Optional[str] = None
+    returncode: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict without a recursive asdict() walk."""
+        return {
+            "success": self.success,
+            "operation": self.operation,
+            "sync_direction": self.sync_direction,
+            "local_path": self.local_path,
+            "remote_path": self.remote_path,
+            "stats": self.stats.to_dict() if self.stats is not None else None,
+            "duration": self.duration,
+            "error_message": self.error_message,
+            "error_code": self.error_code,
+            "stdout": self.stdout,
+            "stderr": self.stderr,
+            "returncode": self.returncode,
+        }
+
+
 class DirectoryInfo(BaseModel):
     """Information about a directory (local or remote)."""
 
+    model_config = _RESULT_MODEL_CONFIG
+
     path: str = Field(description="Directory path")
     exists: bool = Field(description="Whether directory exists")
     size: Optional[str] = Field(None, description="Human-readable size")
@@ -274,6 +428,8 @@ class DirectoryInfo(BaseModel):
 class SyncStatus(BaseModel):
     """Current sync status information."""
 
+    model_config = _RESULT_MODEL_CONFIG
+
     instance_id: Optional[str] = Field(None, description="EC2 instance ID")
     instance_state: Optional[str] = Field(None, description="EC2 instance state")
     host: Optional[str] = Field(None, description="Current host IP")
@@ -292,6 +448,8 @@ class SyncStatus(BaseModel):
 class ProfileConfig(BaseModel):
     """Configuration profile for different environments."""
 
+    model_config = _CONFIG_MODEL_CONFIG
+
     name: str = Field(description="Profile name")
     description: Optional[str] = Field(None, description="Profile description")
     inherits_from: Optional[str] = Field(
@@ -9,15 +9,460 @@ This module handles all rsync operations including:
 - Error handling and retries
 """
 
+import asyncio
+import fnmatch
 import logging
 import os
 import re
+import selectors
+import shlex
+import shutil
 import subprocess
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .models import (
+    ConflictResolution,
+    SyncConfig,
+    SyncOptions,
+    SyncResultDC,
+    SyncStatsDC,
+    expand_path,
+)
+
+# Summary lines from rsync output, compiled once at import time
+_RE_BYTES = re.compile(
+    rb"sent ([\d,]+) bytes\s+received ([\d,]+) bytes\s+([\d,.]+) bytes/sec"
+)
+_RE_SPEEDUP = re.compile(rb"speedup is ([\d.]+)")
+# --stats line; older rsync versions omit "regular"
+_RE_FILES_TRANSFERRED = re.compile(
+    rb"Number of (?:regular )?files transferred: ([\d,]+)"
+)
+
+# First rsync release with --info=progress2; macOS still
+# ships 2.6.9 (or openrsync), which rejects them
+RSYNC_INFO_MIN_VERSION = (3, 1)
+
+# Lines of rsync output retained per run for the result
+_OUTPUT_TAIL_LINES = 200
+# Scratch directory, relative to each destination, for the temp files of
+# concurrent bidirectional passes; both passes exclude it
+BIDIRECTIONAL_TEMP_DIR = ".ec2-sync-tmp"
+# Seconds a get_directory_info result is reused before walking again
+DIRECTORY_INFO_TTL = 10.0
+# Threads used to walk local directory trees
+_TREE_WALK_WORKERS = 16
+# Files stat'ed per task when sizing one large directory
+_STAT_BATCH_SIZE = 512
+# Hosts that may name this machine. A localhost target can just as well be
+# a tunnel or a forwarded port to the instance, so these are only copied
+# in-process when the "local_mirror" sync option is switched on.
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+# rsync options whose semantics the in-process mirror does not implement
+_MIRROR_UNSUPPORTED_OPTIONS = frozenset(
+    {"--delete", "--checksum", "-c", "--update", "-u", "--dry-run", "--backup"}
+)
+# Minimum seconds between logged rsync progress lines
+_PROGRESS_LOG_INTERVAL = 0.5
+# Bytes requested per read from the rsync output pipes
+_PIPE_READ_SIZE = 65536
+
+
+@lru_cache(maxsize=8)
+def _resolve_executable(name: str) -> str:
+    """Absolute path of an executable on PATH, or name if not found."""
+    return shutil.which(name) or name
+
+
+def _spawn_args(cmd: List[str]) -> Tuple[List[str], Dict[str, Any]]:
+    """Arguments and Popen keywords for starting rsync or ssh.
+
+    The executable is resolved to an absolute path once, so each spawn
+    skips the PATH search. close_fds stays on: rsync and ssh children can
+    outlive a sync by minutes, and descriptors inherited by this process
+    or opened by an embedding application must not leak into them. (That
+    rules out posix_spawn, but CPython 3.10+ already uses vfork on Linux
+    with close_fds=True.)
+    """
+    return [_resolve_executable(cmd[0]), *cmd[1:]], {"close_fds": True}
+
+
+def _popen_rsync(cmd: List[str]) -> subprocess.Popen:
+    """Start rsync with both output pipes."""
+    args, kwargs = _spawn_args(cmd)
+    return subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs
+    )
+
+
+def _iter_process_lines(process: subprocess.Popen) -> Iterator[Tuple[bool, bytes]]:
+    """Yield (is_stderr, line) pairs from a process as its pipes become readable.
+
+    Both pipes are waited on together so neither can fill up and stall rsync
+    while the other is being read. Carriage returns (progress updates) are
+    treated as line breaks. Lines are yielded as raw bytes; callers decode
+    only the ones they keep.
+    """
+    if os.name == "nt":
+        # selectors cannot wait on pipes on Windows; drain stderr in a thread
+        stderr_lines: List[bytes] = []
+        drain = threading.Thread(
+            target=lambda: stderr_lines.extend(process.stderr), daemon=True
+        )
+        drain.start()
+        for raw in process.stdout:
+            yield False, raw.rstrip()
+        drain.join()
+        for raw in stderr_lines:
+            yield True, raw.rstrip()
+        return
+
+    pending = {False: b"", True: b""}
+    with selectors.DefaultSelector() as selector:
+        selector.register(process.stdout, selectors.EVENT_READ, False)
+        selector.register(process.stderr, selectors.EVENT_READ, True)
+        while selector.get_map():
+            for key, _ in selector.select():
+                is_stderr = key.data
+                chunk = os.read(key.fd, _PIPE_READ_SIZE)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                lines, pending[is_stderr] = _split_lines(pending[is_stderr], chunk)
+                for raw in lines:
+                    yield is_stderr, raw
+
+
+def _split_lines(pending: bytes, chunk: bytes) -> Tuple[List[bytes], bytes]:
+    """Split buffered pipe data into complete lines and the unfinished rest.
+
+    An empty chunk marks end of file and flushes the rest as a final line.
+    """
+    lines = (pending + (chunk or b"\n")).replace(b"\r", b"\n").split(b"\n")
+    pending = lines.pop()
+    return [line.rstrip() for line in lines if line], pending
+
+
+def _decode_line(raw: bytes) -> str:
+    """Decode one line of rsync output."""
+    return raw.decode("utf-8", errors="replace")
+
+
+def _stat_sizes(entries: List[os.DirEntry]) -> Tuple[int, int, List[str], list]:
+    """Sum the sizes of a batch of file entries."""
+    total_bytes = 0
+    for entry in entries:
+        try:
+            total_bytes += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            # Vanished between listing and stat
+            pass
+    return 0, total_bytes, [], []
+
+
+def _scan_directory(path: str) -> Tuple[int, int, List[str], list]:
+    """List path and size its files.
+
+    Returns the file count, the bytes of the first _STAT_BATCH_SIZE files,
+    the subdirectories, and the remaining files in batches still to be
+    stat'ed, so one huge directory does not serialize on a single thread.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    files.append(entry)
+    except OSError:
+        # Unreadable subdirectories are skipped, like find/du do
+        pass
+
+    batches = [
+        files[i : i + _STAT_BATCH_SIZE]
+        for i in range(_STAT_BATCH_SIZE, len(files), _STAT_BATCH_SIZE)
+    ]
+    _, total_bytes, _, _ = _stat_sizes(files[:_STAT_BATCH_SIZE])
+    return len(files), total_bytes, subdirs, batches
+
+
+def _local_tree_info(path: str, workers: int = _TREE_WALK_WORKERS) -> Tuple[int, int]:
+    """Count files and total bytes below path.
+
+    Directories and batches of file stats are processed concurrently; stat
+    latency dominates on network and EBS volumes, so keeping many requests
+    in flight scales well beyond a single thread.
+    """
+    file_count = total_bytes = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_scan_directory, path)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                count, size, subdirs, batches = future.result()
+                file_count += count
+                total_bytes += size
+                pending.update(executor.submit(_scan_directory, d) for d in subdirs)
+                pending.update(executor.submit(_stat_sizes, b) for b in batches)
+    return file_count, total_bytes
+
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count the way ``du -h`` does (e.g. 4.0K, 12M)."""
+    size = float(num_bytes)
+    for unit in ("", "K", "M", "G", "T"):
+        if size < 1024 or unit == "T":
+            break
+        size /= 1024
+    if not unit:
+        return str(num_bytes)
+    return f"{size:.1f}{unit}" if size < 10 else f"{size:.0f}{unit}"
+
+
+def _transfer_mode_options(sync_options: Any) -> List[str]:
+    """Rsync flags selecting the transfer algorithm for a SyncOptions or dict."""
+    if isinstance(sync_options, dict):
+        sync_options = sync_options.get("options", sync_options)
+        get = sync_options.get
+    else:
+
+        def get(name: str, default: Any = None) -> Any:
+            return getattr(sync_options, name, default)
+
+    options = []
+    whole_file = get("whole_file")
+    if whole_file is None and get("bandwidth_limit"):
+        whole_file = False
+    if whole_file is not None:
+        options.append("--whole-file" if whole_file else "--no-whole-file")
+    if get("inplace", False):
+        options.append("--inplace")
+    if get("append_verify", False):
+        options.append("--append-verify")
+
+    if get("checksum", False):
+        options.append("--checksum")
+    checksum_choice = get("checksum_choice")
+    if checksum_choice:
+        supported = _local_rsync_checksums()
+        algorithm = checksum_choice.split(",")[0]
+        if supported and algorithm not in supported:
+            logging.getLogger(__name__).warning(
+                f"Local rsync does not support checksum {algorithm!r}; "
+                "letting rsync negotiate instead"
+            )
+        else:
+            options.append(f"--checksum-choice={checksum_choice}")
+    return options
+
+
+@lru_cache(maxsize=1)
+def _local_rsync_checksums() -> FrozenSet[str]:
+    """Checksum algorithms the local rsync supports; empty if unknown."""
+    try:
+        result = subprocess.run(
+            ["rsync", "--version"], capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return frozenset()
+
+    # rsync >= 3.2 prints "Checksum list:" followed by the names on one line
+    lines = result.stdout.splitlines()
+    for index, line in enumerate(lines[:-1]):
+        if line.strip().lower().startswith("checksum list"):
+            return frozenset(re.sub(r"\(.*?\)", " ", lines[index + 1]).split())
+    return frozenset()
+
+
+@lru_cache(maxsize=1)
+def _local_rsync_version() -> Tuple[int, ...]:
+    """Version of the local rsync as a tuple of ints; empty if unknown."""
+    try:
+        result = subprocess.run(
+            ["rsync", "--version"], capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ()
 
-from .models import SyncConfig
+    # "rsync  version 3.2.7  protocol version 31"; openrsync reports the
+    # rsync version it is compatible with ("rsync version 2.6.9 compatible")
+    match = re.search(r"version\s+v?(\d+)\.(\d+)", result.stdout)
+    return tuple(int(part) for part in match.groups()) if match else ()
+
+
+def _local_rsync_supports_info() -> bool:
+    """Whether the local rsync accepts --info=... options (rsync 3.1+)."""
+    return _local_rsync_version() >= RSYNC_INFO_MIN_VERSION
+
+
+def _is_excluded(name: str, is_dir: bool, patterns: Tuple[str, ...]) -> bool:
+    """Match a file name against rsync-style, unanchored exclude patterns."""
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            if is_dir and fnmatch.fnmatchcase(name, pattern[:-1]):
+                return True
+        elif fnmatch.fnmatchcase(name, pattern):
+            return True
+    return False
+
+
+def _copy_file(source: str, destination: str, size: int) -> None:
+    """Copy file contents in the kernel where possible.
+
+    copy_file_range avoids user-space buffers and becomes a reflink on
+    filesystems that support it (XFS, Btrfs); shutil.copyfile (sendfile on
+    Linux) covers everything else.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+                remaining = size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            # Unsupported by the kernel or filesystem pair
+            pass
+    shutil.copyfile(source, destination)
+
+
+def _mirror_tree(
+    source: str, destination: str, excludes: Tuple[str, ...]
+) -> SyncStatsDC:
+    """Copy new and changed files from source to destination.
+
+    Files are compared like rsync's quick check (size and mtime) and
+    written through a temporary name, so readers never see partial files.
+    """
+    stats = SyncStatsDC()
+    stack = [(source, destination)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if _is_excluded(entry.name, is_dir, excludes):
+                    continue
+                target = os.path.join(dst_dir, entry.name)
+                if is_dir:
+                    stack.append((entry.path, target))
+                    continue
+
+                if entry.is_symlink():
+                    link = os.readlink(entry.path)
+                    if os.path.islink(target) and os.readlink(target) == link:
+                        stats.files_skipped += 1
+                        continue
+                    if os.path.lexists(target):
+                        os.unlink(target)
+                    os.symlink(link, target)
+                    stats.files_transferred += 1
+                    continue
+
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+                try:
+                    dst_st = os.stat(target, follow_symlinks=False)
+                    if dst_st.st_size == st.st_size and int(dst_st.st_mtime) == int(
+                        st.st_mtime
+                    ):
+                        stats.files_skipped += 1
+                        continue
+                except FileNotFoundError:
+                    pass
+
+                temp_target = os.path.join(dst_dir, f".{entry.name}.ec2sync-tmp")
+                _copy_file(entry.path, temp_target, st.st_size)
+                os.chmod(temp_target, st.st_mode & 0o7777)
+                os.utime(temp_target, ns=(st.st_atime_ns, st.st_mtime_ns))
+                os.replace(temp_target, target)
+                stats.files_transferred += 1
+                stats.total_size += st.st_size
+    return stats
+
+
+class _RsyncStatsAccumulator:
+    """Collect transfer statistics from rsync stdout one line at a time.
+
+    Totals come from the --stats block and summary lines at the end of
+    the output, so per-file lines cost only a few prefix checks.
+
+    Only a bounded tail of the output is retained, so memory stays constant
+    however many files rsync itemizes.
+    """
+
+    __slots__ = ("stats", "tail", "_logger", "_log_progress", "_next_progress_log")
+
+    def __init__(self, logger: logging.Logger):
+        self.stats = SyncStatsDC()
+        self.tail: deque = deque(maxlen=_OUTPUT_TAIL_LINES)
+        self._logger = logger
+        self._log_progress = logger.isEnabledFor(logging.DEBUG)
+        self._next_progress_log = 0.0
+
+    def feed(self, line: bytes) -> None:
+        """Account for one line of rsync stdout."""
+        self.tail.append(line)
+
+        if line.startswith(b"Number of "):
+            match = _RE_FILES_TRANSFERRED.match(line)
+            if match:
+                self.stats.files_transferred = int(match.group(1).replace(b",", b""))
+        elif line.startswith(b"sent "):
+            # Summary line like:
+            # "sent 1,234 bytes  received 5,678 bytes  2,345.67 bytes/sec"
+            match = _RE_BYTES.search(line)
+            if match:
+                sent, received, rate = match.groups()
+                try:
+                    self.stats.total_size = int(sent.replace(b",", b"")) + int(
+                        received.replace(b",", b"")
+                    )
+                    self.stats.transfer_rate = float(rate.replace(b",", b""))
+                except ValueError:
+                    pass
+        elif line.startswith(b"total size is"):
+            match = _RE_SPEEDUP.search(line)
+            if match:
+                try:
+                    self.stats.speedup = float(match.group(1))
+                except ValueError:
+                    pass
+        elif b"skipping" in line:
+            self.stats.files_skipped += 1
+        elif self._log_progress and (b"to-chk=" in line or b"%" in line):
+            # Log progress information, at most once per interval
+            now = time.monotonic()
+            if now >= self._next_progress_log:
+                self._next_progress_log = now + _PROGRESS_LOG_INTERVAL
+                self._logger.debug(f"Progress: {_decode_line(line)}")
+
+    def tail_lines(self) -> List[str]:
+        """Return the retained output tail; only these lines are decoded."""
+        return [_decode_line(line) for line in self.tail]
 
 
 class RsyncManager:
@@ -26,15 +471,32 @@ class RsyncManager:
     def __init__(self, config: Union[Dict[str, Any], SyncConfig], ssh_manager):
         """Initialize rsync manager with configuration."""
         self.config = config
+        self.sync_config: Union[SyncOptions, Dict[str, Any]]
         if isinstance(config, SyncConfig):
             self.sync_config = config.sync_options
         else:
             self.sync_config = config["sync"]
         self.ssh_manager = ssh_manager
         self.logger = logging.getLogger(__name__)
+        self._exclude_file: Optional[str] = None
+
+        # Built paths, reused across the several calls made per sync
+        self._local_paths: Dict[str, str] = {}
+        self._remote_paths: Dict[Tuple[str, str], str] = {}
+
+        # (host, remote_dir) pairs known to exist on the remote side
+        self._remote_dirs: Set[Tuple[str, str]] = set()
+
+        # Recent get_directory_info results, keyed by (host, sync_dir)
+        self._info_cache: Dict[Tuple[str, Any], Tuple[float, Dict[str, Any]]] = {}
+        self._info_ttl: float = DIRECTORY_INFO_TTL
+        if isinstance(self.sync_config, dict):
+            self._info_ttl = self.sync_config.get("info_ttl", DIRECTORY_INFO_TTL)
+        else:
+            self._info_ttl = DIRECTORY_INFO_TTL
 
-        # Build base rsync command options
-        self.base_rsync_options = self._build_base_options()
+        # Build base rsync command options once; commands are built from it
+        self.base_rsync_options: Tuple[str, ...] = tuple(self._build_base_options())
 
     def _build_base_options(self) -> List[str]:
         """Build base rsync options from configuration."""
@@ -49,8 +511,6 @@ class RsyncManager:
                 options.append("-v")
             if self.sync_config.compress:
                 options.append("-z")
-            if self.sync_config.progress:
-                options.append("--progress")
             if hasattr(self.sync_config, "partial") and self.sync_config.partial:
                 options.append("--partial")
             if hasattr(self.sync_config, "delete") and self.sync_config.delete:
@@ -59,12 +519,10 @@ class RsyncManager:
             # Dictionary config
             if self.sync_config["options"].get("archive", True):
                 options.append("-a")
-            if self.sync_config["options"].get("verbose", True):
+            if self.sync_config["options"].get("verbose", False):
                 options.append("-v")
             if self.sync_config["options"].get("compress", True):
                 options.append("-z")
-            if self.sync_config["options"].get("progress", True):
-                options.append("--progress")
             if self.sync_config["options"].get("partial", True):
                 options.append("--partial")
             if self.sync_config["options"].get("delete", False):
@@ -74,23 +532,49 @@ class RsyncManager:
             if self.sync_config["options"].get("backup", False):
                 options.append("--backup")
 
+        # Transfer algorithm: whole-file copies suit fast links, the delta
+        # algorithm suits bandwidth-bound ones
+        options.extend(_transfer_mode_options(self.sync_config))
+
+        # Totals are read from rsync's own statistics instead of counting
+        # per-file output lines; --stats, unlike --info=stats2, works on
+        # every rsync version
+        options.append("--stats")
+
+        # Configured progress output; the summarized whole-transfer form is
+        # far less output than one line per file where rsync supports it
+        if isinstance(self.sync_config, dict):
+            progress = self.sync_config["options"].get("progress", True)
+        else:
+            progress = getattr(self.sync_config, "progress", True)
+        if progress:
+            options.append(
+                "--info=progress2" if _local_rsync_supports_info() else "--progress"
+            )
+
         # Bandwidth limit
         if hasattr(self.sync_config, "bandwidth_limit"):
             # SyncOptions object
             if self.sync_config.bandwidth_limit:
                 options.extend(["--bwlimit", str(self.sync_config.bandwidth_limit)])
-            # Exclude patterns
-            for pattern in self.sync_config.exclude_patterns:
-                options.extend(["--exclude", pattern])
+            exclude_patterns = self.sync_config.exclude_patterns
         else:
             # Dictionary config
             bw_limit = self.sync_config["options"].get("bandwidth_limit")
             if bw_limit:
                 options.extend(["--bwlimit", str(bw_limit)])
-            # Exclude patterns
             exclude_patterns = self.sync_config["options"].get("exclude_patterns", [])
-            for pattern in exclude_patterns:
-                options.extend(["--exclude", pattern])
+
+        # Kept for local mirrors, which apply them without rsync
+        self._exclude_patterns = tuple(exclude_patterns)
+        self._local_mirror = isinstance(self.sync_config, dict) and bool(
+            self.sync_config["options"].get("local_mirror", False)
+        )
+
+        # Exclude patterns are passed through one file instead of N argv pairs
+        if exclude_patterns:
+            exclude_file = self._write_exclude_file(exclude_patterns)
+            options.extend(["--exclude-from", exclude_file])
 
         # SSH command
         ssh_cmd = self.ssh_manager.build_rsync_ssh_command()
@@ -98,21 +582,78 @@ class RsyncManager:
 
         return options
 
+    def _write_exclude_file(self, patterns: List[str]) -> str:
+        """Write exclude patterns to a temporary file for --exclude-from."""
+        with tempfile.NamedTemporaryFile(
+            "w", delete=False, prefix="ec2-sync-", suffix=".rsync-excl"
+        ) as f:
+            f.write("\n".join(patterns) + "\n")
+        self._exclude_file = f.name
+        return f.name
+
+    def close(self) -> None:
+        """Remove the temporary exclude file."""
+        exclude_file = getattr(self, "_exclude_file", None)
+        if exclude_file:
+            try:
+                os.unlink(exclude_file)
+            except OSError:
+                pass
+            self._exclude_file = None
+
+    def __enter__(self) -> "RsyncManager":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def _build_command(
+        self,
+        source: str,
+        destination: str,
+        dry_run: bool,
+        update: bool = False,
+        extra_options: Tuple[str, ...] = (),
+    ) -> List[str]:
+        """Build a complete rsync command in a single allocation."""
+        return [
+            *self.base_rsync_options,
+            *(("--update",) if update else ()),
+            *(("--dry-run",) if dry_run else ()),
+            *extra_options,
+            source,
+            destination,
+        ]
+
     def _expand_path(self, path: str) -> str:
         """Expand user home directory in path."""
-        return os.path.expanduser(path)
+        return expand_path(path)
 
     def _build_local_path(self, sync_dir: str) -> str:
         """Build full local path for sync directory."""
-        base_dir = self._expand_path(self.sync_config["local"]["base_dir"])
-        return os.path.join(base_dir, sync_dir)
+        path = self._local_paths.get(sync_dir)
+        if path is None:
+            base_dir = self._expand_path(self.sync_config["local"]["base_dir"])
+            path = self._local_paths[sync_dir] = os.path.join(base_dir, sync_dir)
+        return path
 
     def _build_remote_path(self, host: str, sync_dir: str) -> str:
         """Build full remote path for sync directory."""
-        user = self.ssh_manager.ssh_config["user"]
-        base_dir = self.sync_config["remote"]["base_dir"]
-        remote_path = f"{base_dir}/{sync_dir}"
-        return f"{user}@{host}:{remote_path}"
+        key = (host, sync_dir)
+        path = self._remote_paths.get(key)
+        if path is None:
+            user = self.ssh_manager.ssh_config["user"]
+            base_dir = self.sync_config["remote"]["base_dir"]
+            remote_path = f"{base_dir}/{sync_dir}"
+            path = self._remote_paths[key] = f"{user}@{host}:{remote_path}"
+        return path
+
+    def prime_ssh(self, host: str) -> bool:
+        """Open the shared SSH master connection used by rsync for host."""
+        return self.ssh_manager.start_control_master(host)
 
     def check_local_directory(self, sync_dir: str) -> bool:
         """Check if local sync directory exists."""
@@ -131,18 +672,36 @@ class RsyncManager:
         return True
 
     def check_remote_directory(self, host: str, sync_dir: str) -> bool:
-        """Check if remote sync directory exists."""
+        """Ensure the remote sync directory exists and rsync is available.
+
+        mkdir -p is idempotent, so one SSH round trip checks, creates and
+        looks for the remote rsync; directories already ensured for a host
+        are not re-checked.
+        """
         base_dir = self.sync_config["remote"]["base_dir"]
         remote_dir = f"{base_dir}/{sync_dir}"
 
-        if not self.ssh_manager.check_remote_directory(host, remote_dir):
-            self.logger.info(f"Creating remote directory: {remote_dir}")
-            return self.ssh_manager.create_remote_directory(host, remote_dir)
+        key = (host, remote_dir)
+        if key in self._remote_dirs:
+            return True
 
+        status = self.ssh_manager.prepare_remote(host, remote_dir)
+        if not (status["dir_ok"] and status["rsync"]):
+            return False
+        self._remote_dirs.add(key)
         return True
 
     def get_directory_info(self, host: str, sync_dir: str) -> Dict[str, Any]:
-        """Get information about local and remote directories."""
+        """Get information about local and remote directories.
+
+        Results are cached for a few seconds so repeated status queries do
+        not walk both trees again; any completed rsync clears the cache.
+        """
+        cache_key = (host, sync_dir)
+        cached = self._info_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._info_ttl:
+            return cached[1]
+
         local_path = self._build_local_path(sync_dir)
         base_dir = self.sync_config["remote"]["base_dir"]
         remote_dir = f"{base_dir}/{sync_dir}"
@@ -166,45 +725,38 @@ class RsyncManager:
         # Get local info
         if info["local"]["exists"]:
             try:
-                # Get local file count
-                result = subprocess.run(
-                    ["find", local_path, "-type", "f"], capture_output=True, text=True
-                )
-                if result.returncode == 0:
-                    info["local"]["file_count"] = (
-                        len(result.stdout.strip().split("\n"))
-                        if result.stdout.strip()
-                        else 0
-                    )
-
-                # Get local size
-                result = subprocess.run(
-                    ["du", "-sh", local_path], capture_output=True, text=True
-                )
-                if result.returncode == 0:
-                    info["local"]["size"] = result.stdout.split("\t")[0]
+                file_count, total_bytes = _local_tree_info(local_path)
+                info["local"]["file_count"] = file_count
+                info["local"]["size"] = _format_size(total_bytes)
             except Exception as e:
                 self.logger.debug(f"Could not get local directory info: {e}")
 
-        # Get remote info
-        info["remote"]["exists"] = self.ssh_manager.check_remote_directory(
-            host, remote_dir
-        )
-        if info["remote"]["exists"]:
-            size_info = self.ssh_manager.get_remote_disk_usage(host, remote_dir)
-            if size_info:
-                info["remote"]["size"] = size_info["size"]
-
-            file_count = self.ssh_manager.get_remote_file_count(host, remote_dir)
-            if file_count is not None:
-                info["remote"]["file_count"] = file_count
+        # Get remote info; existence, count and size come from one SSH call
+        tree_info = self.ssh_manager.get_remote_tree_info(host, remote_dir)
+        if tree_info is not None:
+            info["remote"]["exists"] = True
+            info["remote"]["file_count"] = tree_info["file_count"]
+            info["remote"]["size"] = _format_size(tree_info["total_bytes"])
 
+        self._info_cache[cache_key] = (time.monotonic(), info)
         return info
 
     def sync_local_to_remote(
         self, host: str, sync_dir: str, dry_run: bool = False
     ) -> Dict[str, Any]:
         """Sync local directory to remote."""
+        if host in LOCAL_HOSTS and self._can_mirror_locally(dry_run):
+            if not self.check_local_directory(sync_dir):
+                return {"success": False, "error": "Local directory check failed"}
+            base_dir = self.sync_config["remote"]["base_dir"]
+            return self._mirror_local(
+                self._build_local_path(sync_dir),
+                expand_path(f"{base_dir}/{sync_dir}"),
+                f"local-to-remote sync of {sync_dir}",
+            )
+
+        self.prime_ssh(host)
+
         local_path = self._build_local_path(sync_dir)
         remote_path = self._build_remote_path(host, sync_dir)
 
@@ -215,24 +767,64 @@ class RsyncManager:
         if not self.check_remote_directory(host, sync_dir):
             return {"success": False, "error": "Remote directory check failed"}
 
-        # Build rsync command
-        cmd = self.base_rsync_options.copy()
-
-        if dry_run:
-            cmd.append("--dry-run")
-
         # Add trailing slash to source for directory contents sync
         if not local_path.endswith("/"):
             local_path += "/"
 
-        cmd.extend([local_path, remote_path])
+        cmd = self._build_command(local_path, remote_path, dry_run)
 
         return self._execute_rsync(cmd, f"local-to-remote sync of {sync_dir}")
 
+    def _can_mirror_locally(self, dry_run: bool) -> bool:
+        """Whether a same-machine sync can be done without rsync.
+
+        Only with the "local_mirror" option, which declares that localhost
+        targets really are this machine. The mirror copies new and changed
+        files by size and mtime only; deletions, checksums, --update, dry
+        runs and path-anchored exclude patterns are left to rsync.
+        """
+        return (
+            self._local_mirror
+            and not dry_run
+            and _MIRROR_UNSUPPORTED_OPTIONS.isdisjoint(self.base_rsync_options)
+            and not any("/" in p.rstrip("/") for p in self._exclude_patterns)
+        )
+
+    def _mirror_local(
+        self, source: str, destination: str, operation_name: str
+    ) -> Dict[str, Any]:
+        """Copy a directory tree on this machine without spawning rsync."""
+        self.logger.info(f"Starting {operation_name} (local mirror)")
+        start_time = time.perf_counter()
+        try:
+            stats = _mirror_tree(source, destination, self._exclude_patterns)
+        except OSError as e:
+            return self._rsync_exception_result(
+                operation_name, e, time.perf_counter() - start_time
+            )
+
+        stats.duration = time.perf_counter() - start_time
+        self._info_cache.clear()
+        self.logger.info(
+            f"Completed {operation_name} in {stats.duration:.1f}s "
+            f"({stats.files_transferred} files copied)"
+        )
+        return SyncResultDC(
+            success=True,
+            operation=operation_name,
+            local_path=source,
+            remote_path=destination,
+            stats=stats,
+            duration=stats.duration,
+            returncode=0,
+        ).to_dict()
+
     def sync_remote_to_local(
         self, host: str, sync_dir: str, dry_run: bool = False
     ) -> Dict[str, Any]:
         """Sync remote directory to local."""
+        self.prime_ssh(host)
+
         local_path = self._build_local_path(sync_dir)
         remote_path = self._build_remote_path(host, sync_dir)
 
@@ -243,17 +835,11 @@ class RsyncManager:
         if not self.check_remote_directory(host, sync_dir):
             return {"success": False, "error": "Remote directory check failed"}
 
-        # Build rsync command
-        cmd = self.base_rsync_options.copy()
-
-        if dry_run:
-            cmd.append("--dry-run")
-
         # Add trailing slash to source for directory contents sync
         if not remote_path.endswith("/"):
             remote_path += "/"
 
-        cmd.extend([remote_path, local_path])
+        cmd = self._build_command(remote_path, local_path, dry_run)
 
         return self._execute_rsync(cmd, f"remote-to-local sync of {sync_dir}")
 
@@ -261,15 +847,29 @@ class RsyncManager:
         self, host: str, sync_dir: str, dry_run: bool = False
     ) -> Dict[str, Any]:
         """Perform bidirectional sync with conflict resolution."""
+        self.prime_ssh(host)
+
         if isinstance(self.config, SyncConfig):
             conflict_resolution = self.config.conflict_resolution
+            parallel = self.config.parallel_bidirectional
         else:
-            conflict_resolution = self.config["modes"]["bidirectional"].get(
+            bidirectional_config = self.config["modes"]["bidirectional"]
+            conflict_resolution = bidirectional_config.get(
                 "conflict_resolution", "newer"
             )
+            parallel = bidirectional_config.get("parallel", False)
+
+        try:
+            conflict_resolution = ConflictResolution(conflict_resolution)
+        except ValueError:
+            return {
+                "success": False,
+                "error": f"Unknown conflict resolution: {conflict_resolution}",
+            }
 
         self.logger.info(
-            f"Starting bidirectional sync of {sync_dir} (conflict resolution: {conflict_resolution})"
+            f"Starting bidirectional sync of {sync_dir} "
+            f"(conflict resolution: {conflict_resolution.value})"
         )
 
         results = {
@@ -280,14 +880,8 @@ class RsyncManager:
             "overall_success": False,
         }
 
-        if conflict_resolution == "newer":
+        if conflict_resolution is ConflictResolution.NEWER:
             # Use rsync's --update flag to only transfer newer files
-            cmd_base = self.base_rsync_options.copy()
-            cmd_base.append("--update")  # Only transfer files that are newer
-
-            if dry_run:
-                cmd_base.append("--dry-run")
-
             # Sync local to remote (newer files only)
             local_path = self._build_local_path(sync_dir)
             remote_path = self._build_remote_path(host, sync_dir)
@@ -295,29 +889,48 @@ class RsyncManager:
             if not local_path.endswith("/"):
                 local_path += "/"
 
-            cmd_l2r = cmd_base.copy()
-            cmd_l2r.extend([local_path, remote_path])
-            results["local_to_remote"] = self._execute_rsync(
-                cmd_l2r, f"bidirectional L2R sync of {sync_dir}"
+            # Leftovers of an interrupted concurrent run are never synced
+            extra_options: Tuple[str, ...] = (f"--exclude=/{BIDIRECTIONAL_TEMP_DIR}/",)
+            if parallel and not dry_run:
+                parallel = self._prepare_bidirectional_temp_dirs(host, sync_dir)
+                if parallel:
+                    # Each pass writes its in-progress files there instead
+                    # of next to the real ones, where the other pass would
+                    # list them and copy or trip over them
+                    extra_options += (f"--temp-dir={BIDIRECTIONAL_TEMP_DIR}",)
+
+            cmd_l2r = self._build_command(
+                local_path, remote_path, dry_run, True, extra_options
             )
 
             # Sync remote to local (newer files only)
             if not remote_path.endswith("/"):
                 remote_path += "/"
 
-            cmd_r2l = cmd_base.copy()
-            cmd_r2l.extend([remote_path, local_path.rstrip("/")])
-            results["remote_to_local"] = self._execute_rsync(
-                cmd_r2l, f"bidirectional R2L sync of {sync_dir}"
+            cmd_r2l = self._build_command(
+                remote_path, local_path.rstrip("/"), dry_run, True, extra_options
             )
 
-        elif conflict_resolution == "local":
+            l2r_name = f"bidirectional L2R sync of {sync_dir}"
+            r2l_name = f"bidirectional R2L sync of {sync_dir}"
+            if parallel:
+                # With --update each pass only moves files newer than the
+                # other side, so both directions can run at the same time
+                (
+                    results["local_to_remote"],
+                    results["remote_to_local"],
+                ) = self._execute_rsync_many([(cmd_l2r, l2r_name), (cmd_r2l, r2l_name)])
+            else:
+                results["local_to_remote"] = self._execute_rsync(cmd_l2r, l2r_name)
+                results["remote_to_local"] = self._execute_rsync(cmd_r2l, r2l_name)
+
+        elif conflict_resolution is ConflictResolution.LOCAL:
             # Local takes precedence
             results["local_to_remote"] = self.sync_local_to_remote(
                 host, sync_dir, dry_run
             )
 
-        elif conflict_resolution == "remote":
+        elif conflict_resolution is ConflictResolution.REMOTE:
             # Remote takes precedence
             results["remote_to_local"] = self.sync_remote_to_local(
                 host, sync_dir, dry_run
@@ -329,143 +942,197 @@ class RsyncManager:
                 "error": f"Unknown conflict resolution: {conflict_resolution}",
             }
 
-        # Determine overall success
-        if results["local_to_remote"] and results["remote_to_local"]:
-            results["overall_success"] = (
-                results["local_to_remote"]["success"]
-                and results["remote_to_local"]["success"]
-            )
-        elif results["local_to_remote"]:
-            results["overall_success"] = results["local_to_remote"]["success"]
-        elif results["remote_to_local"]:
-            results["overall_success"] = results["remote_to_local"]["success"]
+        # Determine overall success once from whichever passes ran
+        passes = [
+            r for r in (results["local_to_remote"], results["remote_to_local"]) if r
+        ]
+        results["overall_success"] = bool(passes) and all(r["success"] for r in passes)
 
         return results
 
+    def _prepare_bidirectional_temp_dirs(self, host: str, sync_dir: str) -> bool:
+        """Create the temp directories of concurrent passes on both sides.
+
+        rsync does not create --temp-dir itself. Returns False, after which
+        the passes run one after the other, if either side fails.
+        """
+        local_temp = os.path.join(
+            self._build_local_path(sync_dir), BIDIRECTIONAL_TEMP_DIR
+        )
+        remote_temp = (
+            f"{self.sync_config['remote']['base_dir']}/{sync_dir}"
+            f"/{BIDIRECTIONAL_TEMP_DIR}"
+        )
+        try:
+            os.makedirs(local_temp, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Running bidirectional passes in turn: {e}")
+            return False
+        if not self.ssh_manager.create_remote_directory(host, remote_temp):
+            self.logger.warning("Running bidirectional passes in turn")
+            return False
+        return True
+
     def _execute_rsync(self, cmd: List[str], operation_name: str) -> Dict[str, Any]:
         """Execute rsync command with error handling and progress monitoring."""
         self.logger.info(f"Starting {operation_name}")
-        self.logger.debug(f"Rsync command: {' '.join(cmd)}")
+        self.logger.debug(f"Rsync command: {shlex.join(cmd)}")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # Execute rsync command
-            process = subprocess.Popen(
+            # Execute rsync command; both pipes are multiplexed by a selector
+            process = _popen_rsync(cmd)
+
+            accumulator = _RsyncStatsAccumulator(self.logger)
+            error_lines = []
+
+            # Read output in real-time
+            for is_stderr, line in _iter_process_lines(process):
+                if is_stderr:
+                    error_lines.append(_decode_line(line))
+                else:
+                    accumulator.feed(line)
+
+            process.wait()
+            return self._finish_rsync(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+                operation_name,
+                accumulator,
+                error_lines,
+                process.returncode,
+                time.perf_counter() - start_time,
             )
 
-            stdout_lines = []
-            stderr_lines = []
+        except Exception as e:
+            return self._rsync_exception_result(
+                operation_name, e, time.perf_counter() - start_time
+            )
 
-            # Read output in real-time
-            while True:
-                stdout_line = process.stdout.readline()
-                stderr_line = process.stderr.readline()
-
-                if stdout_line:
-                    stdout_lines.append(stdout_line.rstrip())
-                    # Log progress information
-                    if "to-chk=" in stdout_line or "%" in stdout_line:
-                        self.logger.debug(f"Progress: {stdout_line.rstrip()}")
-
-                if stderr_line:
-                    stderr_lines.append(stderr_line.rstrip())
-                    self.logger.warning(f"Rsync stderr: {stderr_line.rstrip()}")
-
-                if process.poll() is not None:
-                    break
-
-            # Get remaining output
-            remaining_stdout, remaining_stderr = process.communicate()
-            if remaining_stdout:
-                stdout_lines.extend(remaining_stdout.strip().split("\n"))
-            if remaining_stderr:
-                stderr_lines.extend(remaining_stderr.strip().split("\n"))
-
-            duration = time.time() - start_time
-
-            # Parse rsync output for statistics
-            stats = self._parse_rsync_output(stdout_lines)
-
-            result = {
-                "success": process.returncode == 0,
-                "returncode": process.returncode,
-                "duration": duration,
-                "operation": operation_name,
-                "stats": stats,
-                "stdout": "\n".join(stdout_lines),
-                "stderr": "\n".join(stderr_lines),
-            }
+    async def _execute_rsync_async(
+        self, cmd: List[str], operation_name: str
+    ) -> Dict[str, Any]:
+        """Asyncio counterpart of _execute_rsync for running many rsyncs at once."""
+        self.logger.info(f"Starting {operation_name}")
+        self.logger.debug(f"Rsync command: {shlex.join(cmd)}")
 
-            if result["success"]:
-                self.logger.info(f"Completed {operation_name} in {duration:.1f}s")
-                if stats.get("files_transferred", 0) > 0:
-                    self.logger.info(
-                        f"Transferred {stats['files_transferred']} files, {stats.get('total_size', 'unknown')} bytes"
-                    )
-            else:
-                self.logger.error(
-                    f"Failed {operation_name} (exit code {process.returncode})"
-                )
-                if stderr_lines:
-                    self.logger.error(f"Error output: {stderr_lines[-1]}")
+        start_time = time.perf_counter()
+
+        try:
+            args, kwargs = _spawn_args(cmd)
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **kwargs,
+            )
 
-            return result
+            accumulator = _RsyncStatsAccumulator(self.logger)
+            error_lines = []
+
+            async def pump(stream: asyncio.StreamReader, is_stderr: bool) -> None:
+                # Read in chunks: progress updates are \r-separated and can
+                # exceed the StreamReader line limit
+                pending = b""
+                while True:
+                    chunk = await stream.read(_PIPE_READ_SIZE)
+                    lines, pending = _split_lines(pending, chunk)
+                    for line in lines:
+                        if is_stderr:
+                            error_lines.append(_decode_line(line))
+                        else:
+                            accumulator.feed(line)
+                    if not chunk:
+                        return
+
+            await asyncio.gather(
+                pump(process.stdout, False), pump(process.stderr, True)
+            )
+            await process.wait()
+            return self._finish_rsync(
+                cmd,
+                operation_name,
+                accumulator,
+                error_lines,
+                process.returncode,
+                time.perf_counter() - start_time,
+            )
 
         except Exception as e:
-            duration = time.time() - start_time
-            self.logger.error(f"Exception during {operation_name}: {e}")
-            return {
-                "success": False,
-                "returncode": -1,
-                "duration": duration,
-                "operation": operation_name,
-                "stats": {},
-                "stdout": "",
-                "stderr": str(e),
-            }
+            return self._rsync_exception_result(
+                operation_name, e, time.perf_counter() - start_time
+            )
 
-    def _parse_rsync_output(self, output_lines: List[str]) -> Dict[str, Any]:
-        """Parse rsync output to extract statistics."""
-        stats = {
-            "files_transferred": 0,
-            "files_skipped": 0,
-            "total_size": 0,
-            "speedup": 0.0,
-        }
+    def _execute_rsync_many(
+        self, commands: List[Tuple[List[str], str]]
+    ) -> List[Dict[str, Any]]:
+        """Run several (cmd, operation_name) rsyncs concurrently in one event loop."""
+
+        async def run_all() -> List[Dict[str, Any]]:
+            return await asyncio.gather(
+                *(self._execute_rsync_async(cmd, name) for cmd, name in commands)
+            )
+
+        return asyncio.run(run_all())
+
+    def _finish_rsync(
+        self,
+        cmd: List[str],
+        operation_name: str,
+        accumulator: "_RsyncStatsAccumulator",
+        error_lines: List[str],
+        returncode: int,
+        duration: float,
+    ) -> Dict[str, Any]:
+        """Build and log the result of a finished rsync process."""
+        stats = accumulator.stats
+        stats.duration = duration
+        output_lines = accumulator.tail_lines()
+
+        result = SyncResultDC(
+            success=returncode == 0,
+            operation=operation_name,
+            stats=stats,
+            duration=duration,
+            stdout="\n".join(output_lines),
+            stderr="\n".join(error_lines),
+            returncode=returncode,
+        )
 
-        for line in output_lines:
-            # Look for summary line like: "sent 1,234 bytes  received 5,678 bytes  2,345.67 bytes/sec"
-            if "sent" in line and "received" in line and "bytes/sec" in line:
-                # Extract numbers from the line
-                numbers = re.findall(r"[\d,]+", line)
-                if len(numbers) >= 2:
-                    try:
-                        sent = int(numbers[0].replace(",", ""))
-                        received = int(numbers[1].replace(",", ""))
-                        stats["total_size"] = sent + received
-                    except ValueError:
-                        pass
-
-            # Look for speedup line
-            elif "speedup is" in line:
-                match = re.search(r"speedup is ([\d.]+)", line)
-                if match:
-                    try:
-                        stats["speedup"] = float(match.group(1))
-                    except ValueError:
-                        pass
-
-            # Count file operations
-            elif line.startswith(">f") or line.startswith("<f"):
-                stats["files_transferred"] += 1
-            elif "skipping" in line.lower():
-                stats["files_skipped"] += 1
-
-        return stats
+        if error_lines:
+            # stderr is logged once per run instead of once per line
+            self.logger.warning(
+                f"Rsync stderr from {operation_name}:\n" + "\n".join(error_lines)
+            )
+
+        if result.success:
+            if "--dry-run" not in cmd:
+                # Directory contents changed; cached sizes are stale
+                self._info_cache.clear()
+            self.logger.info(f"Completed {operation_name} in {duration:.1f}s")
+            if stats.files_transferred > 0:
+                self.logger.info(
+                    f"Transferred {stats.files_transferred} files, "
+                    f"{stats.total_size} bytes"
+                )
+        else:
+            self.logger.error(f"Failed {operation_name} (exit code {returncode})")
+            if error_lines:
+                self.logger.error(f"Error output: {error_lines[-1]}")
+
+        return result.to_dict()
+
+    def _rsync_exception_result(
+        self, operation_name: str, error: Exception, duration: float
+    ) -> Dict[str, Any]:
+        """Build the result for an rsync that could not be run."""
+        self.logger.error(f"Exception during {operation_name}: {error}")
+        return SyncResultDC(
+            success=False,
+            operation=operation_name,
+            stats=SyncStatsDC(),
+            duration=duration,
+            stdout="",
+            stderr=str(error),
+            returncode=-1,
+        ).to_dict()
@@ -7,16 +7,65 @@ with enhanced security, error handling, and connection management.
 
 import logging
 import os
+import random
+import re
+import shlex
 import stat
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .exceptions import PermissionError as SyncPermissionError
 from .exceptions import SSHConnectionError
 from .models import SSHConfig
 
+# Shared master connection per user/host/port so that back-to-back ssh/rsync
+# invocations skip the TCP and key exchange setup. Regular commands only
+# attach to an existing master; start_control_master() opens it explicitly
+# with detached stdio, since a persisting master holds on to the stderr of
+# the process that spawned it.
+CONTROL_PATH = "~/.ssh/cm-%r@%h:%p"
+CONTROL_MASTER_OPTIONS = ("ControlMaster=no", f"ControlPath={CONTROL_PATH}")
+CONTROL_PERSIST = "10m"
+
+# sshd's default MaxSessions: sessions beyond this on one master connection
+# are refused, so concurrent commands to a host are capped at it
+SSH_MAX_SESSIONS = 10
+
+# First backoff step, in seconds, when waiting for SSH to come up
+SSH_BACKOFF_BASE = 1.0
+
+# Separates the outputs of commands batched into one SSH invocation
+_PROBE_MARKER = "---ec2-sync-probe---"
+_PROBE_MARKER_RE = re.compile(rf"\n{_PROBE_MARKER} (\d+)\n")
+
+
+def _quote_remote_path(path: str) -> str:
+    """Quote a path for the remote shell, leaving a leading ~ expandable."""
+    if path == "~" or path.startswith("~/"):
+        return "~/" + shlex.quote(path[2:] or ".")
+    return shlex.quote(path)
+
+
+def _local_ssh_version() -> str:
+    """Get the local SSH client version."""
+    try:
+        result = subprocess.run(["ssh", "-V"], capture_output=True, text=True)
+        return result.stderr.strip() if result.stderr else result.stdout.strip()
+    except FileNotFoundError:
+        return "SSH client not found"
+
+
+def _local_rsync_version() -> str:
+    """Get the first line of the local rsync version banner."""
+    try:
+        result = subprocess.run(["rsync", "--version"], capture_output=True, text=True)
+        return result.stdout.split("\n")[0] if result.stdout else "Unknown"
+    except FileNotFoundError:
+        return "rsync not found"
+
 
 class SSHManager:
     """Manages SSH connections to EC2 instances."""
@@ -43,6 +92,14 @@ class SSHManager:
         # Check and fix key file permissions
         self._check_key_permissions()
 
+        # Static parts of the ssh/rsync commands only depend on the config
+        self._ssh_base_args = tuple(self._build_ssh_base_args())
+        self._ssh_options_string = " ".join(self._ssh_base_args[1:])
+        self._rsync_ssh_command = f"ssh {self._ssh_options_string}"
+
+        # Hosts with an open ControlMaster connection
+        self._control_masters: Set[str] = set()
+
     def _validate_key_file(self):
         """Validate SSH key file exists and is readable."""
         if not os.path.exists(self.key_file):
@@ -90,15 +147,22 @@ class SSHManager:
         except Exception as e:
             self.logger.warning(f"Could not check SSH key permissions: {e}")
 
-    def build_ssh_command(self, host: str, command: str = None) -> List[str]:
-        """Build SSH command with proper options.
+    def _control_master_options(self) -> Tuple[str, ...]:
+        """Get ControlMaster options if connection multiplexing is enabled.
 
-        Args:
-            host: Target host
-            command: Optional command to execute
+        Returns:
+            Tuple of ssh -o option values
+        """
+        # OpenSSH on Windows does not support connection multiplexing
+        if not self.config.connection_multiplexing or os.name == "nt":
+            return ()
+        return CONTROL_MASTER_OPTIONS
+
+    def _build_ssh_base_args(self) -> List[str]:
+        """Build the host-independent SSH arguments.
 
         Returns:
-            List of command arguments
+            List of command arguments without the target host
         """
         ssh_cmd = [
             "ssh",
@@ -130,15 +194,135 @@ class SSHManager:
         # Add compression for better performance over slow connections
         ssh_cmd.extend(["-o", "Compression=yes"])
 
-        # Add host
+        for option in self._control_master_options():
+            ssh_cmd.extend(["-o", option])
+
+        return ssh_cmd
+
+    def build_ssh_command(self, host: str, command: str = None) -> List[str]:
+        """Build SSH command with proper options.
+
+        Args:
+            host: Target host
+            command: Optional command to execute
+
+        Returns:
+            List of command arguments
+        """
         user_host = f"{self.config.user}@{host}"
-        ssh_cmd.append(user_host)
 
         # Add command if provided
         if command:
-            ssh_cmd.append(command)
+            return [*self._ssh_base_args, user_host, command]
+        return [*self._ssh_base_args, user_host]
 
-        return ssh_cmd
+    def start_control_master(self, host: str) -> bool:
+        """Open a persistent ControlMaster connection to host.
+
+        Later ssh and rsync invocations to the same host reuse it. Calling
+        this again for a host that already has a master, including one left
+        running by another process, is a no-op.
+
+        Args:
+            host: Target host
+
+        Returns:
+            True if a master connection is available, False otherwise
+        """
+        if not self._control_master_options():
+            return False
+        if host in self._control_masters:
+            return True
+
+        # A master from an earlier run may still be persisting on the same
+        # ControlPath; spawning another would leave an orphaned -N -f client
+        if self._check_control_master(host):
+            self.logger.debug(f"Reusing SSH master connection to {host}")
+            self._control_masters.add(host)
+            return True
+
+        # ssh keeps the first value given for an option, so the client-side
+        # ControlMaster=no is swapped out rather than overridden
+        cmd = [
+            "ControlMaster=yes" if arg == "ControlMaster=no" else arg
+            for arg in self._ssh_base_args
+        ]
+        cmd += [
+            "-o",
+            f"ControlPersist={CONTROL_PERSIST}",
+            "-N",
+            "-f",
+            f"{self.config.user}@{host}",
+        ]
+
+        try:
+            # -f backgrounds the master after authentication; its stdio must
+            # not be our pipes or the call would block until it exits
+            result = subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=self.config.connect_timeout + 5,
+            )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            self.logger.debug(f"Could not open SSH master connection to {host}: {e}")
+            return False
+
+        if result.returncode != 0:
+            self.logger.debug(
+                f"Could not open SSH master connection to {host} "
+                f"(exit code {result.returncode})"
+            )
+            return False
+
+        self.logger.debug(f"Opened SSH master connection to {host}")
+        self._control_masters.add(host)
+        return True
+
+    def _check_control_master(self, host: str) -> bool:
+        """Ask the ControlMaster for host whether its connection is alive."""
+        cmd = [*self._ssh_base_args, "-O", "check", f"{self.config.user}@{host}"]
+        try:
+            result = subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=2,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+        return result.returncode == 0
+
+    def close(self) -> None:
+        """Shut down the ControlMaster connections opened by this manager.
+
+        Masters otherwise persist for CONTROL_PERSIST after last use, which
+        lets short-lived CLI runs share them; long-running processes should
+        call this when they stop.
+        """
+        while self._control_masters:
+            host = self._control_masters.pop()
+            cmd = [*self._ssh_base_args, "-O", "exit", f"{self.config.user}@{host}"]
+            try:
+                subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=self.config.connect_timeout,
+                )
+            except (subprocess.TimeoutExpired, OSError) as e:
+                self.logger.debug(
+                    f"Could not close SSH master connection to {host}: {e}"
+                )
+
+    def __enter__(self) -> "SSHManager":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
 
     def test_connection(self, host: str, timeout: int = None) -> bool:
         """Test SSH connection to host.
@@ -153,6 +337,13 @@ class SSHManager:
         if timeout is None:
             timeout = self.config.connect_timeout
 
+        # An open master answers "-O check" locally, without a new session
+        if host in self._control_masters:
+            if self._check_control_master(host):
+                self.logger.debug(f"SSH master connection to {host} is alive")
+                return True
+            self._control_masters.discard(host)
+
         try:
             cmd = self.build_ssh_command(host, 'echo "SSH connection successful"')
 
@@ -177,6 +368,30 @@ class SSHManager:
             self.logger.debug(f"SSH connection to {host} failed: {e}")
             return False
 
+    def connect(self, host: str) -> bool:
+        """Verify SSH access to host, leaving a master connection open.
+
+        Opening the ControlMaster authenticates just like a test command
+        would, so when multiplexing is enabled this costs one handshake
+        instead of test_connection() plus start_control_master().
+
+        Args:
+            host: Target host
+
+        Returns:
+            True if host is reachable over SSH, False otherwise
+        """
+        if self._control_master_options() and host not in self._control_masters:
+            if self.start_control_master(host):
+                return True
+            # The master can fail where plain ssh works (no ~/.ssh, a home
+            # without unix sockets, a ControlPath over the socket length)
+            self.logger.warning(
+                f"Could not open SSH master connection to {host}; "
+                "falling back to a direct connection"
+            )
+        return self.test_connection(host)
+
     def wait_for_ssh(self, host: str, max_wait: int = 300) -> bool:
         """Wait for SSH to become available on host.
 
@@ -189,13 +404,15 @@ class SSHManager:
         """
         self.logger.info(f"Waiting for SSH to become available on {host}...")
 
-        max_retries = self.config.max_retries
-        retry_delay = self.config.retry_delay
+        # Exponential backoff with full jitter, capped at retry_delay: quick
+        # retries while the instance boots, and many clients restarting at
+        # once don't reconnect in lockstep against sshd's MaxStartups limit
+        max_delay = max(float(self.config.retry_delay), SSH_BACKOFF_BASE)
 
-        start_time = time.time()
+        deadline = time.monotonic() + max_wait
         attempt = 0
 
-        while time.time() - start_time < max_wait:
+        while True:
             attempt += 1
 
             if self.test_connection(host):
@@ -204,20 +421,23 @@ class SSHManager:
                 )
                 return True
 
-            if attempt >= max_retries:
-                self.logger.debug(
-                    f"SSH attempt {attempt} failed, waiting {retry_delay}s before retry..."
-                )
-                time.sleep(retry_delay)
-                attempt = 0  # Reset attempt counter
-            else:
-                time.sleep(2)  # Short delay between quick retries
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            delay = random.uniform(
+                0, min(max_delay, SSH_BACKOFF_BASE * 2 ** min(attempt - 1, 16))
+            )
+            self.logger.debug(
+                f"SSH attempt {attempt} failed, waiting {delay:.1f}s before retry..."
+            )
+            time.sleep(min(delay, remaining))
 
         self.logger.error(f"SSH connection to {host} failed after {max_wait}s")
         return False
 
     def execute_command(
-        self, host: str, command: str, timeout: int = 60
+        self, host: str, command: str, timeout: int = 60, text: bool = True
     ) -> Dict[str, Any]:
         """Execute a command on the remote host via SSH.
 
@@ -225,17 +445,20 @@ class SSHManager:
             host: Target host
             command: Command to execute
             timeout: Command timeout
+            text: Decode stdout/stderr to str; internal probes whose output
+                is a status or a number pass False and get bytes
 
         Returns:
             Dictionary with execution results
         """
+        empty = "" if text else b""
         try:
             cmd = self.build_ssh_command(host, command)
 
             self.logger.debug(f"Executing SSH command on {host}: {command}")
 
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=timeout
+                cmd, capture_output=True, text=text, timeout=timeout
             )
 
             return {
@@ -249,11 +472,12 @@ class SSHManager:
 
         except subprocess.TimeoutExpired:
             self.logger.error(f"SSH command timed out after {timeout}s: {command}")
+            message = f"Command timed out after {timeout}s"
             return {
                 "success": False,
                 "returncode": -1,
-                "stdout": "",
-                "stderr": f"Command timed out after {timeout}s",
+                "stdout": empty,
+                "stderr": message if text else message.encode(),
                 "command": command,
                 "host": host,
             }
@@ -262,8 +486,8 @@ class SSHManager:
             return {
                 "success": False,
                 "returncode": -1,
-                "stdout": "",
-                "stderr": str(e),
+                "stdout": empty,
+                "stderr": str(e) if text else str(e).encode(),
                 "command": command,
                 "host": host,
             }
@@ -278,7 +502,9 @@ class SSHManager:
         Returns:
             True if directory exists, False otherwise
         """
-        result = self.execute_command(host, f'test -d "{directory}"')
+        result = self.execute_command(
+            host, f"test -d {_quote_remote_path(directory)}", text=False
+        )
         return result["success"]
 
     def create_remote_directory(self, host: str, directory: str) -> bool:
@@ -291,16 +517,78 @@ class SSHManager:
         Returns:
             True if directory was created, False otherwise
         """
-        result = self.execute_command(host, f'mkdir -p "{directory}"')
+        result = self.execute_command(
+            host, f"mkdir -p {_quote_remote_path(directory)}", text=False
+        )
         if result["success"]:
             self.logger.debug(f"Created remote directory: {directory}")
             return True
         else:
+            stderr = result["stderr"].decode(errors="replace")
             self.logger.error(
-                f"Failed to create remote directory {directory}: {result['stderr']}"
+                f"Failed to create remote directory {directory}: {stderr}"
             )
             return False
 
+    def prepare_remote(self, host: str, directory: str) -> Dict[str, bool]:
+        """Create a remote directory and check for rsync in one round trip.
+
+        Fuses create_remote_directory and check_remote_rsync for callers
+        about to sync into directory.
+
+        Args:
+            host: Target host
+            directory: Directory path to create
+
+        Returns:
+            Dictionary with "rsync" (rsync is on the remote PATH) and
+            "dir_ok" (directory exists after mkdir -p)
+        """
+        quoted = _quote_remote_path(directory)
+        result = self.execute_command(
+            host,
+            f"mkdir -p {quoted}; "
+            "command -v rsync >/dev/null && echo RSYNC=1 || echo RSYNC=0; "
+            f"test -d {quoted} && echo DIR=1 || echo DIR=0",
+            text=False,
+        )
+
+        lines = set(result["stdout"].split())
+        status = {"rsync": b"RSYNC=1" in lines, "dir_ok": b"DIR=1" in lines}
+
+        if not status["dir_ok"]:
+            stderr = result["stderr"].decode(errors="replace").strip()
+            self.logger.error(
+                f"Failed to create remote directory {directory}: {stderr}"
+            )
+        if b"RSYNC=0" in lines:
+            self.logger.warning("rsync not found on remote host")
+
+        return status
+
+    def remote_directory_has_files(self, host: str, directory: str) -> Optional[bool]:
+        """Check whether a remote directory contains any file.
+
+        Stops at the first file found, so it is cheap even for large trees.
+
+        Args:
+            host: Target host
+            directory: Directory path; a leading ~ is expanded remotely
+
+        Returns:
+            True if a file exists below directory, False if it is empty or
+            missing, None if the check itself failed
+        """
+        result = self.execute_command(
+            host,
+            f"cd {_quote_remote_path(directory)} 2>/dev/null || exit 0; "
+            "find . -type f -print 2>/dev/null | head -n 1",
+            text=False,
+        )
+        if not result["success"]:
+            return None
+        return bool(result["stdout"].strip())
+
     def get_remote_disk_usage(
         self, host: str, directory: str
     ) -> Optional[Dict[str, str]]:
@@ -313,8 +601,9 @@ class SSHManager:
         Returns:
             Dictionary with size information or None if failed
         """
+        quoted = _quote_remote_path(directory)
         result = self.execute_command(
-            host, f'du -sh "{directory}" 2>/dev/null || echo "0\t{directory}"'
+            host, f"du -sh {quoted} 2>/dev/null || printf '0\\t%s\\n' {quoted}"
         )
 
         if result["success"] and result["stdout"].strip():
@@ -335,7 +624,9 @@ class SSHManager:
             Number of files or None if failed
         """
         result = self.execute_command(
-            host, f'find "{directory}" -type f 2>/dev/null | wc -l'
+            host,
+            f"find {_quote_remote_path(directory)} -type f 2>/dev/null | wc -l",
+            text=False,
         )
 
         if result["success"] and result["stdout"].strip().isdigit():
@@ -343,6 +634,39 @@ class SSHManager:
 
         return None
 
+    def get_remote_tree_info(
+        self, host: str, directory: str
+    ) -> Optional[Dict[str, int]]:
+        """Count files and total bytes of a remote directory in one pass.
+
+        Args:
+            host: Target host
+            directory: Directory path; a leading ~ is expanded remotely
+
+        Returns:
+            Dictionary with file_count and total_bytes, or None if the
+            directory does not exist or the command failed
+        """
+        quoted = _quote_remote_path(directory)
+        # A failing find (no -printf on BSD or busybox, unreadable entries)
+        # must not be summed up as an empty tree, so it is passed on as ERR
+        result = self.execute_command(
+            host,
+            f"test -d {quoted} && "
+            f'{{ find {quoted} -type f -printf "%s\\n" 2>/dev/null '
+            "|| echo ERR; } "
+            '| awk \'$1 == "ERR" {err=1; next} {n++; s+=$1} '
+            'END {if (err) print "ERR"; else printf "%d %.0f\\n", n, s}\'',
+            text=False,
+        )
+
+        if result["success"]:
+            parts = result["stdout"].split()
+            if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+                return {"file_count": int(parts[0]), "total_bytes": int(parts[1])}
+
+        return None
+
     def check_remote_rsync(self, host: str) -> bool:
         """Check if rsync is available on the remote host.
 
@@ -352,7 +676,7 @@ class SSHManager:
         Returns:
             True if rsync is available, False otherwise
         """
-        result = self.execute_command(host, "which rsync")
+        result = self.execute_command(host, "which rsync", text=False)
         if result["success"]:
             self.logger.debug("rsync is available on remote host")
             return True
@@ -369,34 +693,31 @@ class SSHManager:
         Returns:
             Dictionary with system information
         """
-        info = {}
-
-        # Get OS information
-        result = self.execute_command(host, "uname -a")
-        if result["success"]:
-            info["uname"] = result["stdout"].strip()
+        probes = {
+            "uname": "uname -a",  # OS information
+            "os_release": 'cat /etc/os-release 2>/dev/null || echo "Unknown"',
+            "disk_space": "df -h /",
+            "memory": "free -h",
+            "uptime": "uptime",
+        }
 
-        # Get distribution information
-        result = self.execute_command(
-            host, 'cat /etc/os-release 2>/dev/null || echo "Unknown"'
+        # One SSH invocation for all probes; each output is followed by a
+        # marker line carrying that probe's exit status
+        command = "; ".join(
+            f"{probe}; printf '\\n{_PROBE_MARKER} %d\\n' $?"
+            for probe in probes.values()
         )
-        if result["success"]:
-            info["os_release"] = result["stdout"].strip()
+        result = self.execute_command(host, command)
 
-        # Get disk space
-        result = self.execute_command(host, "df -h /")
-        if result["success"]:
-            info["disk_space"] = result["stdout"].strip()
+        info: Dict[str, str] = {}
+        if not result["stdout"]:
+            return info
 
-        # Get memory information
-        result = self.execute_command(host, "free -h")
-        if result["success"]:
-            info["memory"] = result["stdout"].strip()
-
-        # Get uptime
-        result = self.execute_command(host, "uptime")
-        if result["success"]:
-            info["uptime"] = result["stdout"].strip()
+        sections = _PROBE_MARKER_RE.split(result["stdout"])
+        # split() yields [output, status, output, status, ..., trailing]
+        for key, output, status in zip(probes, sections[0::2], sections[1::2]):
+            if status == "0":
+                info[key] = output.strip()
 
         return info
 
@@ -406,25 +727,7 @@ class SSHManager:
         Returns:
             SSH options string
         """
-        options = [
-            f"-i {self.key_file}",
-            f"-p {self.config.port}",
-            f"-o ConnectTimeout={self.config.connect_timeout}",
-            "-o BatchMode=yes",
-            "-o PasswordAuthentication=no",
-            "-o PubkeyAuthentication=yes",
-            "-o PreferredAuthentications=publickey",
-            "-o Compression=yes",
-        ]
-
-        if self.config.strict_host_checking:
-            options.append("-o StrictHostKeyChecking=yes")
-        else:
-            options.append("-o StrictHostKeyChecking=no")
-            options.append("-o UserKnownHostsFile=/dev/null")
-            options.append("-o LogLevel=ERROR")
-
-        return " ".join(options)
+        return self._ssh_options_string
 
     def build_rsync_ssh_command(self) -> str:
         """Build SSH command string for rsync -e option.
@@ -432,7 +735,7 @@ class SSHManager:
         Returns:
             SSH command string for rsync
         """
-        return f"ssh {self.get_ssh_options_string()}"
+        return self._rsync_ssh_command
 
     def test_rsync_connection(self, host: str) -> bool:
         """Test rsync connectivity to remote host.
@@ -482,42 +785,37 @@ class SSHManager:
             "tests": {},
         }
 
-        # Test basic SSH connectivity
-        diagnostics["tests"]["ssh_connection"] = self.test_connection(host)
+        # The local version checks don't depend on the remote probes, so
+        # they run alongside them
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            local_ssh = executor.submit(_local_ssh_version)
+            local_rsync = executor.submit(_local_rsync_version)
 
-        # Test rsync availability
-        if diagnostics["tests"]["ssh_connection"]:
-            diagnostics["tests"]["rsync_available"] = self.check_remote_rsync(host)
-            diagnostics["tests"]["rsync_connection"] = self.test_rsync_connection(host)
+            # Test basic SSH connectivity
+            diagnostics["tests"]["ssh_connection"] = self.test_connection(host)
 
-            # Get system information
-            try:
-                diagnostics["remote_system"] = self.get_remote_system_info(host)
-            except Exception as e:
-                diagnostics["remote_system"] = {"error": str(e)}
-        else:
-            diagnostics["tests"]["rsync_available"] = False
-            diagnostics["tests"]["rsync_connection"] = False
-            diagnostics["remote_system"] = {"error": "SSH connection failed"}
+            # Test rsync availability
+            if diagnostics["tests"]["ssh_connection"]:
+                # Let the follow-up probes share one connection
+                self.start_control_master(host)
+                rsync_available = executor.submit(self.check_remote_rsync, host)
+                rsync_connection = executor.submit(self.test_rsync_connection, host)
+                remote_system = executor.submit(self.get_remote_system_info, host)
 
-        # Check local SSH client
-        try:
-            result = subprocess.run(["ssh", "-V"], capture_output=True, text=True)
-            diagnostics["local_ssh_version"] = (
-                result.stderr.strip() if result.stderr else result.stdout.strip()
-            )
-        except FileNotFoundError:
-            diagnostics["local_ssh_version"] = "SSH client not found"
+                diagnostics["tests"]["rsync_available"] = rsync_available.result()
+                diagnostics["tests"]["rsync_connection"] = rsync_connection.result()
 
-        # Check local rsync
-        try:
-            result = subprocess.run(
-                ["rsync", "--version"], capture_output=True, text=True
-            )
-            diagnostics["local_rsync_version"] = (
-                result.stdout.split("\n")[0] if result.stdout else "Unknown"
-            )
-        except FileNotFoundError:
-            diagnostics["local_rsync_version"] = "rsync not found"
+                # Get system information
+                try:
+                    diagnostics["remote_system"] = remote_system.result()
+                except Exception as e:
+                    diagnostics["remote_system"] = {"error": str(e)}
+            else:
+                diagnostics["tests"]["rsync_available"] = False
+                diagnostics["tests"]["rsync_connection"] = False
+                diagnostics["remote_system"] = {"error": "SSH connection failed"}
+
+            diagnostics["local_ssh_version"] = local_ssh.result()
+            diagnostics["local_rsync_version"] = local_rsync.result()
 
         return diagnostics
@@ -11,21 +11,104 @@ import hashlib
 import json
 import logging
 import os
+import posixpath
+import subprocess
 import sys
 import threading
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
 
 from .exceptions import EC2SyncError, SyncError
-from .models import ConflictResolution, DirectoryMapping, SyncConfig, SyncMode
+from .models import (
+    _DATACLASS_SLOTS,
+    ConflictResolution,
+    DirectoryMapping,
+    SyncConfig,
+    SyncMode,
+    expand_path,
+)
+from .ssh_manager import _quote_remote_path
 from .sync_orchestrator import SyncOrchestrator
 
-
-@dataclass
+try:
+    from blake3 import blake3 as _file_hasher
+except ImportError:  # Optional: pip install ec2-dynamic-sync[blake3]
+    _file_hasher = hashlib.blake2b
+
+# Files at or above this size are tracked by size/mtime only
+CHECKSUM_MAX_SIZE = 10 * 1024 * 1024
+_HASH_CHUNK_SIZE = 1 << 20
+_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Hash result for files that vanished or became unreadable mid-scan
+_UNREADABLE = object()
+
+# Remote change notifications, streamed back over SSH as "<EVENTS> <path>"
+_INOTIFY_EVENTS = "close_write,create,delete,moved_to,moved_from"
+_INOTIFY_NOT_FOUND = 127
+
+
+def _remote_watch_command(remote_path: str) -> str:
+    """Shell command that streams inotify events for a remote directory."""
+    return (
+        f"cd {_quote_remote_path(remote_path)} && exec inotifywait -mrq "
+        f"-e {_INOTIFY_EVENTS} --format '%e %w%f' ."
+    )
+
+
+def _parse_inotify_line(line: str) -> Optional["ChangeEvent"]:
+    """Turn an inotifywait output line into a ChangeEvent."""
+    raw_flags, _, path = line.rstrip("\n").partition(" ")
+    if not path:
+        return None
+
+    flags = set(raw_flags.split(","))
+    if flags & {"CREATE", "MOVED_TO"}:
+        event_type = "created"
+    elif flags & {"DELETE", "MOVED_FROM"}:
+        event_type = "deleted"
+    else:
+        event_type = "modified"
+
+    return ChangeEvent(
+        path=posixpath.normpath(path), event_type=event_type, timestamp=time.time()
+    )
+
+
+def _iter_files(root: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield ``(path, stat_result)`` for every file below ``root``.
+
+    Uses ``os.scandir`` so the file/directory test comes from the directory
+    listing itself. Like ``Path.rglob``, symlinked directories are not
+    descended into, while symlinked files are reported with their target's
+    stat.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ChangeEvent:
     """Represents a file system change event."""
 
@@ -37,7 +120,7 @@ class ChangeEvent:
     old_path: Optional[str] = None  # For move events
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SyncState:
     """Represents the current sync state."""
 
@@ -49,87 +132,156 @@ class SyncState:
 
 
 class ChangeDetector:
-    """Detects and tracks file system changes."""
+    """Detects and tracks file system changes.
+
+    Per-file state is kept as parallel dicts keyed by relative path
+    (``sizes``, ``mtimes``, ``checksums``) rather than one small dict per
+    file, which keeps large trees cheap to hold and compare.
+    """
 
     def __init__(self, base_path: str):
         self.base_path = Path(base_path)
-        self.file_states: Dict[str, Dict[str, Any]] = {}
+        self.sizes: Dict[str, int] = {}
+        self.mtimes: Dict[str, float] = {}
+        self.checksums: Dict[str, Optional[str]] = {}
         self.logger = logging.getLogger(__name__)
 
-    def get_file_info(self, file_path: Path) -> Dict[str, Any]:
-        """Get file information including size, mtime, and checksum."""
-        try:
-            stat = file_path.stat()
-
-            # Calculate checksum for small files only (< 10MB)
-            checksum = None
-            if stat.st_size < 10 * 1024 * 1024:
-                with open(file_path, "rb") as f:
-                    checksum = hashlib.md5(f.read()).hexdigest()
-
-            return {
-                "size": stat.st_size,
-                "mtime": stat.st_mtime,
-                "checksum": checksum,
+    @property
+    def file_states(self) -> Dict[str, Dict[str, Any]]:
+        """Recorded state of every tracked file, built on demand."""
+        return {
+            rel_path: {
+                "size": size,
+                "mtime": self.mtimes[rel_path],
+                "checksum": self.checksums[rel_path],
                 "exists": True,
             }
+            for rel_path, size in self.sizes.items()
+        }
+
+    @staticmethod
+    def _hash_file(file_path: Union[str, Path], size: int) -> Optional[str]:
+        """Checksum small files only, streamed in chunks; may raise OSError."""
+        if size >= CHECKSUM_MAX_SIZE:
+            return None
+
+        hasher = _file_hasher()
+        with open(file_path, "rb", buffering=0) as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def get_file_info(
+        self, file_path: Path, prev: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Get file information including size, mtime, and checksum.
+
+        If ``prev`` (the state recorded on the last scan) has the same size
+        and mtime, its checksum is carried forward instead of rehashing.
+        """
+        try:
+            stat = file_path.stat()
         except (OSError, IOError):
             return {"exists": False}
 
-    def scan_directory(self) -> Dict[str, Dict[str, Any]]:
-        """Scan directory and return current file states."""
-        current_states = {}
+        return self.get_file_info_from_stat(file_path, stat, prev)
+
+    def get_file_info_from_stat(
+        self,
+        file_path: Union[str, Path],
+        stat: os.stat_result,
+        prev: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Like :meth:`get_file_info`, for a file that has already been stat'ed."""
+        if (
+            prev
+            and prev.get("exists")
+            and prev["size"] == stat.st_size
+            and prev["mtime"] == stat.st_mtime
+        ):
+            checksum = prev["checksum"]
+        else:
+            try:
+                checksum = self._hash_file(file_path, stat.st_size)
+            except (OSError, IOError):
+                return {"exists": False}
+
+        return {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "checksum": checksum,
+            "exists": True,
+        }
 
-        if not self.base_path.exists():
-            return current_states
+    def scan_directory(
+        self,
+    ) -> Tuple[Dict[str, int], Dict[str, float], Dict[str, Optional[str]]]:
+        """Scan directory and return current ``(sizes, mtimes, checksums)``.
+
+        Checksums of files with unchanged size and mtime are carried forward;
+        the rest are hashed on a thread pool, since the GIL is released
+        during reads and hashing and cold scans can overlap their I/O. Files
+        that can't be read keep their previous state, if any.
+        """
+        sizes: Dict[str, int] = {}
+        mtimes: Dict[str, float] = {}
+        checksums: Dict[str, Optional[str]] = {}
+
+        if not self.base_path.is_dir():
+            return sizes, mtimes, checksums
+
+        base = str(self.base_path)
+        to_hash = []
+        for file_path, stat in _iter_files(base):
+            rel_path = os.path.relpath(file_path, base)
+            size, mtime = stat.st_size, stat.st_mtime
+            if self.sizes.get(rel_path) == size and self.mtimes[rel_path] == mtime:
+                checksums[rel_path] = self.checksums[rel_path]
+            else:
+                to_hash.append((rel_path, file_path, size))
+            sizes[rel_path] = size
+            mtimes[rel_path] = mtime
 
-        for file_path in self.base_path.rglob("*"):
-            if file_path.is_file():
-                rel_path = str(file_path.relative_to(self.base_path))
-                current_states[rel_path] = self.get_file_info(file_path)
+        def hash_entry(entry: Tuple[str, str, int]) -> object:
+            try:
+                return self._hash_file(entry[1], entry[2])
+            except (OSError, IOError):
+                return _UNREADABLE
+
+        if len(to_hash) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_HASH_WORKERS, len(to_hash))
+            ) as executor:
+                results = list(executor.map(hash_entry, to_hash))
+        else:
+            results = [hash_entry(entry) for entry in to_hash]
+
+        for (rel_path, _, _), checksum in zip(to_hash, results):
+            if checksum is not _UNREADABLE:
+                checksums[rel_path] = checksum
+            elif rel_path in self.sizes:
+                sizes[rel_path] = self.sizes[rel_path]
+                mtimes[rel_path] = self.mtimes[rel_path]
+                checksums[rel_path] = self.checksums[rel_path]
+            else:
+                del sizes[rel_path], mtimes[rel_path]
 
-        return current_states
+        return sizes, mtimes, checksums
 
     def detect_changes(self) -> List[ChangeEvent]:
         """Detect changes since last scan."""
-        current_states = self.scan_directory()
+        sizes, mtimes, checksums = self.scan_directory()
         changes = []
 
         # Find new and modified files
-        for rel_path, current_info in current_states.items():
-            if not current_info["exists"]:
-                continue
-
-            old_info = self.file_states.get(rel_path, {})
-
-            if not old_info:
-                # New file
-                changes.append(
-                    ChangeEvent(
-                        path=rel_path,
-                        event_type="created",
-                        timestamp=time.time(),
-                        size=current_info["size"],
-                        checksum=current_info["checksum"],
-                    )
-                )
-            elif current_info["mtime"] != old_info.get("mtime") or current_info[
-                "checksum"
-            ] != old_info.get("checksum"):
-                # Modified file
-                changes.append(
-                    ChangeEvent(
-                        path=rel_path,
-                        event_type="modified",
-                        timestamp=time.time(),
-                        size=current_info["size"],
-                        checksum=current_info["checksum"],
-                    )
-                )
+        for rel_path, size in sizes.items():
+            change = self._compare(rel_path, size, mtimes[rel_path], checksums)
+            if change:
+                changes.append(change)
 
         # Find deleted files
-        for rel_path, old_info in self.file_states.items():
-            if rel_path not in current_states:
+        for rel_path in self.sizes:
+            if rel_path not in sizes:
                 changes.append(
                     ChangeEvent(
                         path=rel_path, event_type="deleted", timestamp=time.time()
@@ -137,16 +289,129 @@ class ChangeDetector:
                 )
 
         # Update stored states
-        self.file_states = current_states
+        self.sizes, self.mtimes, self.checksums = sizes, mtimes, checksums
+
+        return changes
+
+    def detect_path_changes(self, rel_paths: Set[str]) -> List[ChangeEvent]:
+        """Detect changes for specific paths only, without a full scan.
+
+        Used with file system notifications, which already say which paths
+        were touched; stored states for other paths are left as they are.
+        """
+        changes = []
+
+        for rel_path in rel_paths:
+            file_path = self.base_path / rel_path
+
+            try:
+                stat = file_path.stat()
+                is_file = file_path.is_file()
+            except (OSError, IOError):
+                is_file = False
+
+            if not is_file:
+                if rel_path in self.sizes:
+                    del self.sizes[rel_path]
+                    del self.mtimes[rel_path]
+                    del self.checksums[rel_path]
+                    changes.append(
+                        ChangeEvent(
+                            path=rel_path, event_type="deleted", timestamp=time.time()
+                        )
+                    )
+                continue
+
+            size, mtime = stat.st_size, stat.st_mtime
+            if self.sizes.get(rel_path) == size and self.mtimes[rel_path] == mtime:
+                continue
+
+            try:
+                checksum = self._hash_file(file_path, size)
+            except (OSError, IOError):
+                continue
+
+            change = self._compare(rel_path, size, mtime, {rel_path: checksum})
+            self.sizes[rel_path] = size
+            self.mtimes[rel_path] = mtime
+            self.checksums[rel_path] = checksum
+            if change:
+                changes.append(change)
 
         return changes
 
+    def _compare(
+        self,
+        rel_path: str,
+        size: int,
+        mtime: float,
+        checksums: Dict[str, Optional[str]],
+    ) -> Optional[ChangeEvent]:
+        """Return the change from the recorded state of a file, if any."""
+        old_mtime = self.mtimes.get(rel_path)
+
+        if old_mtime is None:
+            # New file
+            return ChangeEvent(
+                path=rel_path,
+                event_type="created",
+                timestamp=time.time(),
+                size=size,
+                checksum=checksums[rel_path],
+            )
+
+        # Size and mtime decide; the checksum is carried forward whenever
+        # both match, so comparing it as well would never add anything
+        if mtime != old_mtime or size != self.sizes[rel_path]:
+            # Modified file
+            return ChangeEvent(
+                path=rel_path,
+                event_type="modified",
+                timestamp=time.time(),
+                size=size,
+                checksum=checksums[rel_path],
+            )
+
+        return None
+
+
+class _LocalChangeHandler(FileSystemEventHandler):
+    """Collects watchdog events for one directory mapping.
+
+    Events only record which paths were touched; the daemon's local monitor
+    then re-checks those paths with the mapping's ChangeDetector.
+    """
+
+    def __init__(self, daemon: "BidirectionalSyncDaemon", mapping_name: str):
+        super().__init__()
+        self.daemon = daemon
+        self.mapping_name = mapping_name
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+
+        if event.is_directory:
+            # A directory appearing, vanishing or being moved can carry
+            # files with it that produce no events of their own
+            if event.event_type != "modified":
+                self.daemon._mark_local_dirty(self.mapping_name, None)
+            return
+
+        paths = [event.src_path]
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            paths.append(dest_path)
+
+        for path in paths:
+            self.daemon._mark_local_dirty(self.mapping_name, os.fsdecode(path))
+
 
 class ConflictResolver:
     """Handles conflict resolution for bidirectional sync."""
 
     def __init__(self, strategy: ConflictResolution):
-        self.strategy = strategy
+        self.strategy = ConflictResolution(strategy)
         self.logger = logging.getLogger(__name__)
 
     def resolve_conflict(
@@ -158,11 +423,11 @@ class ConflictResolver:
             Tuple of (action, winning_change) where action is 'local_wins',
             'remote_wins', or 'manual_required'
         """
-        if self.strategy == ConflictResolution.LOCAL:
+        if self.strategy is ConflictResolution.LOCAL:
             return "local_wins", local_change
-        elif self.strategy == ConflictResolution.REMOTE:
+        elif self.strategy is ConflictResolution.REMOTE:
             return "remote_wins", remote_change
-        elif self.strategy == ConflictResolution.NEWER:
+        elif self.strategy is ConflictResolution.NEWER:
             if local_change.timestamp > remote_change.timestamp:
                 return "local_wins", local_change
             else:
@@ -172,32 +437,72 @@ class ConflictResolver:
 
 
 class SyncQueue:
-    """Manages queued sync operations with batching and prioritization."""
+    """Manages queued sync operations with batching and prioritization.
+
+    Pending changes are coalesced per path, so a file saved many times
+    before the next batch is only synced once, with its latest event.
+    """
 
     def __init__(self, max_batch_size: int = 50, max_wait_time: float = 30.0):
         self.max_batch_size = max_batch_size
         self.max_wait_time = max_wait_time
-        self.queue: deque = deque()
+        self.pending: Dict[str, ChangeEvent] = {}
         self.lock = threading.Lock()
+        self._cond = threading.Condition(self.lock)
         self.last_batch_time = time.time()
 
-    def add_changes(self, changes: List[ChangeEvent]):
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def add_changes(self, changes: List[ChangeEvent]) -> None:
         """Add changes to the sync queue."""
         with self.lock:
-            self.queue.extend(changes)
-
-    def get_batch(self) -> List[ChangeEvent]:
-        """Get a batch of changes ready for sync."""
+            for change in changes:
+                queued = self.pending.get(change.path)
+                # Re-queued (older) events must not replace newer ones
+                if queued is None or change.timestamp >= queued.timestamp:
+                    self.pending[change.path] = change
+            self._cond.notify_all()
+
+    def wake(self) -> None:
+        """Wake threads blocked in get_batch, e.g. on shutdown."""
         with self.lock:
+            self._cond.notify_all()
+
+    def _batch_ready(self, current_time: float) -> bool:
+        """Whether the batch is full or its wait time is up; hold the lock."""
+        return len(self.pending) >= self.max_batch_size or bool(
+            self.pending and current_time - self.last_batch_time >= self.max_wait_time
+        )
+
+    def get_batch(self, timeout: float = 0.0) -> List[ChangeEvent]:
+        """Get a batch of changes ready for sync.
+
+        Args:
+            timeout: Seconds to block waiting for a batch to become ready;
+                returns early (possibly empty) when changes are added or
+                wake() is called
+
+        Returns:
+            The batch, or an empty list if none is ready
+        """
+        with self._cond:
             current_time = time.time()
 
-            # Check if we should create a batch
-            if len(self.queue) >= self.max_batch_size or (
-                self.queue and current_time - self.last_batch_time >= self.max_wait_time
-            ):
+            if timeout > 0 and not self._batch_ready(current_time):
+                if self.pending:
+                    timeout = min(
+                        timeout,
+                        self.last_batch_time + self.max_wait_time - current_time,
+                    )
+                self._cond.wait(timeout)
+                current_time = time.time()
 
-                batch_size = min(len(self.queue), self.max_batch_size)
-                batch = [self.queue.popleft() for _ in range(batch_size)]
+            # Check if we should create a batch
+            if self._batch_ready(current_time):
+                batch = list(islice(self.pending.values(), self.max_batch_size))
+                for change in batch:
+                    del self.pending[change.path]
                 self.last_batch_time = current_time
                 return batch
 
@@ -206,7 +511,7 @@ class SyncQueue:
     def is_empty(self) -> bool:
         """Check if queue is empty."""
         with self.lock:
-            return len(self.queue) == 0
+            return not self.pending
 
 
 class BidirectionalSyncDaemon:
@@ -235,13 +540,30 @@ class BidirectionalSyncDaemon:
         self.running = False
         self.threads: List[threading.Thread] = []
 
+        # File system notifications: mapping name -> touched absolute paths,
+        # or None when the whole mapping needs a rescan
+        self.observers: Dict[str, BaseObserver] = {}
+        self._dirty: Dict[str, Optional[Set[str]]] = {}
+        self._dirty_lock = threading.Lock()
+        self._local_event = threading.Event()
+
+        # Remote inotifywait processes, and mappings whose host lacks it
+        self._remote_procs: List[subprocess.Popen] = []
+        self._remote_lock = threading.Lock()
+        self._remote_unwatchable: Set[str] = set()
+
+        # Remote changes reported while a sync runs; they can't be told
+        # apart from the sync's own writes, so they are queued once it ends
+        self._held_remote_changes: Dict[str, ChangeEvent] = {}
+        self._held_lock = threading.Lock()
+
         # Initialize change detectors for each mapping
         for mapping in config.directory_mappings:
             if mapping.enabled:
-                local_path = os.path.expanduser(mapping.local_path)
+                local_path = expand_path(mapping.local_path)
                 self.local_detectors[mapping.name] = ChangeDetector(local_path)
 
-    def start(self):
+    def start(self) -> None:
         """Start the sync daemon."""
         if self.running:
             return
@@ -249,6 +571,8 @@ class BidirectionalSyncDaemon:
         self.running = True
         self.logger.info("Starting bidirectional sync daemon")
 
+        self._start_observers()
+
         # Start monitoring threads
         local_thread = threading.Thread(target=self._local_monitor_loop, daemon=True)
         remote_thread = threading.Thread(target=self._remote_monitor_loop, daemon=True)
@@ -261,75 +585,250 @@ class BidirectionalSyncDaemon:
 
         self.logger.info("Sync daemon started successfully")
 
-    def stop(self):
+    def stop(self) -> None:
         """Stop the sync daemon."""
         if not self.running:
             return
 
         self.logger.info("Stopping sync daemon")
         self.running = False
+        self._local_event.set()
+        self.sync_queue.wake()
+
+        for observer in self.observers.values():
+            observer.stop()
+        for observer in self.observers.values():
+            observer.join(timeout=5.0)
+        self.observers = {}
+
+        with self._remote_lock:
+            for proc in self._remote_procs:
+                proc.terminate()
 
         # Wait for threads to finish
         for thread in self.threads:
             thread.join(timeout=5.0)
 
+        # Don't leave the shared SSH connection running after the daemon
+        self.orchestrator.ssh_manager.close()
+
         self.logger.info("Sync daemon stopped")
 
+    def _start_observers(self) -> None:
+        """Watch local directories with inotify/FSEvents where possible.
+
+        Mappings whose observer can't be started (missing directory, watch
+        limit reached) are left to the polling fallback.
+        """
+        for mapping_name, detector in self.local_detectors.items():
+            if not detector.base_path.is_dir():
+                continue
+
+            observer = Observer()
+            try:
+                observer.schedule(
+                    _LocalChangeHandler(self, mapping_name),
+                    str(detector.base_path),
+                    recursive=True,
+                )
+                observer.start()
+            except Exception as e:
+                self.logger.warning(f"Falling back to polling for {mapping_name}: {e}")
+                continue
+
+            self.observers[mapping_name] = observer
+
+    def _mark_local_dirty(self, mapping_name: str, path: Optional[str]) -> None:
+        """Record a touched path (or a needed rescan) and wake the monitor."""
+        with self._dirty_lock:
+            if path is None:
+                self._dirty[mapping_name] = None
+            else:
+                paths = self._dirty.setdefault(mapping_name, set())
+                if paths is not None:
+                    paths.add(path)
+        self._local_event.set()
+
+    def _record_local_changes(
+        self, mapping_name: str, changes: List[ChangeEvent]
+    ) -> None:
+        """Track detected local changes and queue them for sync."""
+        if changes:
+            self.logger.info(f"Detected {len(changes)} local changes in {mapping_name}")
+            for change in changes:
+                self.sync_state.local_changes[change.path] = change
+            self.sync_queue.add_changes(changes)
+
     def _local_monitor_loop(self):
-        """Monitor local directories for changes."""
+        """Monitor local directories for changes.
+
+        A full scan establishes the baseline; after that, watched mappings
+        are only re-checked for paths reported by their observer, and
+        mappings without an observer are polled every 5 seconds.
+        """
+        for mapping_name, detector in self.local_detectors.items():
+            try:
+                self._record_local_changes(mapping_name, detector.detect_changes())
+            except Exception as e:
+                self.logger.error(f"Error in local monitor loop: {e}")
+
+        next_poll = time.monotonic() + 5
         while self.running:
             try:
-                for mapping_name, detector in self.local_detectors.items():
-                    changes = detector.detect_changes()
-                    if changes:
-                        self.logger.info(
-                            f"Detected {len(changes)} local changes in {mapping_name}"
+                self._local_event.wait(max(0.0, next_poll - time.monotonic()))
+                if not self.running:
+                    break
+
+                self._local_event.clear()
+                with self._dirty_lock:
+                    dirty, self._dirty = self._dirty, {}
+
+                for mapping_name, paths in dirty.items():
+                    detector = self.local_detectors[mapping_name]
+                    if paths is None:
+                        changes = detector.detect_changes()
+                    else:
+                        base = str(detector.base_path)
+                        rel_paths = {os.path.relpath(p, base) for p in paths}
+                        changes = detector.detect_path_changes(
+                            {p for p in rel_paths if not p.startswith("..")}
                         )
-                        for change in changes:
-                            self.sync_state.local_changes[change.path] = change
-                        self.sync_queue.add_changes(changes)
+                    self._record_local_changes(mapping_name, changes)
 
-                time.sleep(5)  # Check every 5 seconds
+                if time.monotonic() >= next_poll:
+                    for mapping_name, detector in self.local_detectors.items():
+                        if mapping_name not in self.observers:
+                            self._record_local_changes(
+                                mapping_name, detector.detect_changes()
+                            )
+                    next_poll = time.monotonic() + 5
 
             except Exception as e:
                 self.logger.error(f"Error in local monitor loop: {e}")
                 time.sleep(10)
 
     def _remote_monitor_loop(self):
-        """Monitor remote directories for changes (via SSH polling)."""
+        """Monitor remote directories for changes.
+
+        Each mapping gets an ``inotifywait`` process on the instance whose
+        events stream back over SSH, so the remote tree is never rescanned.
+        Watchers that exit are restarted every poll interval; mappings on
+        hosts without inotifywait are left to the regular syncs.
+        """
+        watchers: Dict[str, threading.Thread] = {}
+
         while self.running:
             try:
-                # This is a simplified version - in practice, you'd want to
-                # implement more efficient remote change detection
+                host = self.orchestrator.current_host
+                if host:
+                    for mapping in self.config.directory_mappings:
+                        if (
+                            not mapping.enabled
+                            or mapping.name in self._remote_unwatchable
+                        ):
+                            continue
+
+                        watcher = watchers.get(mapping.name)
+                        if watcher is None or not watcher.is_alive():
+                            watcher = threading.Thread(
+                                target=self._watch_remote,
+                                args=(host, mapping),
+                                daemon=True,
+                            )
+                            watchers[mapping.name] = watcher
+                            watcher.start()
+
                 time.sleep(self.poll_interval)
 
             except Exception as e:
                 self.logger.error(f"Error in remote monitor loop: {e}")
                 time.sleep(30)
 
+    def _watch_remote(self, host: str, mapping: DirectoryMapping):
+        """Queue the remote changes reported by inotifywait for one mapping."""
+        cmd = self.orchestrator.ssh_manager.build_ssh_command(
+            host, _remote_watch_command(mapping.remote_path)
+        )
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        with self._remote_lock:
+            self._remote_procs.append(proc)
+
+        try:
+            for line in proc.stdout:
+                change = _parse_inotify_line(line)
+                if change is not None:
+                    self._record_remote_change(change)
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+            with self._remote_lock:
+                self._remote_procs.remove(proc)
+
+        if returncode == _INOTIFY_NOT_FOUND:
+            self._remote_unwatchable.add(mapping.name)
+            self.logger.info(
+                f"inotifywait not available on {host}; remote changes in "
+                f"{mapping.name} are picked up by regular syncs only"
+            )
+
+    def _record_remote_change(self, change: ChangeEvent):
+        """Queue a remote change, or hold it until the running sync ends."""
+        with self._held_lock:
+            if self.sync_state.sync_in_progress:
+                self._held_remote_changes[change.path] = change
+                return
+        self.sync_state.remote_changes[change.path] = change
+        self.sync_queue.add_changes([change])
+
+    def _release_held_remote_changes(self):
+        """End the sync window and queue the remote changes seen during it.
+
+        Echoes of our own uploads are among them. Queuing them costs one
+        follow-up sync that finds nothing to transfer, where dropping them
+        would lose edits made on the instance while rsync was running.
+        """
+        with self._held_lock:
+            self.sync_state.sync_in_progress = False
+            held, self._held_remote_changes = self._held_remote_changes, {}
+
+        if held:
+            changes = list(held.values())
+            self.sync_state.remote_changes.update(held)
+            self.sync_queue.add_changes(changes)
+
     def _sync_loop(self):
         """Main sync processing loop."""
         while self.running:
             try:
-                batch = self.sync_queue.get_batch()
+                # Blocks until a batch is ready, changes arrive or stop()
+                batch = self.sync_queue.get_batch(timeout=self.sync_queue.max_wait_time)
                 if batch:
                     self._process_sync_batch(batch)
-
-                time.sleep(1)
+                    # At most one batch per second, as failed batches are
+                    # re-queued
+                    time.sleep(1)
 
             except Exception as e:
                 self.logger.error(f"Error in sync loop: {e}")
                 time.sleep(5)
 
     def _process_sync_batch(self, changes: List[ChangeEvent]):
-        """Process a batch of changes."""
-        if self.sync_state.sync_in_progress:
-            # Re-queue changes if sync is already in progress
-            self.sync_queue.add_changes(changes)
-            return
+        """Process a batch of changes.
 
+        Only the sync thread calls this, so syncs never overlap: changes
+        detected meanwhile accumulate in the queue until it asks for the
+        next batch. Remote changes are held while sync_in_progress is set
+        and queued when the sync ends.
+        """
         try:
-            self.sync_state.sync_in_progress = True
+            with self._held_lock:
+                self.sync_state.sync_in_progress = True
             self.logger.info(f"Processing sync batch with {len(changes)} changes")
 
             # Perform the actual sync
@@ -350,14 +849,14 @@ class BidirectionalSyncDaemon:
             # Re-queue changes for retry
             self.sync_queue.add_changes(changes)
         finally:
-            self.sync_state.sync_in_progress = False
+            self._release_held_remote_changes()
 
     def get_status(self) -> Dict[str, Any]:
         """Get current daemon status."""
         return {
             "running": self.running,
             "last_sync_time": self.sync_state.last_sync_time,
-            "pending_changes": len(self.sync_queue.queue),
+            "pending_changes": len(self.sync_queue),
             "local_changes": len(self.sync_state.local_changes),
             "remote_changes": len(self.sync_state.remote_changes),
             "conflicts": len(self.sync_state.conflicts),
@@ -7,33 +7,135 @@ for the synchronization system.
 """
 
 import logging
+import os
+import stat
+import subprocess
+import tempfile
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .aws_manager import AWSManager
 from .config_manager import ConfigManager
-from .enhanced_rsync import EnhancedRsyncManager
+from .enhanced_rsync import EnhancedRsyncManager, ExcludePatternManager
 from .exceptions import AWSConnectionError, EC2SyncError, SSHConnectionError, SyncError
-from .models import SyncConfig, SyncMode, SyncResult
-from .ssh_manager import SSHManager
+from .models import (
+    AWSConfig,
+    BulkMode,
+    DirectoryMapping,
+    SyncConfig,
+    SyncMode,
+    SyncResult,
+)
+from .ssh_manager import SSH_MAX_SESSIONS, SSHManager, _quote_remote_path
+
+# Local file count from which an initial upload into an empty remote
+# directory is streamed through one tar pipe instead of rsync
+BULK_UPLOAD_MIN_FILES = 5000
+
+# Seconds to reuse DescribeInstances results. State and public IP can change
+# at any time, so instance info is short-lived; the instance a config
+# resolves to (by ID or Name tag) practically never changes.
+INSTANCE_INFO_TTL = 15.0
+INSTANCE_ID_TTL = 3600.0
+
+# Seconds a verified current_host is trusted before its SSH connection is
+# checked again; back-to-back calls (status, then sync) skip the check
+HOST_VERIFY_TTL = 60.0
+
+# Instance states from which an instance never comes back; a cached ID in
+# one of them is dropped and the configured instance resolved again
+DEAD_INSTANCE_STATES = ("terminated", "shutting-down")
+
+# Resolved instance IDs are shared by every orchestrator in the process.
+# Keyed by _instance_cache_key(); values are (monotonic timestamp, ID).
+_INSTANCE_ID_CACHE: Dict[str, Tuple[float, str]] = {}
+_instance_id_cache_lock = threading.Lock()
+
+
+def _instance_cache_key(aws_config: AWSConfig) -> str:
+    """Identify the instance an AWS configuration resolves to."""
+    return "|".join(
+        (
+            aws_config.profile,
+            aws_config.region,
+            aws_config.instance_id or "",
+            aws_config.instance_name or "",
+        )
+    )
+
+
+def _iter_upload_entries(
+    root: str, exclude_manager: Optional[ExcludePatternManager]
+) -> Iterator[Tuple[str, bool]]:
+    """Yield ``(relative_path, is_dir)`` for a tree, skipping excluded paths.
+
+    Excluded directories are pruned, so nothing below them is listed.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+
+        kept = []
+        for name in dirnames:
+            rel_path = prefix + name
+            if exclude_manager and exclude_manager.should_exclude(rel_path + "/"):
+                continue
+            kept.append(name)
+            yield rel_path, True
+        dirnames[:] = kept
+
+        for name in filenames:
+            rel_path = prefix + name
+            if exclude_manager and exclude_manager.should_exclude(rel_path):
+                continue
+            yield rel_path, False
+
+
+def _upload_totals(root: str, entries: List[str]) -> Dict[str, int]:
+    """files_transferred and total_size of the regular files in entries."""
+    files = total_size = 0
+    for rel_path in entries:
+        try:
+            st = os.lstat(os.path.join(root, rel_path))
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            files += 1
+            total_size += st.st_size
+    return {"files_transferred": files, "total_size": total_size}
 
 
 class SyncOrchestrator:
     """Main orchestrator for EC2 synchronization operations."""
 
-    def __init__(self, config: SyncConfig):
-        """Initialize the sync orchestrator."""
+    def __init__(
+        self,
+        config: SyncConfig,
+        aws_manager: Optional[AWSManager] = None,
+        ssh_manager: Optional[SSHManager] = None,
+    ):
+        """Initialize the sync orchestrator.
+
+        Existing managers can be passed in to share them (and their AWS
+        client and SSH master connections) between orchestrators.
+        """
         self.config = config
         self.logger = logging.getLogger(__name__)
 
         # Initialize managers
-        self.aws_manager = AWSManager(config.aws)
-        self.ssh_manager = SSHManager(config.ssh)
+        self.aws_manager = aws_manager or AWSManager(config.aws)
+        self.ssh_manager = ssh_manager or SSHManager(config.ssh)
         self.rsync_manager = EnhancedRsyncManager(config, self.ssh_manager)
 
         # State tracking
         self.current_host = None
         self.instance_id = None
+        self._host_verified_at = 0.0
+
+        # (monotonic timestamp, value) pair, see INSTANCE_INFO_TTL
+        self._instance_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
         self.logger.info("EC2 Dynamic Sync Orchestrator initialized")
 
@@ -47,41 +149,119 @@ class SyncOrchestrator:
         config = config_manager.load_config(config_path)
         return cls(config)
 
+    def _cached_instance_id(self) -> Optional[str]:
+        """Resolve the configured instance ID, reusing recent lookups."""
+        key = _instance_cache_key(self.config.aws)
+        with _instance_id_cache_lock:
+            cached = _INSTANCE_ID_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < INSTANCE_ID_TTL:
+            return cached[1]
+
+        instance_id = self.aws_manager.get_instance_id()
+        if instance_id:
+            with _instance_id_cache_lock:
+                _INSTANCE_ID_CACHE[key] = (time.monotonic(), instance_id)
+        return instance_id
+
+    def _forget_instance_id(self) -> None:
+        """Drop the cached instance ID, e.g. when the instance is gone."""
+        with _instance_id_cache_lock:
+            _INSTANCE_ID_CACHE.pop(_instance_cache_key(self.config.aws), None)
+
+    def _cached_instance_info(self, instance_id: str) -> Optional[Dict[str, Any]]:
+        """Get instance information, reusing it for INSTANCE_INFO_TTL seconds."""
+        cached = self._instance_info_cache
+        if (
+            cached is not None
+            and cached[1]["instance_id"] == instance_id
+            and time.monotonic() - cached[0] < INSTANCE_INFO_TTL
+        ):
+            return cached[1]
+
+        instance_info = None
+        try:
+            instance_info = self.aws_manager.get_instance_info(instance_id)
+        finally:
+            if not instance_info:
+                # A cached ID may belong to an instance that no longer exists
+                self._forget_instance_id()
+
+        if instance_info and instance_info["state"] in DEAD_INSTANCE_STATES:
+            # DescribeInstances still reports terminated instances for a
+            # while; the configured Name tag may already be on a new one
+            self._forget_instance_id()
+            current_id = self._cached_instance_id()
+            if current_id and current_id != instance_id:
+                return self._cached_instance_info(current_id)
+
+        self._instance_info_cache = (
+            (time.monotonic(), instance_info) if instance_info else None
+        )
+        return instance_info
+
+    def _invalidate_instance_info(self) -> None:
+        """Drop cached instance information, e.g. after a state change."""
+        self._instance_info_cache = None
+
+    @staticmethod
+    def _public_ip(instance_info: Dict[str, Any]) -> Optional[str]:
+        """Public IP of a running instance, like AWSManager.get_public_ip."""
+        if instance_info["state"] == "running":
+            return instance_info["public_ip"]
+        return None
+
+    def _ensure_host(self) -> bool:
+        """Make sure current_host is set and reachable, preparing if needed."""
+        if self.current_host:
+            if time.monotonic() - self._host_verified_at < HOST_VERIFY_TTL:
+                return True
+            # With a master connection open this is a local "ssh -O check"
+            if self.ssh_manager.test_connection(self.current_host):
+                self._host_verified_at = time.monotonic()
+                return True
+            self.logger.info("Lost SSH connection to instance, preparing again")
+            self.current_host = None
+        return self.prepare_instance()
+
     def prepare_instance(self) -> bool:
         """Prepare EC2 instance for synchronization."""
         try:
             self.logger.info("Preparing EC2 instance for sync...")
 
             # First get the instance ID from configuration
-            instance_id = self.aws_manager.get_instance_id()
+            instance_id = self._cached_instance_id()
             if not instance_id:
                 self.logger.error("Failed to resolve instance ID from configuration")
                 return False
 
             # Get instance information
-            instance_info = self.aws_manager.get_instance_info(instance_id)
+            instance_info = self._cached_instance_info(instance_id)
             if not instance_info:
                 self.logger.error("Failed to get instance information")
                 return False
 
-            self.instance_id = instance_info["instance_id"]
+            # The cached ID may have been replaced by a fresh lookup
+            instance_id = self.instance_id = instance_info["instance_id"]
             instance_state = instance_info["state"]
 
             self.logger.info(
-                f"Instance {self.instance_id} is in state: {instance_state}"
+                "Instance %s is in state: %s", self.instance_id, instance_state
             )
 
             # Start instance if needed
             if instance_state != "running":
                 if self.config.aws.auto_start_instance:
                     self.logger.info("Starting EC2 instance...")
+                    self._invalidate_instance_info()
+                    # start_instance waits until the instance is running
                     if not self.aws_manager.start_instance(instance_id):
                         self.logger.error("Failed to start instance")
                         return False
 
-                    # Wait for instance to be running
-                    if not self.aws_manager.wait_for_state(instance_id, "running"):
-                        self.logger.error("Instance failed to reach running state")
+                    # The public IP is only assigned once the instance runs
+                    instance_info = self._cached_instance_info(instance_id)
+                    if not instance_info:
+                        self.logger.error("Failed to get instance information")
                         return False
                 else:
                     self.logger.error(
@@ -90,38 +270,44 @@ class SyncOrchestrator:
                     return False
 
             # Get current IP address
-            self.current_host = self.aws_manager.get_public_ip(instance_id)
+            self.current_host = self._public_ip(instance_info)
             if not self.current_host:
                 self.logger.error("Failed to get instance IP address")
                 return False
 
-            self.logger.info(f"Instance IP: {self.current_host}")
+            self.logger.info("Instance IP: %s", self.current_host)
 
-            # Test SSH connectivity
-            if not self.ssh_manager.test_connection(self.current_host):
+            # Test SSH connectivity; this also opens the connection shared
+            # by all later rsync and remote commands
+            if not self.ssh_manager.connect(self.current_host):
                 self.logger.error("SSH connectivity test failed")
                 return False
 
+            self._host_verified_at = time.monotonic()
             self.logger.info("Instance preparation completed successfully")
             return True
 
         except Exception as e:
-            self.logger.error(f"Instance preparation failed: {e}")
+            self.logger.error("Instance preparation failed: %s", e)
             return False
 
     def sync_all_directories(
         self, mode: SyncMode = SyncMode.BIDIRECTIONAL, dry_run: bool = False, progress_callback: Optional[callable] = None
     ) -> Dict[str, Any]:
         """Sync all configured directories."""
-        if not self.current_host:
-            if not self.prepare_instance():
-                return {
-                    "overall_success": False,
-                    "error": "Instance preparation failed",
-                }
+        try:
+            mode = SyncMode(mode)  # Accept plain strings from the CLI
+        except ValueError:
+            return {"overall_success": False, "error": f"Unknown sync mode: {mode}"}
+
+        if not self._ensure_host():
+            return {
+                "overall_success": False,
+                "error": "Instance preparation failed",
+            }
 
         mappings = [m for m in self.config.directory_mappings if m.enabled]
-        results = {
+        results: Dict[str, Any] = {
             "overall_success": True,
             "directories": {},
             "summary": {
@@ -132,89 +318,282 @@ class SyncOrchestrator:
             },
         }
 
-        start_time = time.time()
-
-        for mapping in mappings:
-            self.logger.info(f"Syncing directory: {mapping.local_path}")
+        start_time = time.perf_counter()
+
+        if progress_callback:
+            # Mappings run concurrently; serialize calls into the caller's callback
+            callback_lock = threading.Lock()
+            user_callback = progress_callback
+
+            def locked_callback(*args: Any, **kwargs: Any) -> None:
+                with callback_lock:
+                    user_callback(*args, **kwargs)
+
+            progress_callback = locked_callback
+
+        # rsync spends its time waiting on the child process and network, so
+        # independent mappings are dispatched to a thread pool. Every rsync
+        # is a session on the shared master connection, which sshd caps.
+        if mappings:
+            workers = min(self.config.max_parallel_syncs, SSH_MAX_SESSIONS)
+            with ThreadPoolExecutor(
+                max_workers=min(workers, len(mappings))
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self._sync_mapping, mapping, mode, dry_run, progress_callback
+                    ): mapping
+                    for mapping in mappings
+                }
 
-            try:
-                # Use enhanced sync with progress callback if provided
-                if progress_callback:
-                    if mode == SyncMode.BIDIRECTIONAL:
-                        sync_result = self.rsync_manager.sync_with_progress(
-                            self.current_host, mapping, mode="bidirectional", dry_run=dry_run, progress_callback=progress_callback
-                        )
-                    elif mode == SyncMode.LOCAL_TO_REMOTE:
-                        sync_result = self.rsync_manager.sync_with_progress(
-                            self.current_host, mapping, mode="local_to_remote", dry_run=dry_run, progress_callback=progress_callback
+                for future in as_completed(futures):
+                    mapping = futures[future]
+                    try:
+                        result = future.result()
+                        results["directories"][mapping.name] = result
+
+                        # _sync_mapping always reports a "success" key
+                        if result["success"]:
+                            results["summary"]["successful_dirs"] += 1
+                        else:
+                            results["summary"]["failed_dirs"] += 1
+                            results["overall_success"] = False
+
+                    except Exception as e:
+                        self.logger.error(
+                            "Exception syncing %s: %s", mapping.local_path, e
                         )
-                    elif mode == SyncMode.REMOTE_TO_LOCAL:
-                        sync_result = self.rsync_manager.sync_with_progress(
-                            self.current_host, mapping, mode="remote_to_local", dry_run=dry_run, progress_callback=progress_callback
-                        )
-                    else:
-                        sync_result = None
-
-                    # Convert SyncResult to dict format
-                    if sync_result:
-                        result = {
-                            "success": sync_result.success,
-                            "error": sync_result.error_message,
-                            "stats": sync_result.stats,
-                            "duration": sync_result.duration,
+                        results["directories"][mapping.local_path] = {
+                            "success": False,
+                            "error": str(e),
                         }
-                    else:
-                        result = {"success": False, "error": f"Unknown sync mode: {mode}"}
-                else:
-                    # Use compatibility methods without progress callback
-                    if mode == SyncMode.BIDIRECTIONAL:
-                        result = self.rsync_manager.sync_bidirectional(
-                            self.current_host, mapping, dry_run
-                        )
-                    elif mode == SyncMode.LOCAL_TO_REMOTE:
-                        result = self.rsync_manager.sync_local_to_remote(
-                            self.current_host, mapping, dry_run
-                        )
-                    elif mode == SyncMode.REMOTE_TO_LOCAL:
-                        result = self.rsync_manager.sync_remote_to_local(
-                            self.current_host, mapping, dry_run
-                        )
-                    else:
-                        result = {"success": False, "error": f"Unknown sync mode: {mode}"}
+                        results["summary"]["failed_dirs"] += 1
+                        results["overall_success"] = False
 
-                results["directories"][mapping.name] = result
+        results["summary"]["total_duration"] = time.perf_counter() - start_time
 
-                if result.get("success") or result.get("overall_success"):
-                    results["summary"]["successful_dirs"] += 1
-                else:
-                    results["summary"]["failed_dirs"] += 1
-                    results["overall_success"] = False
+        # Log summary
+        summary = results["summary"]
+        self.logger.info(
+            "Sync completed: %d/%d directories successful in %.1fs",
+            summary["successful_dirs"],
+            summary["total_dirs"],
+            summary["total_duration"],
+        )
 
-            except Exception as e:
-                self.logger.error(f"Exception syncing {mapping.local_path}: {e}")
-                results["directories"][mapping.local_path] = {
-                    "success": False,
-                    "error": str(e),
+        return results
+
+    def _sync_mapping(
+        self,
+        mapping: DirectoryMapping,
+        mode: SyncMode,
+        dry_run: bool,
+        progress_callback: Optional[Callable[..., None]],
+    ) -> Dict[str, Any]:
+        """Sync a single directory mapping and return its result dict."""
+        self.logger.info("Syncing directory: %s", mapping.local_path)
+
+        if mode is SyncMode.LOCAL_TO_REMOTE and not dry_run:
+            entries = self._bulk_upload_entries(mapping, progress_callback)
+            if entries is not None:
+                result = self._bulk_upload_tar(self.current_host, mapping, entries)
+                if result["success"] or mapping.bulk_mode is BulkMode.TAR:
+                    return result
+                self.logger.warning(
+                    "tar upload of %s failed (%s), falling back to rsync",
+                    mapping.name,
+                    result["error"],
+                )
+
+        # Use enhanced sync with progress callback if provided
+        if progress_callback:
+            if mode is SyncMode.BIDIRECTIONAL:
+                sync_result = self.rsync_manager.sync_with_progress(
+                    self.current_host, mapping, mode="bidirectional", dry_run=dry_run, progress_callback=progress_callback
+                )
+            elif mode is SyncMode.LOCAL_TO_REMOTE:
+                sync_result = self.rsync_manager.sync_with_progress(
+                    self.current_host, mapping, mode="local_to_remote", dry_run=dry_run, progress_callback=progress_callback
+                )
+            elif mode is SyncMode.REMOTE_TO_LOCAL:
+                sync_result = self.rsync_manager.sync_with_progress(
+                    self.current_host, mapping, mode="remote_to_local", dry_run=dry_run, progress_callback=progress_callback
+                )
+            else:
+                sync_result = None
+
+            # Convert SyncResult to dict format
+            if sync_result:
+                return {
+                    "success": sync_result.success,
+                    "error": sync_result.error_message,
+                    "stats": sync_result.stats,
+                    "duration": sync_result.duration,
                 }
-                results["summary"]["failed_dirs"] += 1
-                results["overall_success"] = False
+            return {"success": False, "error": f"Unknown sync mode: {mode}"}
 
-        results["summary"]["total_duration"] = time.time() - start_time
+        # Use compatibility methods without progress callback
+        if mode is SyncMode.BIDIRECTIONAL:
+            return self.rsync_manager.sync_bidirectional(
+                self.current_host, mapping, dry_run
+            )
+        elif mode is SyncMode.LOCAL_TO_REMOTE:
+            return self.rsync_manager.sync_local_to_remote(
+                self.current_host, mapping, dry_run
+            )
+        elif mode is SyncMode.REMOTE_TO_LOCAL:
+            return self.rsync_manager.sync_remote_to_local(
+                self.current_host, mapping, dry_run
+            )
+        return {"success": False, "error": f"Unknown sync mode: {mode}"}
+
+    def _bulk_upload_entries(
+        self,
+        mapping: DirectoryMapping,
+        progress_callback: Optional[Callable[..., None]] = None,
+    ) -> Optional[List[str]]:
+        """Paths to stream through tar for a mapping, or None to use rsync.
+
+        In auto mode this only applies to initial uploads of large trees:
+        the local walk stops early below BULK_UPLOAD_MIN_FILES files, and
+        the remote directory must be missing or empty. tar can neither
+        throttle nor report progress, so auto mode also leaves syncs with a
+        bandwidth limit or a progress callback to rsync. Exclude patterns
+        are applied by ExcludePatternManager, not by rsync.
+        """
+        if mapping.bulk_mode is BulkMode.RSYNC or not os.path.isdir(
+            mapping.local_path
+        ):
+            return None
+
+        auto = mapping.bulk_mode is BulkMode.AUTO
+        # rsync treats a limit of 0 as unlimited
+        bandwidth_limit = self.config.sync_options.bandwidth_limit
+        throttled = int((bandwidth_limit or "").strip() or 0) > 0
+        if auto and (throttled or progress_callback):
+            return None
+        if throttled:
+            self.logger.warning(
+                "tar upload of %s does not apply bandwidth_limit", mapping.name
+            )
+        walk = _iter_upload_entries(
+            mapping.local_path, self.rsync_manager.exclude_managers.get(mapping.name)
+        )
+
+        entries = []
+        file_count = 0
+        for rel_path, is_dir in walk:
+            entries.append(rel_path)
+            file_count += not is_dir
+            if auto and file_count >= BULK_UPLOAD_MIN_FILES:
+                break
+        else:
+            if auto:
+                return None
+
+        # Only an empty remote side can skip rsync's delta transfer
+        if auto and self.ssh_manager.remote_directory_has_files(
+            self.current_host, mapping.remote_path
+        ) is not False:
+            return None
+
+        entries.extend(rel_path for rel_path, _ in walk)
+        return entries
+
+    def _bulk_upload_tar(
+        self, host: str, mapping: DirectoryMapping, entries: List[str]
+    ) -> Dict[str, Any]:
+        """Upload a mapping as one tar stream over a single SSH channel.
+
+        Avoids rsync's per-file negotiation when there is nothing on the
+        remote side to compare against. tar keeps modes and mtimes, so
+        later rsync runs see the files as up to date.
+        """
+        start_time = time.perf_counter()
+        remote_dir = _quote_remote_path(mapping.remote_path)
+        remote_cmd = f"mkdir -p {remote_dir} && tar -xf - -C {remote_dir}"
 
-        # Log summary
-        summary = results["summary"]
         self.logger.info(
-            f"Sync completed: {summary['successful_dirs']}/{summary['total_dirs']} "
-            f"directories successful in {summary['total_duration']:.1f}s"
+            "Streaming initial upload of %s (%d entries) through tar",
+            mapping.name,
+            len(entries),
         )
 
-        return results
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wb", prefix="ec2-sync-", suffix=".tar-list"
+            ) as file_list, tempfile.TemporaryFile() as tar_stderr:
+                file_list.write(b"\0".join(os.fsencode(e) for e in entries))
+                file_list.flush()
+
+                tar = subprocess.Popen(
+                    [
+                        "tar",
+                        "-cf",
+                        "-",
+                        "-C",
+                        mapping.local_path,
+                        "--no-recursion",
+                        "--null",
+                        "-T",
+                        file_list.name,
+                    ],
+                    stdout=subprocess.PIPE,
+                    stderr=tar_stderr,
+                )
+                ssh = subprocess.Popen(
+                    self.ssh_manager.build_ssh_command(host, remote_cmd),
+                    stdin=tar.stdout,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+                # ssh is now the only reader, so tar sees EPIPE if it exits
+                tar.stdout.close()
+
+                _, ssh_errors = ssh.communicate()
+                tar.wait()
+                tar_stderr.seek(0)
+                tar_errors = tar_stderr.read()
+        except OSError as e:
+            return {
+                "success": False,
+                "error": f"Failed to run tar upload: {e}",
+                "stats": {"method": "tar"},
+                "duration": time.perf_counter() - start_time,
+            }
+
+        duration = time.perf_counter() - start_time
+        stats = {"method": "tar", "entries": len(entries), "duration": duration}
+        if tar.returncode == 0 and ssh.returncode == 0:
+            stats.update(_upload_totals(mapping.local_path, entries))
+            if duration > 0:
+                stats["transfer_rate"] = stats["total_size"] / duration
+
+        if tar.returncode == 0 and ssh.returncode == 0:
+            return {
+                "success": True,
+                "error": None,
+                "stats": stats,
+                "duration": duration,
+            }
+
+        error = (ssh_errors or tar_errors).decode(errors="replace").strip()
+        if not error:
+            error = (
+                f"tar upload failed (tar exit {tar.returncode}, "
+                f"ssh exit {ssh.returncode})"
+            )
+        return {
+            "success": False,
+            "error": error,
+            "stats": stats,
+            "duration": duration,
+        }
 
     def get_sync_status(self) -> Dict[str, Any]:
         """Get current sync status and directory information."""
-        if not self.current_host:
-            if not self.prepare_instance():
-                return {"success": False, "error": "Instance preparation failed"}
+        if not self._ensure_host():
+            return {"success": False, "error": "Instance preparation failed"}
 
         mappings = [m for m in self.config.directory_mappings if m.enabled]
         status = {
@@ -223,12 +602,27 @@ class SyncOrchestrator:
             "directories": {},
         }
 
+        if not mappings:
+            return status
+
+        # Each mapping costs one SSH round trip over the shared connection,
+        # so query them concurrently rather than one after another
+        workers = min(SSH_MAX_SESSIONS, len(mappings))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                mapping.name: executor.submit(
+                    self.rsync_manager.get_directory_info, self.current_host, mapping
+                )
+                for mapping in mappings
+            }
+
         for mapping in mappings:
             try:
-                info = self.rsync_manager.get_directory_info(self.current_host, mapping)
-                status["directories"][mapping.name] = info
+                status["directories"][mapping.name] = futures[mapping.name].result()
             except Exception as e:
-                self.logger.error(f"Error getting status for {mapping.local_path}: {e}")
+                self.logger.error(
+                    "Error getting status for %s: %s", mapping.local_path, e
+                )
                 status["directories"][mapping.name] = {"error": str(e)}
 
         return status
@@ -239,18 +633,19 @@ class SyncOrchestrator:
             "aws_connectivity": False,
             "instance_reachable": False,
             "ssh_connectivity": False,
+            "rsync_available": False,
             "overall_success": False,
         }
 
         try:
             # Test AWS connectivity
             # First get the instance ID from configuration
-            instance_id = self.aws_manager.get_instance_id()
+            instance_id = self._cached_instance_id()
             if not instance_id:
                 results["error"] = "Failed to resolve instance ID from configuration"
                 return results
 
-            instance_info = self.aws_manager.get_instance_info(instance_id)
+            instance_info = self._cached_instance_info(instance_id)
             if instance_info:
                 results["aws_connectivity"] = True
                 results["instance_reachable"] = True
@@ -259,12 +654,20 @@ class SyncOrchestrator:
                 self.instance_id = instance_info["instance_id"]
 
                 # Get IP and test SSH
-                ip = self.aws_manager.get_public_ip(instance_id)
+                ip = self._public_ip(instance_info)
                 if ip:
                     self.current_host = ip
-                    if self.ssh_manager.test_connection(ip):
+                    # current_host is now set, so callers such as
+                    # get_sync_status skip prepare_instance; connect()
+                    # opens the shared connection for their SSH probes
+                    if self.ssh_manager.connect(ip):
                         results["ssh_connectivity"] = True
                         results["overall_success"] = True
+                        self._host_verified_at = time.monotonic()
+                        # One session over the now-open master connection
+                        results["rsync_available"] = (
+                            self.ssh_manager.check_remote_rsync(ip)
+                        )
 
         except Exception as e:
             results["error"] = str(e)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the enhanced rsync helpers in EC2 Dynamic Sync.
+
+rsync is never run; these cover the pure-Python pattern matching that
+decides what a sync leaves out.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ec2_dynamic_sync.core import enhanced_rsync
+from ec2_dynamic_sync.core.enhanced_rsync import (
+    EnhancedRsyncManager,
+    ExcludePatternManager,
+    ProgressReporter,
+)
+
+
+@pytest.fixture
+def exclude_manager(tmp_path, monkeypatch):
+    """ExcludePatternManager without ignore files, not even a global one."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return ExcludePatternManager(str(tmp_path))
+
+
+class TestDefaultExcludes:
+    """Test the built-in exclusions, which match whole path components."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "node_modules/lodash/index.js",
+            "a/node_modules/x",
+            "src/__pycache__/mod.cpython-311.pyc",
+            "pkg/.git/HEAD",
+            "frontend/build/app.js",
+            "foo.tmp/bar",
+            "notes.txt~",
+            "docs/.DS_Store",
+            "mypkg.egg-info/PKG-INFO",
+        ],
+    )
+    def test_excluded(self, exclude_manager, path):
+        """Default patterns apply at any depth, like rsync's --exclude."""
+        assert exclude_manager.should_exclude(path)
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "src/app.py",
+            "notes.tmpl",
+            "my_node_modules/x",
+            "rebuild/app.js",
+            "docs/build.md",
+            "dist",
+        ],
+    )
+    def test_kept(self, exclude_manager, path):
+        """Names that merely contain a pattern are not excluded."""
+        assert not exclude_manager.should_exclude(path)
+
+
+def _make_manager(config, monkeypatch, rsync_version):
+    """EnhancedRsyncManager as if the local rsync had rsync_version."""
+    monkeypatch.setattr(
+        enhanced_rsync,
+        "_local_rsync_supports_info",
+        lambda: rsync_version >= (3, 1),
+    )
+    ssh_manager = Mock()
+    ssh_manager.build_rsync_ssh_command.return_value = "ssh"
+    return EnhancedRsyncManager(config, ssh_manager)
+
+
+@pytest.fixture
+def config(base_sync_config, tmp_path, monkeypatch):
+    """Sync config without mappings, isolated from the user's ignore files."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return base_sync_config.model_copy(update={"directory_mappings": []})
+
+
+class TestProgressOptions:
+    """Test progress reporting across rsync versions."""
+
+    def test_rsync_31_reports_whole_transfer(self, config, monkeypatch):
+        """rsync 3.1+ gets --info=progress2 with cumulative byte counts."""
+        manager = _make_manager(config, monkeypatch, (3, 2))
+        progress = ProgressReporter()
+
+        assert "--info=progress2" in manager.base_rsync_options
+        manager._parse_rsync_progress(
+            "43888890  45%    1.02MB/s    0:00:42 (xfr#1, to-chk=1/2)", progress
+        )
+
+        assert progress.bytes_transferred == 43888890
+        assert progress.total_files == 2
+
+    def test_old_rsync_falls_back_to_per_file_progress(self, config, monkeypatch):
+        """macOS's rsync 2.6.9 rejects --info, so --progress is used."""
+        manager = _make_manager(config, monkeypatch, (2, 6))
+
+        assert "--progress" in manager.base_rsync_options
+        assert not any(
+            option.startswith(("--info", "--no-human-readable"))
+            for option in manager.base_rsync_options
+        )
+
+    def test_per_file_progress_is_accumulated(self, config, monkeypatch):
+        """Per-file counts add up across files once each one finishes."""
+        manager = _make_manager(config, monkeypatch, (2, 6))
+        progress = ProgressReporter()
+
+        for line in [
+            "1000\ta.txt",
+            "512  51%  1.00MB/s  0:00:01",
+            "1000 100%  1.00MB/s  0:00:01 (xfer#1, to-check=1/2)",
+            "2000\tb.txt",
+            "500  25%  1.00MB/s  0:00:02",
+        ]:
+            manager._parse_rsync_progress(line, progress)
+
+        assert progress.bytes_transferred == 1500
+        assert progress.files_transferred == 2
+        assert progress.current_file == "b.txt"
+        assert progress.total_files == 2
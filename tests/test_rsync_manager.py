@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tests for the legacy RsyncManager in EC2 Dynamic Sync.
+
+rsync itself is never run; commands that would reach it go to a mocked
+_execute_rsync so the tests can tell which path a sync took.
+"""
+
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ec2_dynamic_sync.core import rsync_manager
+from ec2_dynamic_sync.core.rsync_manager import (
+    RsyncManager,
+    _local_rsync_supports_info,
+    _local_rsync_version,
+    _spawn_args,
+)
+
+
+def _make_manager(tmp_path, bidirectional=None, **options):
+    """RsyncManager with dict config rooted in tmp_path."""
+    config = {
+        "sync": {
+            "options": {"archive": True, "compress": False, **options},
+            "local": {"base_dir": str(tmp_path / "local")},
+            "remote": {"base_dir": str(tmp_path / "remote")},
+        },
+        "modes": {"bidirectional": bidirectional or {}},
+    }
+    ssh_manager = Mock()
+    ssh_manager.ssh_config = {"user": "ubuntu"}
+    manager = RsyncManager(config, ssh_manager)
+    manager._execute_rsync = Mock(return_value={"success": True, "rsync": True})
+    manager.check_remote_directory = Mock(return_value=True)
+    return manager
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A local sync directory with one file in it."""
+    source = tmp_path / "local" / "project"
+    source.mkdir(parents=True)
+    (source / "data.txt").write_text("payload")
+    return tmp_path
+
+
+class TestLocalMirror:
+    """Test when same-machine syncs bypass rsync."""
+
+    def test_localhost_uses_rsync_by_default(self, project):
+        """Without the opt-in, localhost may be a tunnel and goes via rsync."""
+        manager = _make_manager(project)
+
+        result = manager.sync_local_to_remote("localhost", "project")
+
+        assert result["rsync"] is True
+        manager._execute_rsync.assert_called_once()
+        assert not (project / "remote").exists()
+
+    def test_localhost_mirrors_with_opt_in(self, project):
+        """With local_mirror the tree is copied without spawning rsync."""
+        manager = _make_manager(project, local_mirror=True)
+
+        result = manager.sync_local_to_remote("127.0.0.1", "project")
+
+        assert result["success"] is True
+        manager._execute_rsync.assert_not_called()
+        copied = project / "remote" / "project" / "data.txt"
+        assert copied.read_text() == "payload"
+
+    @pytest.mark.parametrize(
+        "option", [{"delete": True}, {"checksum": True}, {"backup": True}]
+    )
+    def test_unsupported_options_use_rsync(self, project, option):
+        """Options the mirror cannot honour send the sync to rsync."""
+        manager = _make_manager(project, local_mirror=True, **option)
+
+        manager.sync_local_to_remote("localhost", "project")
+
+        manager._execute_rsync.assert_called_once()
+
+    def test_remote_host_never_mirrors(self, project):
+        """The opt-in only applies to localhost names."""
+        manager = _make_manager(project, local_mirror=True)
+
+        manager.sync_local_to_remote("1.2.3.4", "project")
+
+        manager._execute_rsync.assert_called_once()
+
+
+def test_spawn_args_close_inherited_descriptors():
+    """Long-lived rsync/ssh children must not inherit our descriptors."""
+    args, kwargs = _spawn_args(["rsync", "-a", "src/", "dst/"])
+
+    assert args[1:] == ["-a", "src/", "dst/"]
+    assert kwargs.get("close_fds", True) is True
+
+
+class TestBidirectional:
+    """Test how the two --update passes of a bidirectional sync run."""
+
+    def test_passes_run_in_turn_by_default(self, project):
+        """Without opting in, R2L starts only after L2R has finished."""
+        manager = _make_manager(project)
+        manager._execute_rsync_many = Mock()
+
+        result = manager.sync_bidirectional("1.2.3.4", "project")
+
+        assert result["overall_success"] is True
+        assert manager._execute_rsync.call_count == 2
+        manager._execute_rsync_many.assert_not_called()
+        for call in manager._execute_rsync.call_args_list:
+            assert "--temp-dir=.ec2-sync-tmp" not in call.args[0]
+            assert "--exclude=/.ec2-sync-tmp/" in call.args[0]
+
+    def test_concurrent_passes_keep_temp_files_apart(self, project):
+        """Concurrent passes stage files in a directory both of them exclude."""
+        manager = _make_manager(project, bidirectional={"parallel": True})
+        manager.ssh_manager.create_remote_directory.return_value = True
+        done = {"success": True}
+        manager._execute_rsync_many = Mock(return_value=[done, done])
+
+        result = manager.sync_bidirectional("1.2.3.4", "project")
+
+        assert result["overall_success"] is True
+        manager._execute_rsync.assert_not_called()
+        for cmd, _ in manager._execute_rsync_many.call_args.args[0]:
+            assert "--temp-dir=.ec2-sync-tmp" in cmd
+            assert "--exclude=/.ec2-sync-tmp/" in cmd
+        assert (project / "local" / "project" / ".ec2-sync-tmp").is_dir()
+        manager.ssh_manager.create_remote_directory.assert_called_once_with(
+            "1.2.3.4", f"{project / 'remote'}/project/.ec2-sync-tmp"
+        )
+
+    def test_concurrent_passes_need_remote_temp_dir(self, project):
+        """If the remote temp directory cannot be made, passes run in turn."""
+        manager = _make_manager(project, bidirectional={"parallel": True})
+        manager.ssh_manager.create_remote_directory.return_value = False
+        manager._execute_rsync_many = Mock()
+
+        manager.sync_bidirectional("1.2.3.4", "project")
+
+        manager._execute_rsync_many.assert_not_called()
+        assert manager._execute_rsync.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "banner, version, supports_info",
+    [
+        ("rsync  version 3.2.7  protocol version 31\n", (3, 2), True),
+        ("rsync  version 3.1.0  protocol version 31\n", (3, 1), True),
+        ("rsync  version 2.6.9  protocol version 29\n", (2, 6), False),
+        (
+            "openrsync: protocol version 29\nrsync version 2.6.9 compatible\n",
+            (2, 6),
+            False,
+        ),
+        ("", (), False),
+    ],
+)
+def test_local_rsync_version(banner, version, supports_info):
+    """--info options are only used where the local rsync accepts them."""
+    completed = subprocess.CompletedProcess([], 0, stdout=banner, stderr="")
+    _local_rsync_version.cache_clear()
+    try:
+        with patch(
+            "ec2_dynamic_sync.core.rsync_manager.subprocess.run",
+            return_value=completed,
+        ):
+            assert _local_rsync_version() == version
+            assert _local_rsync_supports_info() is supports_info
+    finally:
+        _local_rsync_version.cache_clear()
+
+
+def test_commands_only_use_options_every_rsync_accepts(tmp_path):
+    """rsync before 3.1 (macOS ships 2.6.9) rejects --info=... options."""
+    manager = _make_manager(tmp_path)
+
+    assert "--stats" in manager.base_rsync_options
+    assert not any(
+        isinstance(option, str) and option.startswith("--info")
+        for option in manager.base_rsync_options
+    )
+
+
+@pytest.mark.parametrize(
+    "progress, supports_info, expected",
+    [
+        (True, True, "--info=progress2"),
+        (True, False, "--progress"),
+        (False, True, None),
+    ],
+)
+def test_progress_follows_configured_option(
+    tmp_path, monkeypatch, progress, supports_info, expected
+):
+    """The progress option picks the form the local rsync understands."""
+    monkeypatch.setattr(
+        rsync_manager, "_local_rsync_supports_info", lambda: supports_info
+    )
+    manager = _make_manager(tmp_path, progress=progress)
+
+    progress_options = {"--info=progress2", "--progress"}.intersection(
+        manager.base_rsync_options
+    )
+    assert progress_options == ({expected} if expected else set())
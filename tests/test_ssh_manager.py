@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for SSH connection management in EC2 Dynamic Sync.
+
+These cover the ControlMaster handling in SSHManager; the ssh client is
+never run, subprocess.run is replaced with a fake that answers by command.
+"""
+
+import os
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ec2_dynamic_sync.core.models import SSHConfig
+from ec2_dynamic_sync.core.ssh_manager import SSHManager
+
+
+def _fake_ssh(master_alive=False, master_opens=True, direct_ok=True):
+    """Build a subprocess.run stand-in that records the ssh commands run."""
+    calls = []
+
+    def run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        if "-O" in cmd:
+            returncode = 0 if master_alive else 255
+        elif "-N" in cmd:
+            returncode = 0 if master_opens else 255
+        else:
+            returncode = 0 if direct_ok else 255
+        return subprocess.CompletedProcess(cmd, returncode, stdout="", stderr="")
+
+    return run, calls
+
+
+@pytest.fixture
+def ssh_manager(ssh_key_file):
+    """SSHManager with connection multiplexing enabled."""
+    return SSHManager(SSHConfig(key_file=ssh_key_file))
+
+
+class TestControlMaster:
+    """Test opening and reusing ControlMaster connections."""
+
+    def test_connect_falls_back_when_master_fails(self, ssh_manager, caplog):
+        """A master that cannot be opened should not fail a working host."""
+        run, calls = _fake_ssh(master_opens=False, direct_ok=True)
+
+        with patch("ec2_dynamic_sync.core.ssh_manager.subprocess.run", run):
+            assert ssh_manager.connect("1.2.3.4") is True
+
+        assert any("-N" in cmd for cmd in calls)
+        assert any("SSH connection successful" in " ".join(cmd) for cmd in calls)
+        assert "1.2.3.4" not in ssh_manager._control_masters
+        assert "falling back to a direct connection" in caplog.text
+
+    def test_connect_fails_when_host_unreachable(self, ssh_manager):
+        """Connect reports failure when neither a master nor ssh works."""
+        run, _ = _fake_ssh(master_opens=False, direct_ok=False)
+
+        with patch("ec2_dynamic_sync.core.ssh_manager.subprocess.run", run):
+            assert ssh_manager.connect("1.2.3.4") is False
+
+    def test_start_reuses_running_master(self, ssh_manager):
+        """A master left by an earlier run is adopted, not spawned again."""
+        run, calls = _fake_ssh(master_alive=True)
+
+        with patch("ec2_dynamic_sync.core.ssh_manager.subprocess.run", run):
+            assert ssh_manager.start_control_master("1.2.3.4") is True
+
+        assert not any("-N" in cmd for cmd in calls)
+        assert "1.2.3.4" in ssh_manager._control_masters
+
+    def test_start_spawns_master_when_none_running(self, ssh_manager):
+        """Without a live master a new one is started in the background."""
+        run, calls = _fake_ssh(master_alive=False, master_opens=True)
+
+        with patch("ec2_dynamic_sync.core.ssh_manager.subprocess.run", run):
+            assert ssh_manager.start_control_master("1.2.3.4") is True
+
+        spawned = [cmd for cmd in calls if "-N" in cmd]
+        assert len(spawned) == 1
+        assert "ControlMaster=yes" in spawned[0]
+        assert "1.2.3.4" in ssh_manager._control_masters
+
+
+class TestRemoteDirectoryCommands:
+    """Test quoting of remote paths in directory helpers."""
+
+    @pytest.mark.parametrize(
+        "directory, quoted",
+        [
+            ("~/my project", "~/'my project'"),
+            ("/srv/$HOME `id`", "'/srv/$HOME `id`'"),
+        ],
+    )
+    def test_prepare_remote_quotes_directory(self, ssh_manager, directory, quoted):
+        """Spaces and shell syntax are quoted while ~ still expands."""
+        ssh_manager.execute_command = Mock(
+            return_value={"success": True, "stdout": b"RSYNC=1\nDIR=1\n"}
+        )
+
+        status = ssh_manager.prepare_remote("1.2.3.4", directory)
+
+        command = ssh_manager.execute_command.call_args[0][1]
+        assert command.startswith(f"mkdir -p {quoted}; ")
+        assert f"test -d {quoted} " in command
+        assert status == {"rsync": True, "dir_ok": True}
+
+    @pytest.mark.parametrize(
+        "stdout, expected",
+        [
+            (b"2 8\n", {"file_count": 2, "total_bytes": 8}),
+            (b"0 0\n", {"file_count": 0, "total_bytes": 0}),
+            (b"ERR\n", None),
+        ],
+    )
+    def test_tree_info_reports_failed_find(self, ssh_manager, stdout, expected):
+        """A find that fails remotely is not mistaken for an empty tree."""
+        ssh_manager.execute_command = Mock(
+            return_value={"success": True, "stdout": stdout}
+        )
+
+        assert ssh_manager.get_remote_tree_info("1.2.3.4", "~/project") == expected
+        command = ssh_manager.execute_command.call_args[0][1]
+        assert "|| echo ERR; }" in command
+
+    def test_tree_info_command_runs_in_shell(self, ssh_manager, tmp_path):
+        """The remote command counts a tree and flags a failing find."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a").write_bytes(b"abc")
+        (tmp_path / "sub" / "b").write_bytes(b"12345")
+
+        def run_locally(host, command, text=False):
+            result = subprocess.run(["sh", "-c", command], capture_output=True)
+            return {"success": result.returncode == 0, "stdout": result.stdout}
+
+        ssh_manager.execute_command = run_locally
+        if ssh_manager.get_remote_tree_info("1.2.3.4", str(tmp_path)) is None:
+            pytest.skip("local find has no -printf")
+
+        assert ssh_manager.get_remote_tree_info("1.2.3.4", str(tmp_path)) == {
+            "file_count": 2,
+            "total_bytes": 8,
+        }
+        assert ssh_manager.get_remote_tree_info("1.2.3.4", str(tmp_path / "x")) is None
+        (tmp_path / "sub").chmod(0)
+        try:
+            if os.access(tmp_path / "sub", os.R_OK):
+                pytest.skip("running as a user that ignores permissions")
+            assert ssh_manager.get_remote_tree_info("1.2.3.4", str(tmp_path)) is None
+        finally:
+            (tmp_path / "sub").chmod(0o755)
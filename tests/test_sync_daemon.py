@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Tests for the bidirectional sync daemon components in EC2 Dynamic Sync.
+
+The daemon's threads are never started; tests call the pieces they cover
+directly and replace the orchestrator's sync with a mock.
+"""
+
+import itertools
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from watchdog.events import (
+    DirCreatedEvent,
+    DirModifiedEvent,
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileOpenedEvent,
+)
+
+from ec2_dynamic_sync.core import sync_daemon
+from ec2_dynamic_sync.core.models import DirectoryMapping
+from ec2_dynamic_sync.core.sync_daemon import (
+    BidirectionalSyncDaemon,
+    ChangeDetector,
+    ChangeEvent,
+    SyncQueue,
+    _LocalChangeHandler,
+    _parse_inotify_line,
+    _remote_watch_command,
+)
+
+
+@pytest.fixture
+def daemon(tmp_path, base_sync_config):
+    """Daemon over one mapping rooted in this test's tmp_path."""
+    local_dir = tmp_path / "local"
+    local_dir.mkdir()
+    config = base_sync_config.model_copy(
+        update={
+            "directory_mappings": [
+                DirectoryMapping(
+                    name="test-mapping",
+                    local_path=str(local_dir),
+                    remote_path="~/remote",
+                    enabled=True,
+                )
+            ]
+        }
+    )
+    return BidirectionalSyncDaemon(config)
+
+
+class TestRemoteWatch:
+    """Test remote change notifications."""
+
+    def test_watch_command_expands_home(self):
+        """A ~/ remote path stays expandable and the rest is quoted."""
+        command = _remote_watch_command("~/my project")
+
+        assert command.startswith("cd ~/'my project' && exec inotifywait -mrq ")
+        assert "--format '%e %w%f' ." in command
+
+    @pytest.mark.parametrize(
+        "line, event_type, path",
+        [
+            ("CLOSE_WRITE,CLOSE ./src/app.py\n", "modified", "src/app.py"),
+            ("CREATE ./new.txt\n", "created", "new.txt"),
+            ("MOVED_TO ./renamed.txt\n", "created", "renamed.txt"),
+            ("DELETE ./old.txt\n", "deleted", "old.txt"),
+            ("MOVED_FROM ./gone name.txt\n", "deleted", "gone name.txt"),
+        ],
+    )
+    def test_parse_inotify_line(self, line, event_type, path):
+        """inotifywait flags map onto created, modified and deleted."""
+        change = _parse_inotify_line(line)
+
+        assert change.event_type == event_type
+        assert change.path == path
+
+    def test_parse_inotify_line_without_path(self):
+        """Lines without a path are ignored."""
+        assert _parse_inotify_line("CREATE\n") is None
+
+    def test_remote_changes_during_sync_are_kept(self, daemon):
+        """Remote edits seen while a sync runs are queued once it ends."""
+        edit = ChangeEvent(path="notes.txt", event_type="modified", timestamp=1.0)
+
+        def sync_all_directories(**kwargs):
+            assert daemon.sync_state.sync_in_progress
+            daemon._record_remote_change(edit)
+            # Held, not queued, while rsync may still be writing
+            assert daemon.sync_queue.is_empty()
+            return {"overall_success": True}
+
+        daemon.orchestrator.sync_all_directories = sync_all_directories
+        batch = [ChangeEvent(path="local.txt", event_type="created", timestamp=0.5)]
+
+        daemon._process_sync_batch(batch)
+
+        assert not daemon.sync_state.sync_in_progress
+        assert daemon.sync_state.remote_changes["notes.txt"] is edit
+        assert list(daemon.sync_queue.pending) == ["notes.txt"]
+
+    def test_remote_changes_between_syncs_are_queued(self, daemon):
+        """Without a running sync a remote change is queued immediately."""
+        edit = ChangeEvent(path="notes.txt", event_type="modified", timestamp=1.0)
+
+        daemon._record_remote_change(edit)
+
+        assert daemon.sync_queue.pending == {"notes.txt": edit}
+
+
+def _touch(path, content, mtime):
+    """Write a file and pin its mtime so changes never depend on timing."""
+    path.write_text(content)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def local_dir(daemon):
+    """The daemon mapping's local directory."""
+    return daemon.local_detectors["test-mapping"].base_path
+
+
+class TestLocalChangeHandler:
+    """Test how watchdog events mark paths for re-checking."""
+
+    @pytest.fixture
+    def handler(self, daemon):
+        daemon._mark_local_dirty = Mock()
+        return _LocalChangeHandler(daemon, "test-mapping")
+
+    @pytest.mark.parametrize("event_class", [FileCreatedEvent, FileModifiedEvent])
+    def test_file_event_marks_path(self, handler, event_class):
+        """A touched file is queued for a targeted re-check."""
+        handler.on_any_event(event_class("/data/a.txt"))
+
+        handler.daemon._mark_local_dirty.assert_called_once_with(
+            "test-mapping", "/data/a.txt"
+        )
+
+    def test_move_marks_both_paths(self, handler):
+        """A rename touches its source and its destination."""
+        handler.on_any_event(FileMovedEvent("/data/a.txt", "/data/b.txt"))
+
+        calls = handler.daemon._mark_local_dirty.call_args_list
+        assert [c.args for c in calls] == [
+            ("test-mapping", "/data/a.txt"),
+            ("test-mapping", "/data/b.txt"),
+        ]
+
+    def test_new_directory_requests_rescan(self, handler):
+        """A directory can bring files that produce no events of their own."""
+        handler.on_any_event(DirCreatedEvent("/data/sub"))
+
+        handler.daemon._mark_local_dirty.assert_called_once_with("test-mapping", None)
+
+    @pytest.mark.parametrize(
+        "event", [DirModifiedEvent("/data/sub"), FileOpenedEvent("/data/a.txt")]
+    )
+    def test_events_without_content_change_are_ignored(self, handler, event):
+        """Directory mtime updates and opens carry no change to sync."""
+        handler.on_any_event(event)
+
+        handler.daemon._mark_local_dirty.assert_not_called()
+
+
+class TestMarkLocalDirty:
+    """Test accumulation of touched paths between monitor passes."""
+
+    def test_paths_accumulate(self, daemon):
+        """Touched paths are collected per mapping and wake the monitor."""
+        daemon._mark_local_dirty("test-mapping", "/data/a.txt")
+        daemon._mark_local_dirty("test-mapping", "/data/b.txt")
+
+        assert daemon._dirty == {"test-mapping": {"/data/a.txt", "/data/b.txt"}}
+        assert daemon._local_event.is_set()
+
+    def test_rescan_wins_over_paths(self, daemon):
+        """Once a rescan is needed, later paths are already covered by it."""
+        daemon._mark_local_dirty("test-mapping", "/data/a.txt")
+        daemon._mark_local_dirty("test-mapping", None)
+        daemon._mark_local_dirty("test-mapping", "/data/b.txt")
+
+        assert daemon._dirty == {"test-mapping": None}
+
+
+class TestDetectChanges:
+    """Test full-scan change detection."""
+
+    def test_first_scan_reports_every_file_as_created(self, tmp_path):
+        """With no recorded state every file is new, at any depth."""
+        (tmp_path / "sub").mkdir()
+        _touch(tmp_path / "a.txt", "a", 1000)
+        _touch(tmp_path / "sub" / "b.txt", "bb", 1000)
+        detector = ChangeDetector(str(tmp_path))
+
+        changes = detector.detect_changes()
+
+        assert sorted((c.path, c.event_type, c.size) for c in changes) == [
+            ("a.txt", "created", 1),
+            (os.path.join("sub", "b.txt"), "created", 2),
+        ]
+        assert all(c.checksum for c in changes)
+
+    def test_created_modified_deleted(self, tmp_path):
+        """A rescan reports each kind of change once and records it."""
+        _touch(tmp_path / "kept.txt", "kept", 1000)
+        _touch(tmp_path / "edited.txt", "old", 1000)
+        _touch(tmp_path / "removed.txt", "gone", 1000)
+        detector = ChangeDetector(str(tmp_path))
+        detector.detect_changes()
+
+        _touch(tmp_path / "new.txt", "new", 2000)
+        _touch(tmp_path / "edited.txt", "newer", 2000)
+        (tmp_path / "removed.txt").unlink()
+
+        changes = detector.detect_changes()
+
+        assert {c.path: c.event_type for c in changes} == {
+            "new.txt": "created",
+            "edited.txt": "modified",
+            "removed.txt": "deleted",
+        }
+        assert detector.detect_changes() == []
+
+    def test_touch_without_size_change_is_modified(self, tmp_path):
+        """A new mtime alone counts as a modification."""
+        _touch(tmp_path / "a.txt", "same", 1000)
+        detector = ChangeDetector(str(tmp_path))
+        detector.detect_changes()
+
+        os.utime(tmp_path / "a.txt", (2000, 2000))
+
+        changes = detector.detect_changes()
+
+        assert [(c.path, c.event_type) for c in changes] == [("a.txt", "modified")]
+
+    def test_missing_directory_has_no_files(self, tmp_path):
+        """A mapping whose directory does not exist yet reports nothing."""
+        detector = ChangeDetector(str(tmp_path / "missing"))
+
+        assert detector.detect_changes() == []
+
+
+class TestDetectPathChanges:
+    """Test targeted change detection for reported paths."""
+
+    @pytest.fixture
+    def detector(self, tmp_path):
+        _touch(tmp_path / "kept.txt", "kept", 1000)
+        _touch(tmp_path / "edited.txt", "old", 1000)
+        _touch(tmp_path / "removed.txt", "gone", 1000)
+        detector = ChangeDetector(str(tmp_path))
+        detector.detect_changes()
+        return detector
+
+    def test_created_modified_deleted(self, tmp_path, detector):
+        """Each reported path is compared with its recorded state."""
+        _touch(tmp_path / "new.txt", "new", 2000)
+        _touch(tmp_path / "edited.txt", "newer", 2000)
+        (tmp_path / "removed.txt").unlink()
+
+        changes = detector.detect_path_changes(
+            {"new.txt", "edited.txt", "removed.txt", "kept.txt"}
+        )
+
+        assert {c.path: c.event_type for c in changes} == {
+            "new.txt": "created",
+            "edited.txt": "modified",
+            "removed.txt": "deleted",
+        }
+        assert set(detector.sizes) == {"kept.txt", "edited.txt", "new.txt"}
+        assert detector.sizes["edited.txt"] == len("newer")
+
+    def test_unreported_paths_keep_their_state(self, tmp_path, detector):
+        """Paths not reported are not checked, even if they changed."""
+        (tmp_path / "removed.txt").unlink()
+
+        assert detector.detect_path_changes({"kept.txt"}) == []
+        assert "removed.txt" in detector.sizes
+
+    def test_directory_path_is_not_a_file(self, tmp_path, detector):
+        """A reported directory is not recorded as a new file."""
+        (tmp_path / "sub").mkdir()
+
+        assert detector.detect_path_changes({"sub"}) == []
+
+
+class TestLocalMonitorLoop:
+    """Test one pass of the local monitor after the baseline scan."""
+
+    def _run_one_pass(self, daemon, monkeypatch, after_baseline):
+        """Run the loop until the first pass after the baseline is recorded.
+
+        The loop's clock jumps 10 seconds per reading, so every pass is
+        also due for the 5 second poll.
+        """
+        recorded = []
+
+        def record(mapping_name, changes):
+            recorded.append(sorted((c.path, c.event_type) for c in changes))
+            if len(recorded) == 1:
+                after_baseline()
+            else:
+                daemon.running = False
+
+        ticks = itertools.count(0, 10)
+        monkeypatch.setattr(
+            sync_daemon,
+            "time",
+            SimpleNamespace(
+                monotonic=lambda: next(ticks), time=time.time, sleep=time.sleep
+            ),
+        )
+        monkeypatch.setattr(daemon, "_record_local_changes", record)
+        daemon.running = True
+        daemon._local_monitor_loop()
+        return recorded
+
+    def test_unwatched_mapping_is_polled(self, daemon, local_dir, monkeypatch):
+        """Without an observer the mapping is fully rescanned on each poll."""
+        recorded = self._run_one_pass(
+            daemon, monkeypatch, lambda: _touch(local_dir / "a.txt", "a", 2000)
+        )
+
+        assert recorded == [[], [("a.txt", "created")]]
+
+    def test_watched_mapping_checks_marked_paths(self, daemon, local_dir, monkeypatch):
+        """With an observer only the paths it reported are re-checked."""
+        daemon.observers["test-mapping"] = Mock()
+
+        def after_baseline():
+            _touch(local_dir / "a.txt", "a", 2000)
+            _touch(local_dir / "unreported.txt", "b", 2000)
+            daemon._mark_local_dirty("test-mapping", str(local_dir / "a.txt"))
+
+        recorded = self._run_one_pass(daemon, monkeypatch, after_baseline)
+
+        assert recorded == [[], [("a.txt", "created")]]
+
+    def test_rescan_request_scans_whole_mapping(self, daemon, local_dir, monkeypatch):
+        """A rescan request covers files that produced no events."""
+        daemon.observers["test-mapping"] = Mock()
+
+        def after_baseline():
+            (local_dir / "sub").mkdir()
+            _touch(local_dir / "sub" / "a.txt", "a", 2000)
+            daemon._mark_local_dirty("test-mapping", None)
+
+        recorded = self._run_one_pass(daemon, monkeypatch, after_baseline)
+
+        assert recorded == [[], [(os.path.join("sub", "a.txt"), "created")]]
+
+
+class TestSyncQueue:
+    """Test coalescing and batching of queued changes."""
+
+    def test_changes_to_one_path_coalesce(self):
+        """A path saved many times is synced once, with its latest event."""
+        queue = SyncQueue(max_batch_size=10, max_wait_time=0.0)
+        first = ChangeEvent(path="a.txt", event_type="created", timestamp=1.0)
+        latest = ChangeEvent(path="a.txt", event_type="modified", timestamp=2.0)
+        other = ChangeEvent(path="b.txt", event_type="modified", timestamp=1.5)
+
+        queue.add_changes([first, other])
+        queue.add_changes([latest])
+
+        assert len(queue) == 2
+        assert queue.get_batch() == [latest, other]
+        assert queue.is_empty()
+
+    def test_older_event_does_not_replace_newer(self):
+        """A re-queued older event must not overwrite a newer one."""
+        queue = SyncQueue(max_batch_size=10, max_wait_time=0.0)
+        newer = ChangeEvent(path="a.txt", event_type="modified", timestamp=2.0)
+        older = ChangeEvent(path="a.txt", event_type="deleted", timestamp=1.0)
+
+        queue.add_changes([newer])
+        queue.add_changes([older])
+
+        assert queue.pending == {"a.txt": newer}
+
+    def test_full_batch_is_released_before_wait_time(self):
+        """A full batch is returned at once; the rest stays queued."""
+        queue = SyncQueue(max_batch_size=2, max_wait_time=3600.0)
+        changes = [
+            ChangeEvent(path=f"{i}.txt", event_type="created", timestamp=float(i))
+            for i in range(3)
+        ]
+
+        queue.add_changes(changes)
+
+        assert queue.get_batch() == changes[:2]
+        assert list(queue.pending) == ["2.txt"]
+
+    def test_partial_batch_waits(self):
+        """Fewer changes than a batch are held until the wait time is up."""
+        queue = SyncQueue(max_batch_size=10, max_wait_time=3600.0)
+        queue.add_changes(
+            [ChangeEvent(path="a.txt", event_type="created", timestamp=1.0)]
+        )
+
+        assert queue.get_batch() == []
+        assert len(queue) == 1
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Tests for the SyncOrchestrator in EC2 Dynamic Sync.
+
+AWS and SSH are replaced by mocks passed to the constructor, so these
+exercise the orchestration logic only.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ec2_dynamic_sync.core import sync_orchestrator
+from ec2_dynamic_sync.core.models import BulkMode, DirectoryMapping, SyncMode
+from ec2_dynamic_sync.core.sync_orchestrator import SyncOrchestrator
+
+
+@pytest.fixture(autouse=True)
+def empty_instance_id_cache(monkeypatch):
+    """Give every test its own process-wide instance ID cache."""
+    monkeypatch.setattr(sync_orchestrator, "_INSTANCE_ID_CACHE", {})
+
+
+@pytest.fixture
+def aws_manager():
+    """AWSManager stand-in."""
+    return Mock()
+
+
+@pytest.fixture
+def orchestrator(base_sync_config, aws_manager):
+    """Orchestrator wired to mocked AWS and SSH managers."""
+    return SyncOrchestrator(
+        base_sync_config, aws_manager=aws_manager, ssh_manager=Mock()
+    )
+
+
+class TestInstanceIdCache:
+    """Test reuse and eviction of resolved instance IDs."""
+
+    def test_instance_id_shared_between_orchestrators(
+        self, base_sync_config, orchestrator, aws_manager
+    ):
+        """A second orchestrator reuses the ID the first one resolved."""
+        aws_manager.get_instance_id.return_value = "i-123456"
+
+        assert orchestrator._cached_instance_id() == "i-123456"
+        other = SyncOrchestrator(
+            base_sync_config, aws_manager=aws_manager, ssh_manager=Mock()
+        )
+        assert other._cached_instance_id() == "i-123456"
+
+        aws_manager.get_instance_id.assert_called_once()
+
+    @pytest.mark.parametrize("dead_state", ["terminated", "shutting-down"])
+    def test_dead_instance_is_resolved_again(
+        self, orchestrator, aws_manager, dead_state
+    ):
+        """A cached ID of a terminated instance is replaced by a new lookup."""
+        aws_manager.get_instance_id.side_effect = ["i-old", "i-new"]
+        aws_manager.get_instance_info.side_effect = lambda instance_id: {
+            "instance_id": instance_id,
+            "state": dead_state if instance_id == "i-old" else "running",
+            "public_ip": "1.2.3.4",
+        }
+
+        instance_id = orchestrator._cached_instance_id()
+        instance_info = orchestrator._cached_instance_info(instance_id)
+
+        assert instance_info["instance_id"] == "i-new"
+        assert instance_info["state"] == "running"
+        assert orchestrator._cached_instance_id() == "i-new"
+        assert aws_manager.get_instance_id.call_count == 2
+
+    def test_missing_instance_is_forgotten(self, orchestrator, aws_manager):
+        """An ID whose instance cannot be described is not reused."""
+        aws_manager.get_instance_id.side_effect = ["i-old", "i-new"]
+        aws_manager.get_instance_info.return_value = None
+
+        assert (
+            orchestrator._cached_instance_info(orchestrator._cached_instance_id())
+            is None
+        )
+        assert orchestrator._cached_instance_id() == "i-new"
+
+
+class TestParallelSyncs:
+    """Test how many directory mappings are synced at once."""
+
+    def _sync_two_mappings(self, base_sync_config, tmp_path, **settings):
+        """Sync two mappings and return the most that ran concurrently."""
+        mappings = [
+            DirectoryMapping(
+                name=name, local_path=str(tmp_path / name), remote_path=f"~/{name}"
+            )
+            for name in ("first", "second")
+        ]
+        config = base_sync_config.model_copy(
+            update={"directory_mappings": mappings, **settings}
+        )
+        orchestrator = SyncOrchestrator(config, aws_manager=Mock(), ssh_manager=Mock())
+        orchestrator._ensure_host = Mock(return_value=True)
+
+        lock = threading.Lock()
+        running = []
+        peak = []
+        both_started = threading.Barrier(2, timeout=0.2)
+
+        def sync_mapping(mapping, mode, dry_run, progress_callback):
+            with lock:
+                running.append(mapping.name)
+                peak.append(len(running))
+            try:
+                both_started.wait()
+            except threading.BrokenBarrierError:
+                pass
+            with lock:
+                running.remove(mapping.name)
+            return {"success": True}
+
+        orchestrator._sync_mapping = sync_mapping
+        results = orchestrator.sync_all_directories()
+
+        assert results["overall_success"] is True
+        assert results["summary"]["successful_dirs"] == 2
+        return max(peak)
+
+    def test_mappings_sync_one_at_a_time_by_default(self, base_sync_config, tmp_path):
+        """Without opting in, mappings do not compete for the link."""
+        assert base_sync_config.max_parallel_syncs == 1
+        assert self._sync_two_mappings(base_sync_config, tmp_path) == 1
+
+    def test_mappings_sync_concurrently_when_enabled(self, base_sync_config, tmp_path):
+        """max_parallel_syncs lets independent mappings overlap."""
+        peak = self._sync_two_mappings(base_sync_config, tmp_path, max_parallel_syncs=2)
+
+        assert peak == 2
+
+
+class TestBulkUpload:
+    """Test when an initial upload is streamed through tar."""
+
+    @pytest.fixture
+    def tree(self, tmp_path, monkeypatch):
+        """Three files to upload, plus excluded ones, below tmp_path/src."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(sync_orchestrator, "BULK_UPLOAD_MIN_FILES", 3)
+        root = tmp_path / "src"
+        (root / "pkg").mkdir(parents=True)
+        (root / "node_modules" / "dep").mkdir(parents=True)
+        (root / "a.txt").write_text("aaaa")
+        (root / "pkg" / "b.py").write_text("bb")
+        (root / "pkg" / "c.py").write_text("c")
+        (root / "pkg" / "c.pyc").write_text("compiled")
+        (root / "node_modules" / "dep" / "index.js").write_text("js")
+        return root
+
+    def _orchestrator(self, base_sync_config, root, bulk_mode, **sync_options):
+        """Orchestrator with one mapping for root and mocked SSH."""
+        mapping = DirectoryMapping(
+            name="tree",
+            local_path=str(root),
+            remote_path="~/tree",
+            bulk_mode=bulk_mode,
+        )
+        config = base_sync_config.model_copy(
+            update={
+                "directory_mappings": [mapping],
+                "sync_options": base_sync_config.sync_options.model_copy(
+                    update=sync_options
+                ),
+            }
+        )
+        orchestrator = SyncOrchestrator(config, aws_manager=Mock(), ssh_manager=Mock())
+        orchestrator.current_host = "1.2.3.4"
+        orchestrator.ssh_manager.remote_directory_has_files.return_value = False
+        return orchestrator, mapping
+
+    def test_rsync_is_the_default(self, base_sync_config, tree):
+        """tar is only used when a mapping opts in."""
+        orchestrator, mapping = self._orchestrator(
+            base_sync_config, tree, DirectoryMapping.model_fields["bulk_mode"].default
+        )
+
+        assert mapping.bulk_mode is BulkMode.RSYNC
+        assert orchestrator._bulk_upload_entries(mapping) is None
+
+    def test_entries_skip_excluded_paths(self, base_sync_config, tree):
+        """Excluded files and whole excluded directories are left out."""
+        orchestrator, mapping = self._orchestrator(
+            base_sync_config, tree, BulkMode.AUTO
+        )
+
+        entries = orchestrator._bulk_upload_entries(mapping)
+
+        assert sorted(entries) == ["a.txt", "pkg", "pkg/b.py", "pkg/c.py"]
+
+    def test_auto_needs_a_large_tree(self, base_sync_config, tree):
+        """Below BULK_UPLOAD_MIN_FILES files auto mode stays with rsync."""
+        (tree / "a.txt").unlink()
+        orchestrator, mapping = self._orchestrator(
+            base_sync_config, tree, BulkMode.AUTO
+        )
+
+        assert orchestrator._bulk_upload_entries(mapping) is None
+
+    @pytest.mark.parametrize("has_files", [True, None])
+    def test_auto_needs_an_empty_remote(self, base_sync_config, tree, has_files):
+        """Files on the remote side, or an unknown state, mean rsync."""
+        orchestrator, mapping = self._orchestrator(
+            base_sync_config, tree, BulkMode.AUTO
+        )
+        orchestrator.ssh_manager.remote_directory_has_files.return_value = has_files
+
+        assert orchestrator._bulk_upload_entries(mapping) is None
+
+    def test_auto_leaves_throttled_syncs_to_rsync(self, base_sync_config, tree):
+        """tar cannot apply a bandwidth limit."""
+        orchestrator, mapping = self._orchestrator(
+            base_sync_config, tree, BulkMode.AUTO, bandwidth_limit="1000"
+        )
+
+        assert orchestrator._bulk_upload_entries(mapping) is None
+
+    def test_auto_leaves_progress_reporting_to_rsync(self, base_sync_config, tree):
+        """tar cannot report progress to a callback."""
+        orchestrator, mapping = self._orchestrator(
+            base_sync_config, tree, BulkMode.AUTO
+        )
+
+        assert orchestrator._bulk_upload_entries(mapping, Mock()) is None
+
+    @pytest.mark.parametrize(
+        "bulk_mode, falls_back", [(BulkMode.AUTO, True), (BulkMode.TAR, False)]
+    )
+    def test_failed_tar_upload(self, base_sync_config, tree, bulk_mode, falls_back):
+        """A failed auto upload is retried with rsync; forced tar reports it."""
+        orchestrator, mapping = self._orchestrator(base_sync_config, tree, bulk_mode)
+        failed = {"success": False, "error": "tar: broken pipe"}
+        orchestrator._bulk_upload_tar = Mock(return_value=failed)
+        orchestrator.rsync_manager = Mock(exclude_managers={})
+        orchestrator.rsync_manager.sync_local_to_remote.return_value = {"success": True}
+
+        result = orchestrator._sync_mapping(
+            mapping, SyncMode.LOCAL_TO_REMOTE, False, None
+        )
+
+        orchestrator._bulk_upload_tar.assert_called_once()
+        assert result["success"] is falls_back
+        assert orchestrator.rsync_manager.sync_local_to_remote.called is falls_back
+
+    def test_tar_upload_reports_transfer_stats(self, base_sync_config, tree):
+        """A finished upload reports the files and bytes the CLI shows."""
+        orchestrator, mapping = self._orchestrator(base_sync_config, tree, BulkMode.TAR)
+        process = Mock(returncode=0)
+        process.communicate.return_value = (b"", b"")
+
+        with patch.object(sync_orchestrator.subprocess, "Popen", return_value=process):
+            result = orchestrator._bulk_upload_tar(
+                "1.2.3.4", mapping, orchestrator._bulk_upload_entries(mapping)
+            )
+
+        assert result["success"] is True
+        assert result["stats"]["files_transferred"] == 3
+        assert result["stats"]["total_size"] == len("aaaa") + len("bb") + len("c")